@@ -0,0 +1,220 @@
+import operator
+
+class BuiltinPredicates:
+    """
+    Built-in predicates evaluated natively inside rule bodies.
+
+    A body atom whose (predicate, arity) is registered here is never looked up
+    in the KnowledgeBase. It is computed from the values bound so far, either
+    as a *filter* (every argument bound: keep or drop the binding) or as a
+    *generator* (some arguments free: compute them). This replaces helper
+    fact tables such as all pairs `neq(a, b)`, which grow quadratically.
+
+    Registered predicates
+    ---------------------
+    eq(X, Y)            X == Y           (either side may be free)
+    neq(X, Y)           X != Y
+    lt(X, Y), le(X, Y)  X < Y, X <= Y
+    gt(X, Y), ge(X, Y)  X > Y, X >= Y
+    plus(X, Y, Z)       Z = X + Y        (any two bound)
+    minus(X, Y, Z)      Z = X - Y        (any two bound)
+    times(X, Y, Z)      Z = X * Y        (X and Y bound)
+
+    Modes
+    -----
+    Each predicate lists its *modes*: sets of argument positions that must be
+    bound before it can run. The engines place a built-in atom right after the
+    first body atom that completes one of its modes, so filters prune as
+    early as possible. A built-in that never becomes ready is an error
+    (ValueError), e.g. lt(?x, ?y) with ?y bound nowhere.
+
+    Comparing values of incompatible types (e.g. lt('a', 1)) simply fails.
+
+    Reserved names
+    --------------
+    The registry is shared by all engines, so a registered (predicate, arity)
+    is reserved: facts or rule heads with that signature would never be
+    read. The engines call `check_kb` before evaluating a knowledge base and
+    raise ValueError on such a collision instead of silently ignoring the
+    user's predicate; rename it, or `unregister` the built-in.
+
+    Example
+    -------
+    sibling(?a, ?b) :- parent(?p, ?a), parent(?p, ?b), neq(?a, ?b)
+    older(?a, ?b)   :- age(?a, ?x), age(?b, ?y), gt(?x, ?y)
+    next(?x, ?y)    :- node(?x), plus(?x, 1, ?y), node(?y)
+    """
+
+    MODES = {}
+    SOLVERS = {}
+
+    @staticmethod
+    def register(predicate, arity, modes, solver):
+        """
+        Register (or replace) a built-in predicate.
+
+        Parameters
+        ----------
+        predicate : str
+        arity : int
+        modes : iterable of iterables of int
+            Alternative sets of positions that must be bound, e.g. ((0, 1),).
+        solver : callable
+            solver(args) -> iterable of complete argument tuples, where `args`
+            holds None at the free positions. It is only called in a mode
+            listed in `modes`.
+
+        Examples
+        --------
+        >>> BuiltinPredicates.register('even', 1, [(0,)],
+        ...     lambda args: [args] if args[0] % 2 == 0 else [])
+        """
+        BuiltinPredicates.MODES[(predicate, arity)] = tuple(frozenset(mode) for mode in modes)
+        BuiltinPredicates.SOLVERS[(predicate, arity)] = solver
+
+    @staticmethod
+    def unregister(predicate, arity):
+        """Remove a built-in so that (predicate, arity) is an ordinary predicate again."""
+        BuiltinPredicates.MODES.pop((predicate, arity), None)
+        BuiltinPredicates.SOLVERS.pop((predicate, arity), None)
+
+    @staticmethod
+    def check_kb(kb):
+        """
+        Raise ValueError if `kb` stores facts or rules for a built-in predicate.
+
+        Parameters
+        ----------
+        kb : KnowledgeBase
+            Any object with `rules` and `count(predicate, arity)`.
+        """
+        for rule in kb.rules:
+            BuiltinPredicates.check_signature(rule.head.predicate, len(rule.head.args), 'a rule head')
+        for predicate, arity in BuiltinPredicates.MODES:
+            if kb.count(predicate, arity):
+                BuiltinPredicates.check_signature(predicate, arity, 'facts')
+
+    @staticmethod
+    def check_signature(predicate, arity, what='a fact'):
+        """Raise ValueError if `what` with this (predicate, arity) would shadow a built-in."""
+        if (predicate, arity) in BuiltinPredicates.MODES:
+            raise ValueError(f"{predicate}/{arity} is a built-in predicate and cannot be defined "
+                             f"by {what}; rename it or call BuiltinPredicates.unregister"
+                             f"({predicate!r}, {arity})")
+
+    @staticmethod
+    def is_builtin(atom):
+        """True if `atom` is a built-in call (by predicate and arity)."""
+        return (atom.predicate, len(atom.args)) in BuiltinPredicates.MODES
+
+    @staticmethod
+    def ready(atom, bound_vars, is_var):
+        """
+        True if `atom` can be evaluated once the variables `bound_vars` are bound.
+
+        Constants count as bound; `is_var` is the engine's variable test.
+        """
+        bound = {position for position, arg in enumerate(atom.args)
+                 if not is_var(arg) or arg in bound_vars}
+        return any(mode <= bound for mode in BuiltinPredicates.MODES[(atom.predicate, len(atom.args))])
+
+    @staticmethod
+    def solve(predicate, args):
+        """
+        Evaluate a built-in call.
+
+        Parameters
+        ----------
+        predicate : str
+        args : tuple
+            Bound values, None at the free positions.
+
+        Returns
+        -------
+        list of tuples
+            The complete argument tuples that hold ([] = the call fails).
+
+        Examples
+        --------
+        >>> BuiltinPredicates.solve('plus', (2, None, 5))
+        [(2, 3, 5)]
+        >>> BuiltinPredicates.solve('neq', ('a', 'a'))
+        []
+        """
+        try:
+            return list(BuiltinPredicates.SOLVERS[(predicate, len(args))](args))
+        except (TypeError, ArithmeticError):
+            return []
+
+    @staticmethod
+    def comparison(op):
+        """Solver for a two-argument comparison filter."""
+        return lambda args: [args] if op(args[0], args[1]) else []
+
+    @staticmethod
+    def equality(args):
+        """Solver for eq/2: a filter, or copies the bound side to the free one."""
+        x, y = args
+        if x is None:
+            return [(y, y)]
+        if y is None:
+            return [(x, x)]
+        return [args] if x == y else []
+
+    @staticmethod
+    def arithmetic(forward, solve_x=None, solve_y=None):
+        """
+        Solver for Z = forward(X, Y); `solve_x(Y, Z)` / `solve_y(X, Z)` invert
+        it when X or Y is the free argument.
+        """
+        def solver(args):
+            x, y, z = args
+            if x is None:
+                x = solve_x(y, z)
+            elif y is None:
+                y = solve_y(x, z)
+            elif z is None:
+                return [(x, y, forward(x, y))]
+            else:
+                return [args] if forward(x, y) == z else []
+            return [(x, y, z)]
+        return solver
+
+for _name, _op in (('neq', operator.ne), ('lt', operator.lt), ('le', operator.le),
+                   ('gt', operator.gt), ('ge', operator.ge)):
+    BuiltinPredicates.register(_name, 2, [(0, 1)], BuiltinPredicates.comparison(_op))
+BuiltinPredicates.register('eq', 2, [(0,), (1,)], BuiltinPredicates.equality)
+BuiltinPredicates.register('plus', 3, [(0, 1), (0, 2), (1, 2)], BuiltinPredicates.arithmetic(
+    operator.add, lambda y, z: z - y, lambda x, z: z - x))
+BuiltinPredicates.register('minus', 3, [(0, 1), (0, 2), (1, 2)], BuiltinPredicates.arithmetic(
+    operator.sub, lambda y, z: z + y, lambda x, z: x - z))
+BuiltinPredicates.register('times', 3, [(0, 1)], BuiltinPredicates.arithmetic(operator.mul))
+del _name, _op
+
+class StudentID:
+    """
+    Utility class for identifying the student.
+
+    Each student must replace the placeholder return value
+    in the `get_ID` method with their own unique student ID.
+    """
+
+    @staticmethod
+    def get_ID():
+        """
+        Return the student ID as a string.
+
+        Returns
+        -------
+        str
+            The student ID. Each student must replace "student_ID" with their own ID.
+
+        Examples
+        --------
+        >>> StudentID.get_ID()
+        '123456'
+        """
+        # TODO - BLOCK START
+        # TASK#1
+        return "student_ID"
+        # TODO - BLOCK END
@@ -1,4 +1,7 @@
+import time
+
 from knowledge_base import Atom, Rule, KnowledgeBase
+from builtin_predicates import BuiltinPredicates
 
 class InferenceEngine:
     """
@@ -17,8 +20,38 @@ class InferenceEngine:
     2. Each successful match yields a substitution (mapping variables → constants).
     3. Apply the substitution to the rule head to form a *new* ground fact.
     4. Insert all new facts; repeat until no new facts are produced (saturation).
+
+    Join planning
+    -------------
+    The semi-naive path does not join body atoms strictly left to right:
+    `plan_body` orders them by estimated cost (predicate cardinalities and
+    bound-variable analysis). Plans are cached per rule body and recomputed
+    when the fact statistics drift by more than `REPLAN_FACTOR`.
+
+    Built-in predicates
+    -------------------
+    Body atoms such as neq(?a, ?b), lt(?x, ?y) or plus(?x, 1, ?y) (see
+    `BuiltinPredicates`) are computed instead of looked up. Every join order
+    places them right after the atom that binds enough of their arguments.
     """
 
+    REPLAN_FACTOR = 2
+
+    def __init__(self):
+        """
+        Initialize an engine with an empty join-plan cache.
+
+        Attributes
+        ----------
+        _plans : dict
+            (tuple(body_atoms), pivot) -> (order, statistics snapshot).
+        _compiled : dict
+            (tuple(body_atoms), pivot, order) -> (slot table, join steps),
+            see `compile_body`.
+        """
+        self._plans = {}
+        self._compiled = {}
+
     @staticmethod
     def is_var(x):
         """
@@ -117,6 +150,48 @@ class InferenceEngine:
         pass
         # TODO - BLOCK END
 
+    def candidate_facts(self, facts, pattern_atom, subst):
+        """
+        Return the facts worth trying to unify with `pattern_atom` under `subst`.
+
+        Parameters
+        ----------
+        facts : iterable[Atom] or KnowledgeBase
+            Either a plain collection of ground facts or a KnowledgeBase
+            (anything with a `lookup` method, e.g. a MappedKnowledgeBase).
+        pattern_atom : Atom
+            The (possibly variable-containing) body atom to match.
+        subst : dict
+            Current variable→constant bindings.
+
+        Returns
+        -------
+        iterable[Atom]
+            - For a built-in atom (e.g. neq): its solutions under `subst`, as
+              ground Atoms, whatever `facts` is.
+            - For a KnowledgeBase: `kb.lookup(...)` with every constant and
+              every already-bound variable of `pattern_atom` as a bound
+              argument, i.e. only facts that can actually unify.
+            - For a plain collection: `facts` itself (nothing to narrow with).
+
+        Examples
+        --------
+        >>> eng.candidate_facts(kb, Atom('parent', ('?x', '?y')), {'?x': 'anna'})
+        {parent('anna', 'ewa')}
+        """
+        builtin = BuiltinPredicates.is_builtin(pattern_atom)
+        if not builtin and not hasattr(facts, 'lookup'):
+            return facts
+        args = []
+        for arg in pattern_atom.args:
+            if self.is_var(arg):
+                arg = subst.get(arg)
+            args.append(arg)
+        if builtin:
+            return [Atom(pattern_atom.predicate, solution)
+                    for solution in BuiltinPredicates.solve(pattern_atom.predicate, tuple(args))]
+        return facts.lookup(pattern_atom.predicate, *args)
+
     def match_body(self, facts, body_atoms):
         """
         Enumerate all substitutions that satisfy the conjunction `body_atoms`
@@ -124,8 +199,9 @@ class InferenceEngine:
 
         Parameters
         ----------
-        facts : iterable[Atom]
-            Ground facts available in the KB.
+        facts : iterable[Atom] or KnowledgeBase
+            Ground facts available in the KB, or the KB itself (then its
+            indexes are used, see `candidate_facts`).
         body_atoms : list[Atom]
             Premises (each may contain variables). Interpreted as a conjunction.
 
@@ -139,8 +215,12 @@ class InferenceEngine:
         ------------
         - Start with a single empty substitution [{}].
         - For each body atom, try to extend each partial substitution by unifying
-          with *every* fact. Collect all successful extensions.
+          with every fact from `candidate_facts(facts, atom, subst)`. Collect
+          all successful extensions.
         - If any step produces no extensions, the whole conjunction fails.
+        - `body_atoms` has already been passed through `order_builtins`, so a
+          built-in atom (neq, lt, plus, ...) is reached only when its
+          arguments are bound; `candidate_facts` computes its solutions.
 
         # Example 1: chaining through a shared variable (?y)
         >>> facts = {
@@ -157,12 +237,598 @@ class InferenceEngine:
         [{'?x': 'anna', '?y': 'bob', '?z': 'carol'},
          {'?x': 'anna', '?y': 'bob', '?z': 'dave'}]
         """
+        body_atoms = self.order_builtins(body_atoms)
         # TODO - BLOCK START
         # TASK#18
         pass
         # TODO - BLOCK END
 
-    def forward_chain(self, kb, max_iterations=10000):
+    def order_builtins(self, body_atoms, bound_vars=()):
+        """
+        Keep the ordinary atoms of `body_atoms` in written order and move every
+        built-in atom to the earliest position where it can be evaluated.
+
+        Parameters
+        ----------
+        body_atoms : list[Atom]
+        bound_vars : iterable
+            Variables bound before the body is entered (e.g. by a query).
+
+        Returns
+        -------
+        list[Atom]
+
+        Raises
+        ------
+        ValueError
+            If a built-in atom never gets enough bound arguments.
+
+        Examples
+        --------
+        [neq(?a, ?b), parent(?p, ?a), parent(?p, ?b)]
+        → [parent(?p, ?a), parent(?p, ?b), neq(?a, ?b)]
+        """
+        bound_vars = set(bound_vars)
+        waiting = [i for i, atom in enumerate(body_atoms) if BuiltinPredicates.is_builtin(atom)]
+        order = []
+        self._place_builtins(body_atoms, waiting, bound_vars, order)
+        for i, atom in enumerate(body_atoms):
+            if i not in waiting and i not in order:
+                order.append(i)
+                bound_vars.update(arg for arg in atom.args if self.is_var(arg))
+                self._place_builtins(body_atoms, waiting, bound_vars, order)
+        self._check_placed(body_atoms, waiting)
+        return [body_atoms[i] for i in order]
+
+    def _place_builtins(self, body_atoms, waiting, bound_vars, order):
+        """
+        Append to `order` every built-in index of `waiting` that is ready under
+        `bound_vars` (removing it from `waiting` and adding the variables it
+        binds), until none is left ready.
+        """
+        placed = True
+        while placed:
+            placed = False
+            for i in list(waiting):
+                atom = body_atoms[i]
+                if BuiltinPredicates.ready(atom, bound_vars, self.is_var):
+                    waiting.remove(i)
+                    order.append(i)
+                    bound_vars.update(arg for arg in atom.args if self.is_var(arg))
+                    placed = True
+
+    @staticmethod
+    def _check_placed(body_atoms, waiting):
+        """Raise ValueError for built-in atoms that could not be placed."""
+        if waiting:
+            atom = body_atoms[waiting[0]]
+            raise ValueError(f"built-in {atom.predicate}{atom.args} is never sufficiently bound")
+
+    def estimate_cost(self, kb, atom, bound_vars):
+        """
+        Estimate how many facts match `atom` once `bound_vars` are bound.
+
+        Parameters
+        ----------
+        kb : KnowledgeBase
+            Source of the statistics (`count`, `distinct`).
+        atom : Atom
+            Body atom (may contain variables).
+        bound_vars : set
+            Variables already bound by earlier atoms of the plan.
+
+        Returns
+        -------
+        float
+            count(predicate) divided by the number of distinct values at every
+            bound position (constants and bound variables). Independent
+            positions are assumed, as usual for this kind of estimate.
+
+        Examples
+        --------
+        With 1000 parent facts over 500 distinct parents:
+            parent(?x, ?y) with nothing bound   → 1000
+            parent(?x, ?y) with ?x bound        → 1000 / 500 = 2
+        """
+        arity = len(atom.args)
+        cost = float(kb.count(atom.predicate, arity))
+        for position, arg in enumerate(atom.args):
+            if self.is_var(arg) and arg not in bound_vars:
+                continue
+            cost /= max(kb.distinct(atom.predicate, arity, position), 1)
+        return cost
+
+    def plan_body(self, kb, body_atoms, pivot=None):
+        """
+        Return the join order (list of body indices) for `body_atoms`.
+
+        Parameters
+        ----------
+        kb : KnowledgeBase
+            Source of the statistics.
+        body_atoms : list[Atom]
+            Premises of one rule.
+        pivot : int or None
+            If given, this atom is joined first (semi-naive delta atom) and the
+            rest is planned with its variables already bound.
+
+        Returns
+        -------
+        list[int]
+            A permutation of range(len(body_atoms)).
+
+        How it works
+        ------------
+        - Greedy: repeatedly pick the cheapest remaining atom according to
+          `estimate_cost` given the variables bound so far (ties keep the
+          written order). Selective atoms and atoms connected to already
+          bound variables come first, which keeps intermediate results small.
+        - Built-in atoms are not costed: each one is placed as soon as its
+          arguments are bound (see `order_builtins`).
+        - The plan is cached per (body, pivot) together with the predicate
+          cardinalities it was built from. It is rebuilt once any of them
+          grows or shrinks by more than `REPLAN_FACTOR`.
+
+        Examples
+        --------
+        grandparent(?x, ?z) :- person(?x), parent(?x, ?y), parent(?y, ?z), famous(?z)
+        with few `famous` facts: famous(?z) is joined first, then
+        parent(?y, ?z) (bound ?z), parent(?x, ?y) (bound ?y), person(?x).
+        """
+        key = (tuple(body_atoms), pivot)
+        cached = self._plans.get(key)
+        if cached is not None:
+            order, snapshot = cached
+            if all(self._within_factor(kb.count(*signature), count)
+                   for signature, count in snapshot.items()):
+                return order
+
+        waiting = [i for i, atom in enumerate(body_atoms) if BuiltinPredicates.is_builtin(atom)]
+        remaining = [i for i in range(len(body_atoms)) if i not in waiting]
+        order = []
+        bound_vars = set()
+        if pivot is not None:
+            remaining.remove(pivot)
+            order.append(pivot)
+            bound_vars.update(arg for arg in body_atoms[pivot].args if self.is_var(arg))
+        self._place_builtins(body_atoms, waiting, bound_vars, order)
+        while remaining:
+            best = min(remaining,
+                       key=lambda i: self.estimate_cost(kb, body_atoms[i], bound_vars))
+            remaining.remove(best)
+            order.append(best)
+            bound_vars.update(arg for arg in body_atoms[best].args if self.is_var(arg))
+            self._place_builtins(body_atoms, waiting, bound_vars, order)
+        self._check_placed(body_atoms, waiting)
+
+        snapshot = {}
+        for atom in body_atoms:
+            signature = (atom.predicate, len(atom.args))
+            snapshot[signature] = kb.count(*signature)
+        self._plans[key] = (order, snapshot)
+        return order
+
+    def _within_factor(self, current, planned):
+        """True if `current` is within `REPLAN_FACTOR` of `planned` (0 counts as 1)."""
+        current, planned = max(current, 1), max(planned, 1)
+        return planned <= current * self.REPLAN_FACTOR and current <= planned * self.REPLAN_FACTOR
+
+    def match_body_delta(self, kb, body_atoms, delta, pivot):
+        """
+        Semi-naive variant of `match_body`: enumerate only the substitutions
+        that use at least one fact from `delta` (the facts derived in the
+        previous round).
+
+        Parameters
+        ----------
+        kb : KnowledgeBase
+            The knowledge base; its facts include `delta`.
+        body_atoms : list[Atom]
+            Premises (each may contain variables). Interpreted as a conjunction.
+        delta : set[Atom]
+            Facts that are new since the previous round.
+        pivot : int
+            Index of the body atom that must be matched against `delta`.
+
+        Returns
+        -------
+        list[dict]
+            Substitutions in which
+              - body atom `pivot` is matched against `delta`,
+              - body atoms *before* `pivot` are matched against old facts only
+                (KB facts minus `delta`),
+              - body atoms *after* `pivot` are matched against all KB facts.
+
+        Why the old/all split?
+        ----------------------
+        Calling this for every `pivot` in 0..len(body)-1 covers each new
+        combination of premises exactly once: the first delta fact in the
+        combination decides the pivot. Old-only combinations were already
+        explored in earlier rounds and are skipped entirely.
+
+        Notes
+        -----
+        - The pivot atom is joined first, so the (usually small) delta drives
+          the join instead of the whole fact set. The remaining atoms follow
+          the cost-based order from `plan_body`.
+        - The other atoms are looked up through the KB indexes, so only facts
+          sharing the bound arguments are tried.
+        - This is the materialized form of `iter_matches(kb, body_atoms,
+          pivot, delta)`; the engine itself consumes the stream.
+        """
+        return list(self.iter_matches(kb, body_atoms, pivot, self.group_facts(delta)))
+
+    @staticmethod
+    def group_facts(facts):
+        """
+        Group ground facts by signature: {(predicate, arity): set of Atom}.
+
+        This is the `delta` format expected by `iter_bindings`: the pivot atom
+        reads its own group, and "old only" atoms test membership in theirs.
+        """
+        groups = {}
+        for fact in facts:
+            groups.setdefault((fact.predicate, len(fact.args)), set()).add(fact)
+        return groups
+
+    def compile_body(self, kb, body_atoms, pivot=None):
+        """
+        Compile a rule body into a slot table and a list of join steps.
+
+        Parameters
+        ----------
+        kb : KnowledgeBase
+            Used by `plan_body` to pick the join order.
+        body_atoms : list[Atom]
+            Premises of one rule.
+        pivot : int or None
+            Semi-naive delta atom (joined first), or None.
+
+        Returns
+        -------
+        (dict, list)
+            - slots : {variable: slot index}. A binding is a tuple indexed by
+              these slots instead of a dict keyed by variable names.
+            - steps : one tuple per body atom, in join order:
+                (body_index, predicate, pattern, binds, checks, builtin)
+              pattern : tuple, per argument either ('c', constant),
+                        ('s', slot) for a variable bound by an earlier step,
+                        or None for a variable this step binds.
+              binds   : ((position, slot), ...) first occurrences to bind.
+              checks  : ((position, earlier_position), ...) repeated new
+                        variables inside the same atom, e.g. p(?x, ?x).
+              builtin : True for a built-in atom (computed, not looked up).
+
+        Compiled bodies are cached per (body, pivot, join order).
+        """
+        order = self.plan_body(kb, body_atoms, pivot)
+        key = (tuple(body_atoms), pivot, tuple(order))
+        compiled = self._compiled.get(key)
+        if compiled is not None:
+            return compiled
+
+        slots = {}
+        steps = []
+        for i in order:
+            atom = body_atoms[i]
+            pattern, binds, checks = [], [], []
+            first_position = {}
+            for position, arg in enumerate(atom.args):
+                if not self.is_var(arg):
+                    pattern.append(('c', arg))
+                elif arg in slots:
+                    pattern.append(('s', slots[arg]))
+                elif arg in first_position:
+                    pattern.append(None)
+                    checks.append((position, first_position[arg]))
+                else:
+                    pattern.append(None)
+                    first_position[arg] = position
+                    binds.append((position, len(slots) + len(binds)))
+            for position, slot in binds:
+                slots[atom.args[position]] = slot
+            steps.append((i, atom.predicate, tuple(pattern), tuple(binds), tuple(checks),
+                          BuiltinPredicates.is_builtin(atom)))
+
+        compiled = (slots, steps)
+        self._compiled[key] = compiled
+        return compiled
+
+    def iter_bindings(self, kb, body_atoms, pivot=None, delta=None, pivot_facts=None, counter=None):
+        """
+        Lazily enumerate the bindings that satisfy `body_atoms` (streaming join).
+
+        Parameters
+        ----------
+        kb : KnowledgeBase
+            Facts are fetched through `kb.lookup` (indexes).
+        body_atoms : list[Atom]
+            Premises (each may contain variables). Interpreted as a conjunction.
+        pivot : int or None
+            Semi-naive mode (see `match_body_delta`): atom `pivot` reads only
+            `delta`, earlier atoms skip `delta` facts. None = plain join.
+        delta : dict or None
+            New facts grouped by signature, as returned by `group_facts`.
+        pivot_facts : iterable[Atom] or None
+            What the pivot atom scans; defaults to its whole `delta` group.
+            Passing a slice of that group splits one large semi-naive join
+            into independent parts (see `ParallelInferenceEngine`).
+        counter : list or None
+            Profiling only: a two-element list [scanned, partial] that is
+            increased by the number of candidate facts scanned and by the
+            number of partial bindings passed on to a later join step.
+            None (default) leaves the join loop uninstrumented.
+
+        Yields
+        ------
+        tuple
+            One binding per solution, indexed by the slot table of
+            `compile_body(kb, body_atoms, pivot)`.
+
+        How it works
+        ------------
+        Depth-first, one candidate iterator per join step. A single mutable
+        binding list is overwritten in place while descending (a slot is
+        only read by steps after the one that binds it, so no undo is
+        needed). Memory is therefore bounded by the body length, not by the
+        number of solutions.
+
+        Notes
+        -----
+        - Do not add facts to `kb` while the generator is running; the index
+          buckets are iterated without copying. Buffer them instead, as
+          `forward_chain_semi_naive` does.
+        - An empty body yields a single empty binding.
+        """
+        slots, steps = self.compile_body(kb, body_atoms, pivot)
+        if not steps:
+            yield ()
+            return
+        delta = delta or {}
+        candidates = self._step_candidates if counter is None else self._counted_candidates(counter)
+        binding = [None] * len(slots)
+        last = len(steps) - 1
+        iterators = [None] * len(steps)
+        iterators[0] = candidates(kb, steps[0], binding, pivot, delta, pivot_facts)
+        depth = 0
+        while depth >= 0:
+            index, predicate, pattern, binds, checks, _ = steps[depth]
+            for fact in iterators[depth]:
+                args = fact.args
+                if checks and any(args[p] != args[q] for p, q in checks):
+                    continue
+                if pivot is not None and index < pivot \
+                        and fact in delta.get((predicate, len(args)), ()):
+                    continue
+                for position, slot in binds:
+                    binding[slot] = args[position]
+                break
+            else:
+                depth -= 1
+                continue
+            if depth == last:
+                yield tuple(binding)
+            else:
+                depth += 1
+                iterators[depth] = candidates(kb, steps[depth], binding, pivot, delta)
+
+    def _step_candidates(self, kb, step, binding, pivot, delta, pivot_facts=None):
+        """
+        Candidate facts for one join step under the current `binding`.
+
+        The pivot step reads its `delta` group, or `pivot_facts` if given
+        (filtered by its constants); a built-in step yields its solutions;
+        every other step is an index lookup with constants and bound slots as
+        bound arguments.
+        """
+        index, predicate, pattern, _, _, builtin = step
+        args = [None if p is None else (p[1] if p[0] == 'c' else binding[p[1]])
+                for p in pattern]
+        if builtin:
+            return map(_Solution, BuiltinPredicates.solve(predicate, tuple(args)))
+        if index != pivot:
+            return iter(kb.lookup(predicate, *args))
+        facts = delta.get((predicate, len(args)), ()) if pivot_facts is None else pivot_facts
+        bound = [(position, value) for position, value in enumerate(args) if value is not None]
+        if not bound:
+            return iter(facts)
+        return (fact for fact in facts
+                if all(fact.args[position] == value for position, value in bound))
+
+    def _counted_candidates(self, counter):
+        """
+        `_step_candidates` wrapped for profiling (see `iter_bindings`): every
+        call after the first one of a join extends a partial binding, every
+        fact it yields is a scanned candidate.
+        """
+        first = [True]
+
+        def candidates(kb, step, binding, pivot, delta, pivot_facts=None):
+            if first[0]:
+                first[0] = False
+            else:
+                counter[1] += 1
+            for fact in self._step_candidates(kb, step, binding, pivot, delta, pivot_facts):
+                counter[0] += 1
+                yield fact
+        return candidates
+
+    def iter_matches(self, kb, body_atoms, pivot=None, delta=None):
+        """
+        Streaming counterpart of `match_body`: yield substitution dicts lazily.
+
+        Same parameters as `iter_bindings`; each slot tuple is turned into a
+        {variable: constant} dict only when it is yielded.
+
+        Examples
+        --------
+        >>> next(eng.iter_matches(kb, [Atom('parent', ('?x', 'ewa'))]))
+        {'?x': 'anna'}
+        """
+        slots, _ = self.compile_body(kb, body_atoms, pivot)
+        names = sorted(slots, key=slots.get)
+        for binding in self.iter_bindings(kb, body_atoms, pivot, delta):
+            yield dict(zip(names, binding))
+
+    def compile_head(self, head, slots):
+        """
+        Turn a rule head into a template for `instantiate`.
+
+        Returns (predicate, template) where template holds, per argument,
+        ('s', slot) for a body variable and ('c', value) for anything else
+        (constants and - for non range-restricted rules - unbound variables,
+        which stay as-is like in `substitute`).
+        """
+        template = tuple(('s', slots[arg]) if self.is_var(arg) and arg in slots else ('c', arg)
+                         for arg in head.args)
+        return head.predicate, template
+
+    @staticmethod
+    def instantiate(compiled_head, binding):
+        """
+        Build the ground head Atom for one binding tuple (see `compile_head`).
+        """
+        predicate, template = compiled_head
+        return Atom(predicate, tuple(binding[value] if kind == 's' else value
+                                     for kind, value in template))
+
+    def forward_chain_semi_naive(self, kb, max_iterations=10000, delta=None, profiler=None):
+        """
+        Semi-naive (delta-driven) forward chaining.
+
+        Produces exactly the same facts (and the same count) as the naive
+        `forward_chain`, but each round only evaluates rule bodies in which at
+        least one atom is matched against the facts derived in the previous
+        round (see `match_body_delta`). For recursive programs such as
+            path(X,Z) :- edge(X,Y), path(Y,Z)
+        old joins are never redone, so the total work is proportional to the
+        number of new facts rather than quadratic in the number of rounds.
+
+        Parameters
+        ----------
+        kb : KnowledgeBase
+            The knowledge base holding ground facts and Horn rules.
+        max_iterations : int, optional
+            Safety cap on the number of rounds.
+        delta : iterable[Atom] or None
+            Facts to treat as new in the first round. Default (None): all
+            facts. Pass only the facts added since the KB was last saturated
+            (e.g. the overlay of a reopened `MappedKnowledgeBase`) to resume
+            without re-deriving everything; this is only correct if the
+            remaining facts are already closed under the rules.
+        profiler : InferenceProfiler or None
+            Opt-in instrumentation: per rule and round, time spent, facts
+            scanned, bindings, derived facts and duplicates (and optionally
+            provenance) are reported to it. None (default) costs nothing.
+
+        Returns
+        -------
+        int
+            Total number of *new* facts added during the run.
+
+        Rounds
+        ------
+        - Round 1: every fact counts as new (delta = all facts), so this is a
+          plain evaluation of every rule. Empty-body rules fire here only.
+        - Round k > 1: delta = facts inserted at the end of round k-1.
+        - New facts are buffered and inserted with `kb.add_fact` at the end of
+          each round; the run stops when a round derives nothing new.
+        - Rule bodies are consumed as a stream (`iter_bindings`), so only the
+          new facts themselves are materialized, never the intermediate
+          bindings.
+        """
+        BuiltinPredicates.check_kb(kb)
+        added = 0
+        resumed = delta is not None
+        delta = self.group_facts(kb.facts if delta is None else delta)
+        if profiler is not None:
+            profiler.start(kb)
+        for iteration in range(max_iterations):
+            new_facts = set()
+            first_round = iteration == 0 and not resumed
+            for rule_index, rule in enumerate(kb.rules):
+                if profiler is not None:
+                    self._derive_profiled(kb, rule_index, rule, delta, first_round,
+                                          iteration, new_facts, profiler)
+                    continue
+                for fact in self._derive(kb, rule, delta, first_round=first_round):
+                    if fact not in kb.facts:
+                        new_facts.add(fact)
+            if not new_facts:
+                break
+            for fact in new_facts:
+                kb.add_fact(fact.predicate, *fact.args)
+            added += len(new_facts)
+            delta = self.group_facts(new_facts)
+        return added
+
+    def _derive(self, kb, rule, delta, first_round=False):
+        """
+        Yield the head instances of `rule` for one semi-naive round.
+
+        Every body atom whose signature occurs in `delta` is used as pivot in
+        turn (see `_pivots`). Heads may repeat (and may already be known);
+        the caller de-duplicates.
+        """
+        for pivot in self._pivots(rule, delta, first_round):
+            slots, _ = self.compile_body(kb, rule.body, pivot)
+            head = self.compile_head(rule.head, slots)
+            for binding in self.iter_bindings(kb, rule.body, pivot, delta):
+                yield self.instantiate(head, binding)
+
+    @staticmethod
+    def _pivots(rule, delta, first_round):
+        """
+        The pivots to evaluate `rule` with in one semi-naive round.
+
+        Ordinary body atoms with delta facts; built-in atoms never pivot. A
+        body without ordinary atoms (empty, or built-ins only) has nothing
+        that can change, so it is evaluated once, as a plain join (pivot
+        None), in the first round.
+        """
+        pivots = [pivot for pivot, atom in enumerate(rule.body)
+                  if not BuiltinPredicates.is_builtin(atom)]
+        if not pivots:
+            return [None] if first_round else []
+        return [pivot for pivot in pivots
+                if (rule.body[pivot].predicate, len(rule.body[pivot].args)) in delta]
+
+    def _derive_profiled(self, kb, rule_index, rule, delta, first_round, iteration,
+                         new_facts, profiler):
+        """
+        Instrumented `_derive`: add the new heads of `rule` to `new_facts` and
+        report one record (and, if enabled, provenance) to `profiler`. Rules
+        with nothing to join in this round (no delta for any body atom) are
+        not recorded. With `delta=None` (naive rounds) the rule is evaluated
+        as one plain join over all facts.
+        """
+        counter = [0, 0]
+        derived = duplicates = bindings = 0
+        started = time.perf_counter()
+        pivots = [None] if delta is None else self._pivots(rule, delta, first_round)
+        if not pivots:
+            return
+        for pivot in pivots:
+            slots, _ = self.compile_body(kb, rule.body, pivot)
+            solutions = self.iter_bindings(kb, rule.body, pivot, delta, counter=counter)
+            head = self.compile_head(rule.head, slots)
+            premises = [self.compile_head(atom, slots) for atom in rule.body
+                        if not BuiltinPredicates.is_builtin(atom)] if profiler.provenance else None
+            for binding in solutions:
+                bindings += 1
+                fact = self.instantiate(head, binding)
+                if fact in kb.facts or fact in new_facts:
+                    duplicates += 1
+                    continue
+                new_facts.add(fact)
+                derived += 1
+                if premises is not None:
+                    profiler.derive(fact, rule_index,
+                                    tuple(self.instantiate(p, binding) for p in premises))
+        profiler.record(iteration, rule_index, time.perf_counter() - started,
+                        counter[0], counter[1] + bindings, derived, duplicates)
+
+    def forward_chain(self, kb, max_iterations=10000, semi_naive=False, profiler=None):
         """
         Perform forward chaining until saturation (no new facts) or until
         `max_iterations` passes over the rule set.
@@ -173,6 +839,16 @@ class InferenceEngine:
             The knowledge base holding ground facts and Horn rules.
         max_iterations : int, optional
             Safety cap to prevent infinite loops in pathological inputs.
+        semi_naive : bool, optional
+            If True, delegate to `forward_chain_semi_naive` (delta-driven
+            evaluation). The derived facts and the returned count are the same.
+        profiler : InferenceProfiler or None, optional
+            Record per-rule / per-round statistics (see `InferenceProfiler`).
+            The profiled run keeps the requested strategy: with
+            `semi_naive=False` it runs naive rounds like the loop below (every
+            rule joined against all facts, new facts inserted at the end of
+            the round), instrumented; the derived facts and the count are the
+            same.
 
         Returns
         -------
@@ -199,11 +875,44 @@ class InferenceEngine:
         >>> eng.forward_chain(kb)
         0
         """
+        BuiltinPredicates.check_kb(kb)
+        if semi_naive:
+            return self.forward_chain_semi_naive(kb, max_iterations, profiler=profiler)
+        if profiler is not None:
+            return self._forward_chain_profiled(kb, max_iterations, profiler)
+
         # TODO - BLOCK START
         # TASK#19
         pass
         # TODO - BLOCK END
 
+    def _forward_chain_profiled(self, kb, max_iterations, profiler):
+        """
+        Naive forward chaining reporting to `profiler` (see `forward_chain`):
+        every round joins every rule against all facts.
+        """
+        added = 0
+        profiler.start(kb)
+        for iteration in range(max_iterations):
+            new_facts = set()
+            for rule_index, rule in enumerate(kb.rules):
+                self._derive_profiled(kb, rule_index, rule, None, iteration == 0,
+                                      iteration, new_facts, profiler)
+            if not new_facts:
+                break
+            for fact in new_facts:
+                kb.add_fact(fact.predicate, *fact.args)
+            added += len(new_facts)
+        return added
+
+class _Solution:
+    """A built-in solution in the shape of a fact (only `args`) for `iter_bindings`."""
+
+    __slots__ = ('args',)
+
+    def __init__(self, args):
+        self.args = args
+
 class StudentID:
     """
     Utility class for identifying the student.
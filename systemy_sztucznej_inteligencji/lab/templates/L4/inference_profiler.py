@@ -0,0 +1,203 @@
+import json
+
+class InferenceProfiler:
+    """
+    Opt-in instrumentation for `InferenceEngine.forward_chain`.
+
+    Pass an instance as `profiler=` to `forward_chain` (or
+    `forward_chain_semi_naive`). The profiled run uses the strategy that was
+    asked for: `forward_chain(kb, profiler=p)` profiles naive rounds (every
+    rule joined against all facts), `semi_naive=True` the delta-driven ones.
+    Without a profiler the engine runs its usual, uninstrumented loop, so the
+    feature costs nothing when it is not used.
+
+    What is recorded
+    ----------------
+    One record per (round, rule) that was evaluated:
+        iteration   : round (0 = first)
+        rule        : index of the rule in `kb.rules`
+        seconds     : wall time spent evaluating the rule in that round
+        scanned     : candidate facts read by the joins
+        bindings    : (partial) bindings produced by the join steps,
+                      complete ones included
+        derived     : new facts first produced by this rule
+        duplicates  : heads that were already known (or already derived in
+                      the same round)
+
+    With `provenance=True` it also keeps, for every derived fact, the rule
+    and the premise facts of its *first* derivation (built-in atoms such as
+    neq are conditions, not premises). Premises are the Atoms of the KB, so
+    the overhead is one small tuple per derived fact.
+
+    Example
+    -------
+    >>> prof = InferenceProfiler(provenance=True)
+    >>> eng.forward_chain(kb, profiler=prof)
+    1
+    >>> print(prof.report())
+    rule  seconds  scanned  bindings  derived  duplicates  rounds
+       0   0.0001        4         3        1           0       1   grandparent('?x', '?z') :- ...
+    >>> prof.explain(Atom('grandparent', ('anna', 'ola')))
+    {'fact': grandparent('anna', 'ola'), 'rule': 0,
+     'premises': [{'fact': parent('anna', 'eva')}, {'fact': parent('eva', 'ola')}]}
+    """
+
+    FIELDS = ('seconds', 'scanned', 'bindings', 'derived', 'duplicates')
+
+    def __init__(self, provenance=False):
+        """
+        Parameters
+        ----------
+        provenance : bool
+            Also record how each fact was derived (see `explain`).
+
+        Attributes
+        ----------
+        records : list[dict]
+            One dict per evaluated (round, rule), keys as in the class docstring.
+        derivations : dict
+            Atom -> (rule index, tuple of premise Atoms); empty unless
+            `provenance` is enabled.
+        rules : list[Rule]
+            The rules of the profiled KB (to label the report).
+        """
+        self.provenance = provenance
+        self.records = []
+        self.derivations = {}
+        self.rules = []
+
+    def start(self, kb):
+        """Called by the engine at the beginning of a run."""
+        self.rules = list(kb.rules)
+
+    def record(self, iteration, rule, seconds, scanned, bindings, derived, duplicates):
+        """Called by the engine after evaluating one rule in one round."""
+        self.records.append({'iteration': iteration, 'rule': rule, 'seconds': seconds,
+                             'scanned': scanned, 'bindings': bindings,
+                             'derived': derived, 'duplicates': duplicates})
+
+    def derive(self, fact, rule, premises):
+        """Called by the engine for every new fact (provenance only)."""
+        self.derivations.setdefault(fact, (rule, premises))
+
+    def summary(self):
+        """
+        Totals per rule, most expensive (by time) first.
+
+        Returns
+        -------
+        list[dict]
+            {'rule', 'seconds', 'scanned', 'bindings', 'derived', 'duplicates',
+            'rounds'} per rule that was evaluated at least once.
+        """
+        totals = {}
+        for record in self.records:
+            total = totals.setdefault(record['rule'], dict.fromkeys(self.FIELDS, 0))
+            for field in self.FIELDS:
+                total[field] += record[field]
+            total['rounds'] = total.get('rounds', 0) + 1
+        rows = [dict(rule=rule, **total) for rule, total in totals.items()]
+        return sorted(rows, key=lambda row: row['seconds'], reverse=True)
+
+    def report(self):
+        """A plain-text table of `summary()`, one line per rule."""
+        lines = ['rule  seconds  scanned  bindings  derived  duplicates  rounds']
+        for row in self.summary():
+            label = repr(self.rules[row['rule']]) if row['rule'] < len(self.rules) else ''
+            lines.append(f"{row['rule']:4d} {row['seconds']:8.4f} {row['scanned']:8d} "
+                         f"{row['bindings']:9d} {row['derived']:8d} {row['duplicates']:11d} "
+                         f"{row['rounds']:7d}   {label}")
+        return '\n'.join(lines)
+
+    def explain(self, fact):
+        """
+        Derivation tree of `fact` (provenance must be enabled).
+
+        Returns
+        -------
+        dict
+            {'fact': Atom} for a stored (not derived) fact, otherwise
+            {'fact': Atom, 'rule': index, 'premises': [subtrees]}.
+
+        Notes
+        -----
+        The tree is built with an explicit stack, so derivation chains of
+        any length work (no recursion limit). Every fact is explained once:
+        a premise used in several places is the *same* subtree dict each
+        time, so treat the result as read-only.
+        """
+        trees = {}
+        open_facts = set()
+        stack = [fact]
+        while stack:
+            current = stack[-1]
+            if current in trees:
+                stack.pop()
+                continue
+            derivation = self.derivations.get(current)
+            if derivation is None:
+                trees[current] = {'fact': current}
+                stack.pop()
+                continue
+            rule, premises = derivation
+            if current not in open_facts:
+                open_facts.add(current)
+                # a premise that is still open would be a cycle; it stays a leaf
+                stack.extend(p for p in premises if p not in trees and p not in open_facts)
+                continue
+            trees[current] = {'fact': current, 'rule': rule,
+                              'premises': [trees.get(p) or {'fact': p} for p in premises]}
+            open_facts.discard(current)
+            stack.pop()
+        return trees[fact]
+
+    def to_json(self):
+        """
+        Export the records, per-rule summary and provenance as a JSON string.
+
+        Atoms are written as [predicate, [args...]]; provenance is a list of
+        {"fact", "rule", "premises"} entries (one level deep - follow the
+        premises to rebuild a tree).
+        """
+        def atom(a):
+            return [a.predicate, list(a.args)]
+
+        return json.dumps({
+            'records': self.records,
+            'summary': self.summary(),
+            'provenance': [{'fact': atom(fact), 'rule': rule, 'premises': [atom(p) for p in premises]}
+                           for fact, (rule, premises) in self.derivations.items()],
+        })
+
+    def save_json(self, path):
+        """Write `to_json()` to the file `path`."""
+        with open(path, 'w', encoding='utf-8') as out:
+            out.write(self.to_json())
+
+class StudentID:
+    """
+    Utility class for identifying the student.
+
+    Each student must replace the placeholder return value
+    in the `get_ID` method with their own unique student ID.
+    """
+
+    @staticmethod
+    def get_ID():
+        """
+        Return the student ID as a string.
+
+        Returns
+        -------
+        str
+            The student ID. Each student must replace "student_ID" with their own ID.
+
+        Examples
+        --------
+        >>> StudentID.get_ID()
+        '123456'
+        """
+        # TODO - BLOCK START
+        # TASK#1
+        return "student_ID"
+        # TODO - BLOCK END
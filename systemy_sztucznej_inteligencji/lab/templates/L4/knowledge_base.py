@@ -1,3 +1,4 @@
+import sys
 
 class Atom:
     """
@@ -29,6 +30,18 @@ class Atom:
     - Two Atoms are equal if both their predicate and all arguments (in order)
       are equal. This enables reliable de-duplication of facts.
 
+    Compact representation
+    ----------------------
+    Knowledge bases hold millions of Atoms, so the class is kept small:
+    - `__slots__` instead of a per-instance `__dict__`.
+    - String predicates and arguments are interned with `sys.intern`, so
+      equal strings read from different sources (files, user input, ...)
+      are stored once, and comparing them mostly hits the identity fast path.
+      Interned strings are freed again when no Atom uses them.
+    - No cached hash: a hash int would cost another ~40 bytes per fact,
+      while hashing (predicate, args) is cheap because strings cache their
+      own hash.
+
     Doctest-style examples
     ----------------------
     >>> a1 = Atom('parent', ('anna', 'eva'))
@@ -43,6 +56,8 @@ class Atom:
     >>> repr(a1)
     "parent('anna', 'eva')"
     """
+    __slots__ = ('predicate', 'args')
+
     def __init__(self, predicate, args):
         """
         Initialize an Atom.
@@ -60,12 +75,48 @@ class Atom:
         - Arguments should be hashable (e.g., str, int).
         - For rule patterns, use variables as strings starting with '?',
           e.g., '?x', '?y'. For ground facts, use concrete values only.
+        - Store the two fields as `self.predicate` and `self.args`; they are
+          the only instance attributes allowed by `__slots__`.
         """
         # TODO - BLOCK START
         # TASK#2
         pass
         # TODO - BLOCK END
 
+        # Intern the string symbols (see "Compact representation")
+        self.predicate = Atom._intern(self.predicate)
+        self.args = Atom._intern_args(self.args)
+
+    @staticmethod
+    def _intern(value):
+        """`sys.intern(value)` for strings, `value` itself otherwise."""
+        return sys.intern(value) if value.__class__ is str else value
+
+    @staticmethod
+    def _intern_args(args):
+        """Tuple of `args` with every string interned."""
+        intern = sys.intern
+        return tuple([intern(value) if value.__class__ is str else value for value in args])
+
+    @staticmethod
+    def _from_interned(predicate, args):
+        """
+        Build an Atom from an already interned predicate and argument tuple
+        (see `_intern` / `_intern_args`), skipping `__init__`. Used by bulk
+        loading (`KnowledgeBase.add_facts`).
+        """
+        atom = Atom.__new__(Atom)
+        atom.predicate = predicate
+        atom.args = args
+        return atom
+
+    def __reduce__(self):
+        """
+        Pickle as a constructor call, so the receiving process (e.g. a worker
+        process) interns the strings again.
+        """
+        return (Atom, (self.predicate, self.args))
+
     def __eq__(self, other):
         """
         Structural equality.
@@ -77,6 +128,9 @@ class Atom:
 
         This allows Atoms to be compared meaningfully and de-duplicated.
 
+        Checking `self is other` first is a cheap fast path; because strings
+        are interned, the field comparisons mostly compare by identity too.
+
         Example
         -------
         >>> Atom('likes', ('alice', 'pizza')) == Atom('likes', ('alice', 'pizza'))
@@ -178,9 +232,13 @@ class Rule:
             body=[
                 Atom('parent', ('?p', '?a')),
                 Atom('parent', ('?p', '?b')),
-                Atom('neq', ('?a', '?b')),  # custom predicate to enforce ?a != ?b
+                Atom('neq', ('?a', '?b')),  # built-in: enforces ?a != ?b
             ]
         )
+        `neq` is a built-in predicate (see `BuiltinPredicates`): it is
+        evaluated by the engine once ?a and ?b are bound, so no `neq` facts
+        have to be stored. Other built-ins: eq, lt, le, gt, ge, plus, minus,
+        times.
 
     Ancestor (recursive) rules:
         # Base case: every parent is an ancestor
@@ -283,6 +341,196 @@ class Rule:
         pass
         # TODO - BLOCK END
 
+class _IndexedFacts(set):
+    """
+    The `KnowledgeBase.facts` set: a plain set of Atom that also keeps the
+    KB's secondary indexes in sync on every mutation (`add`, `discard`,
+    `update`, `-=`, ...), no matter who makes it (`add_fact`, an inference
+    engine, user code). Reads (`in`, `len`, iteration) are the set's own.
+
+    Index layout
+    ------------
+    by_predicate : dict
+        (predicate, arity) -> set of Atom
+    by_argument : dict
+        (predicate, arity, position) -> {constant -> set of Atom}
+        The number of keys of the inner dict is the number of distinct
+        constants at that position. Empty buckets are removed, so the
+        counts stay exact after deletions.
+    version : int
+        Grows with every fact added or removed (see `KnowledgeBase.version`).
+    """
+
+    def __init__(self, facts=()):
+        super().__init__()
+        self.by_predicate = {}
+        self.by_argument = {}
+        self.version = 0
+        self.update(facts)
+
+    def _index(self, atom):
+        self.version += 1
+        predicate, args = atom.predicate, atom.args
+        arity = len(args)
+        bucket = self.by_predicate.get((predicate, arity))
+        if bucket is None:
+            self.by_predicate[(predicate, arity)] = {atom}
+        else:
+            bucket.add(atom)
+        for position, value in enumerate(args):
+            index = self.by_argument.setdefault((predicate, arity, position), {})
+            bucket = index.get(value)
+            if bucket is None:
+                index[value] = {atom}
+            else:
+                bucket.add(atom)
+
+    def _unindex(self, atom):
+        self.version += 1
+        predicate, args = atom.predicate, atom.args
+        arity = len(args)
+        key = (predicate, arity)
+        bucket = self.by_predicate[key]
+        bucket.discard(atom)
+        if not bucket:
+            del self.by_predicate[key]
+        for position, value in enumerate(args):
+            key = (predicate, arity, position)
+            index = self.by_argument[key]
+            bucket = index[value]
+            bucket.discard(atom)
+            if not bucket:
+                del index[value]
+                if not index:
+                    del self.by_argument[key]
+
+    def add(self, atom):
+        size = len(self)
+        set.add(self, atom)
+        if len(self) != size:
+            self._index(atom)
+
+    def discard(self, atom):
+        if atom in self:
+            set.discard(self, atom)
+            self._unindex(atom)
+
+    def remove(self, atom):
+        if atom not in self:
+            raise KeyError(atom)
+        self.discard(atom)
+
+    def pop(self):
+        atom = set.pop(self)
+        self._unindex(atom)
+        return atom
+
+    def clear(self):
+        set.clear(self)
+        self.by_predicate.clear()
+        self.by_argument.clear()
+        self.version += 1
+
+    def update(self, *others):
+        for other in others:
+            for atom in other:
+                self.add(atom)
+
+    def difference_update(self, *others):
+        for other in others:
+            for atom in list(other):
+                self.discard(atom)
+
+    def intersection_update(self, *others):
+        keep = set(self).intersection(*others)
+        self.difference_update([atom for atom in self if atom not in keep])
+
+    def symmetric_difference_update(self, other):
+        other = set(other)
+        common = other & self
+        self.update(other - common)
+        self.difference_update(common)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def __isub__(self, other):
+        self.difference_update(other)
+        return self
+
+    def __iand__(self, other):
+        self.intersection_update(other)
+        return self
+
+    def __ixor__(self, other):
+        self.symmetric_difference_update(other)
+        return self
+
+    def __reduce__(self):
+        """Pickle as its facts; the indexes are rebuilt on load."""
+        return (_IndexedFacts, (list(self),))
+
+class _VersionedRules(list):
+    """
+    The `KnowledgeBase.rules` list: a plain list of Rule that counts its
+    mutations in `version` (see `KnowledgeBase.version`).
+    """
+
+    def __init__(self, rules=()):
+        super().__init__(rules)
+        self.version = 0
+
+    def append(self, rule):
+        list.append(self, rule)
+        self.version += 1
+
+    def extend(self, rules):
+        list.extend(self, rules)
+        self.version += 1
+
+    def insert(self, index, rule):
+        list.insert(self, index, rule)
+        self.version += 1
+
+    def remove(self, rule):
+        list.remove(self, rule)
+        self.version += 1
+
+    def pop(self, index=-1):
+        rule = list.pop(self, index)
+        self.version += 1
+        return rule
+
+    def clear(self):
+        list.clear(self)
+        self.version += 1
+
+    def sort(self, *, key=None, reverse=False):
+        list.sort(self, key=key, reverse=reverse)
+        self.version += 1
+
+    def reverse(self):
+        list.reverse(self)
+        self.version += 1
+
+    def __setitem__(self, index, value):
+        list.__setitem__(self, index, value)
+        self.version += 1
+
+    def __delitem__(self, index):
+        list.__delitem__(self, index)
+        self.version += 1
+
+    def __iadd__(self, rules):
+        self.extend(rules)
+        return self
+
+    def __imul__(self, times):
+        list.__imul__(self, times)
+        self.version += 1
+        return self
+
 class KnowledgeBase:
     """
     A minimal, in-memory knowledge base that stores ground facts and Horn rules.
@@ -308,6 +556,24 @@ class KnowledgeBase:
     a separate component (e.g., an InferenceEngine) that reads and writes
     to this knowledge base.
 
+    Indexes
+    -------
+    Next to the flat `facts` set the KB keeps two secondary hash indexes.
+    `facts` maintains them itself on every insertion and removal (see
+    `_IndexedFacts`), so facts added through `add_fact`, `add_facts` or
+    directly with `kb.facts.add(...)` are all indexed:
+        (predicate, arity)           -> facts with that predicate/arity
+        (predicate, arity, position) -> {constant: facts with that constant
+                                         at that argument position}
+    `lookup` uses them, so a pattern with a bound argument such as
+    ('parent', 'anna', None) costs O(matches) instead of O(|facts|).
+
+    Bulk loading
+    ------------
+    `add_facts` inserts many facts of one predicate at once (rows or
+    columns), de-duplicating the batch first and updating the indexes once
+    per batch; use it instead of a loop over `add_fact` when loading data.
+
     Example
     -------
     >>> kb = KnowledgeBase()
@@ -341,6 +607,44 @@ class KnowledgeBase:
         pass
         # TODO - BLOCK END
 
+    @property
+    def facts(self):
+        """The set of ground facts (an `_IndexedFacts`, see "Indexes")."""
+        return self._facts
+
+    @facts.setter
+    def facts(self, facts):
+        """Replace the facts (any iterable of Atom); the indexes are rebuilt."""
+        previous = getattr(self, '_facts', None)
+        self._facts = _IndexedFacts(facts)
+        if previous is not None:
+            self._facts.version += previous.version + 1
+
+    @property
+    def rules(self):
+        """The list of rules (a `_VersionedRules`)."""
+        return self._rules
+
+    @rules.setter
+    def rules(self, rules):
+        """Replace the rules (any iterable of Rule)."""
+        previous = getattr(self, '_rules', None)
+        self._rules = _VersionedRules(rules)
+        if previous is not None:
+            self._rules.version = previous.version + 1
+
+    @property
+    def version(self):
+        """
+        A counter that grows with every change of `facts` or `rules`.
+
+        Anything computed from the KB (e.g. the tables of
+        `TabledQueryEngine`) is still valid while the version is unchanged;
+        unlike the number of facts, it also changes when one fact is
+        removed and another added.
+        """
+        return self._facts.version + self._rules.version
+
     def __repr__(self):
         """
         Return a compact, unambiguous string useful for debugging.
@@ -375,6 +679,7 @@ class KnowledgeBase:
         --------
         - The fact is wrapped in an Atom and inserted into the `facts` set.
         - Because `facts` is a set, attempting to add the same fact again is a no-op.
+        - `facts` updates the secondary indexes right away (see `_IndexedFacts`).
 
         Examples
         --------
@@ -386,6 +691,152 @@ class KnowledgeBase:
         pass
         # TODO - BLOCK END
 
+    def add_facts(self, predicate, rows=None, columns=None):
+        """
+        Add many ground facts of one predicate; return how many were new.
+
+        Parameters
+        ----------
+        predicate : str
+            The predicate name shared by all facts of the batch.
+        rows : iterable of sequences, optional
+            One argument sequence per fact, e.g. [('anna', 'ewa'), ('ewa', 'ola')]
+            (any iterable: a list, a csv.reader, a generator, ...).
+        columns : sequence of sequences, optional
+            Column-oriented alternative: columns[i][k] is argument i of fact
+            k, e.g. [['anna', 'ewa'], ['ewa', 'ola']]. Objects with a
+            `tolist()` method (numpy arrays, pandas/pyarrow columns) are
+            converted to plain Python values first.
+
+        Returns
+        -------
+        int
+            Number of facts that were not in the KB before (duplicates inside
+            the batch and already known facts are not counted).
+
+        Why it is faster than calling `add_fact` in a loop
+        ---------------------------------------------------
+        - The batch is de-duplicated on plain argument tuples first (one C
+          level pass of set hashing), so repeated rows cost nothing further.
+        - Only distinct rows are interned, and their Atoms are built from the
+          interned tuples directly (no second pass through `Atom.__init__`).
+        - Facts already in the KB are filtered out in one pass, and the new
+          ones are added to `facts` and to every index with one bulk update
+          per (predicate, arity) / position.
+
+        Examples
+        --------
+        >>> kb.add_facts('parent', [('anna', 'ewa'), ('ewa', 'ola'), ('anna', 'ewa')])
+        2
+        >>> kb.add_facts('age', columns=[['anna', 'ewa'], [71, 45]])
+        2
+        >>> kb.add_facts('parent', [('anna', 'ewa')])
+        0
+        """
+        if columns is not None:
+            columns = [column.tolist() if hasattr(column, 'tolist') else column
+                       for column in columns]
+            rows = zip(*columns)
+        facts = self._facts
+        predicate = Atom._intern(predicate)
+        atoms = [Atom._from_interned(predicate, Atom._intern_args(args))
+                 for args in dict.fromkeys(map(tuple, rows))]
+        fresh = [atom for atom in atoms if atom not in facts]
+        set.update(facts, fresh)
+        facts.version += len(fresh)
+
+        by_arity = {}
+        for atom in fresh:
+            by_arity.setdefault(len(atom.args), []).append(atom)
+        for arity, group in by_arity.items():
+            facts.by_predicate.setdefault((predicate, arity), set()).update(group)
+            for position in range(arity):
+                index = facts.by_argument.setdefault((predicate, arity, position), {})
+                for atom in group:
+                    value = atom.args[position]
+                    bucket = index.get(value)
+                    if bucket is None:
+                        index[value] = {atom}
+                    else:
+                        bucket.add(atom)
+        return len(fresh)
+
+    def count(self, predicate, arity):
+        """
+        Number of facts with the given predicate and arity (from the indexes).
+
+        Examples
+        --------
+        >>> kb.count('parent', 2)
+        2
+        """
+        return len(self._facts.by_predicate.get((predicate, arity), ()))
+
+    def distinct(self, predicate, arity, position):
+        """
+        Number of distinct constants at argument `position` of
+        `predicate`/`arity` facts (from the indexes).
+
+        Together with `count` this gives the classic selectivity estimate:
+        binding that argument leaves about count / distinct facts.
+
+        Examples
+        --------
+        >>> kb.distinct('parent', 2, 0)   # 'anna', 'ewa'
+        2
+        """
+        return len(self._facts.by_argument.get((predicate, arity, position), ()))
+
+    def lookup(self, predicate, *args):
+        """
+        Return the facts (as Atoms) matching a pattern, using the indexes.
+
+        Same pattern convention as `query`: each argument is either a concrete
+        value or `None` (wildcard).
+
+        Returns
+        -------
+        iterable of Atom
+            Exactly the matching facts. Treat the result as read-only: for
+            patterns with at most one bound argument it is the index bucket
+            itself, not a copy.
+
+        Cost
+        ----
+        - No bound argument:   the (predicate, arity) bucket, O(1).
+        - Bound argument(s):   the smallest (predicate, arity, position,
+          constant) bucket, filtered by the remaining bound positions, so
+          O(size of the smallest bucket), i.e. O(matches) for one bound argument.
+
+        Examples
+        --------
+        >>> kb.lookup('parent', 'anna', None)
+        {parent('anna', 'ewa')}
+        >>> kb.lookup('parent', 'nobody', None)
+        ()
+        """
+        arity = len(args)
+        facts = self._facts.by_predicate.get((predicate, arity))
+        if not facts:
+            return ()
+        bound = []
+        for position, value in enumerate(args):
+            if value is None:
+                continue
+            bucket = self._facts.by_argument[(predicate, arity, position)].get(value)
+            if not bucket:
+                return ()
+            bound.append((len(bucket), position, bucket))
+        if not bound:
+            return facts
+        bound.sort(key=lambda item: item[0])
+        facts = bound[0][2]
+        if len(bound) == 1:
+            return facts
+        rest = [(position, args[position]) for _, position, _ in bound[1:]]
+        return [atom for atom in facts
+                if all(atom.args[position] == value for position, value in rest)]
+
     def add_rule(self, head_atom, body_atoms):
         """
         Add a Horn rule to the knowledge base.
@@ -462,7 +913,12 @@ class KnowledgeBase:
         - This method is intentionally simple: it does not understand variables
           like '?x'. Use `None` for “any value”. Variables are meaningful inside
           rules and are used by the inference engine during unification.
+        - Scan `candidates` (prepared below via `lookup`) rather than the whole
+          `facts` set: the indexes have already discarded facts with another
+          predicate, arity or bound argument.
         """
+        candidates = self.lookup(predicate, *args)
+
         # TODO - BLOCK START
         # TASK#14
         pass
@@ -0,0 +1,353 @@
+from knowledge_base import Atom
+from inference_engine import InferenceEngine
+from builtin_predicates import BuiltinPredicates
+
+class ReteNetwork:
+    """
+    Incremental (Rete-style) matcher compiled from the rules of a KnowledgeBase.
+
+    Why
+    ---
+    `InferenceEngine.forward_chain` starts from scratch on every call, even if
+    a single fact was added since the last saturation. The network instead
+    keeps the partial matches of every rule in memory, so a new fact only
+    travels through the rules that mention its predicate and the derived
+    facts come back immediately.
+
+    Structure (per rule  head :- b0, b1, ..., bn)
+    ---------------------------------------------
+    - alpha memory i : facts matching body pattern b_i (predicate, arity,
+      constants, repeated variables), hashed by the values of the variables
+      b_i shares with b0..b_{i-1} (the *join key*).
+    - beta memory i  : partial matches (tokens) of b0..b_i, hashed by the
+      join key of b_{i+1}. Tokens are tuples indexed by a per-rule slot table
+      (variable -> position), like the bindings of `InferenceEngine.iter_bindings`.
+    - A new fact entering alpha memory i (right activation) is joined with
+      beta memory i-1; a new token entering beta memory i (left activation) is
+      joined with alpha memory i+1. Complete matches instantiate the head.
+    - Built-in atoms (neq, lt, plus, ...) have no memory: they filter or
+      extend the tokens right after the first step that binds enough of
+      their arguments.
+
+    Derived facts are inserted into the KB with `kb.add_fact` and fed back
+    into the network (worklist), so recursive rules work as well.
+
+    Example
+    -------
+    >>> kb = KnowledgeBase()
+    >>> kb.add_fact('edge', 'a', 'b')
+    >>> kb.add_rule(Atom('path', ('?x', '?y')), [Atom('edge', ('?x', '?y'))])
+    >>> kb.add_rule(Atom('path', ('?x', '?z')),
+    ...             [Atom('edge', ('?x', '?y')), Atom('path', ('?y', '?z'))])
+    >>> net = ReteNetwork(kb)          # saturates the current facts
+    >>> kb.query('path', None, None)
+    [('a', 'b')]
+    >>> net.add_fact('edge', 'b', 'c')
+    [path('b', 'c'), path('a', 'c')]
+    """
+
+    def __init__(self, kb, engine=None):
+        """
+        Compile `kb.rules` into a network and saturate the current facts.
+
+        Parameters
+        ----------
+        kb : KnowledgeBase
+            The knowledge base to keep saturated. Afterwards, add facts through
+            `ReteNetwork.add_fact` (not `kb.add_fact`) so they are propagated.
+        engine : InferenceEngine or None
+            Only used for its variable convention (`is_var`).
+
+        Attributes
+        ----------
+        kb : KnowledgeBase
+        added : int
+            Number of facts derived by the network so far (initial saturation
+            included).
+        _rules : list[_ReteRule]
+            One compiled node chain per rule.
+        _by_signature : dict
+            (predicate, arity) -> [(rule node, step index), ...] — the alpha
+            memories a fact of that signature may enter.
+        """
+        self.kb = kb
+        self.engine = engine or InferenceEngine()
+        self.added = 0
+        self._rules = []
+        self._by_signature = {}
+        BuiltinPredicates.check_kb(kb)
+        for rule in kb.rules:
+            self._compile(rule)
+        self._propagate(list(kb.facts), self._rules)
+        for node in self._rules:
+            if not node.steps:
+                self._propagate([], [], pending=node.fire_initial())
+
+    def add_fact(self, predicate, *args):
+        """
+        Insert a ground fact and propagate it through the network.
+
+        Returns
+        -------
+        list[Atom]
+            The facts derived because of this insertion, in derivation order
+            (the inserted fact itself is not included). Empty if the fact was
+            already known or nothing new follows from it.
+        """
+        BuiltinPredicates.check_signature(predicate, len(args))
+        fact = Atom(predicate, args)
+        if fact in self.kb.facts:
+            return []
+        self.kb.add_fact(predicate, *args)
+        return self._propagate([fact], self._rules)
+
+    def add_rule(self, head_atom, body_atoms):
+        """
+        Add a rule to the KB and to the network, then derive its consequences.
+
+        The existing facts are fed into the new rule only; whatever it derives
+        is propagated through the whole network as usual.
+
+        Returns
+        -------
+        list[Atom]
+            Facts derived because of the new rule.
+        """
+        BuiltinPredicates.check_signature(head_atom.predicate, len(head_atom.args), 'a rule head')
+        self.kb.add_rule(head_atom, body_atoms)
+        node = self._compile(self.kb.rules[-1])
+        if not node.steps:
+            return self._propagate([], [], pending=node.fire_initial())
+        return self._propagate(list(self.kb.facts), [node])
+
+    def _compile(self, rule):
+        """Compile one rule into a `_ReteRule` and register its alpha memories."""
+        node = _ReteRule(rule, self.engine.is_var)
+        self._rules.append(node)
+        for index, atom in enumerate(node.atoms):
+            self._by_signature.setdefault((atom.predicate, len(atom.args)), []).append((node, index))
+        return node
+
+    def _propagate(self, facts, nodes, pending=None):
+        """
+        Feed `facts` into the alpha memories of `nodes`, then keep feeding every
+        newly derived fact into the whole network until nothing new appears.
+
+        Parameters
+        ----------
+        facts : list[Atom]
+            Facts already present in the KB that still have to be activated.
+        nodes : list[_ReteRule]
+            Rule nodes that `facts` are restricted to.
+        pending : list[Atom] or None
+            Head instances produced outside of a join (empty-body rules).
+
+        Returns
+        -------
+        list[Atom]
+            Newly derived facts in derivation order.
+        """
+        derived = []
+        worklist = []
+
+        def emit(heads):
+            for head in heads:
+                if head not in self.kb.facts:
+                    self.kb.add_fact(head.predicate, *head.args)
+                    derived.append(head)
+                    worklist.append(head)
+
+        emit(pending or [])
+        allowed = set(map(id, nodes))
+        for fact in facts:
+            for node, index in self._by_signature.get((fact.predicate, len(fact.args)), ()):
+                if id(node) in allowed:
+                    emit(node.right_activate(index, fact))
+        while worklist:
+            fact = worklist.pop()
+            for node, index in self._by_signature.get((fact.predicate, len(fact.args)), ()):
+                emit(node.right_activate(index, fact))
+        self.added += len(derived)
+        return derived
+
+class _ReteRule:
+    """
+    Alpha/beta memories and join logic for a single rule (internal).
+
+    Steps are compiled for the ordinary body atoms (`atoms`), in written
+    order. For atom i the compiled step holds:
+        tests      : ((position, constant), ...)           constant checks
+        checks     : ((position, earlier_position), ...)   repeated new vars
+        binds      : ((position, slot), ...)               new variables
+        key_pos    : positions of b_i holding variables shared with b0..b_{i-1}
+        key_slots  : the slots of those shared variables (same order)
+    filters[i] lists the built-in calls (predicate, pattern, binds) evaluated
+    after step i; `initial` those of a rule without ordinary atoms.
+    """
+
+    def __init__(self, rule, is_var):
+        self.rule = rule
+        slots = {}
+        self.steps = []
+        self.filters = []
+        self.atoms = [atom for atom in rule.body if not BuiltinPredicates.is_builtin(atom)]
+        waiting = [atom for atom in rule.body if BuiltinPredicates.is_builtin(atom)]
+        ready = self._ready_builtins(waiting, slots, is_var)
+        for atom in self.atoms:
+            tests, checks, binds, key_pos, key_slots = [], [], [], [], []
+            first_position = {}
+            for position, arg in enumerate(atom.args):
+                if not is_var(arg):
+                    tests.append((position, arg))
+                elif arg in slots:
+                    key_pos.append(position)
+                    key_slots.append(slots[arg])
+                elif arg in first_position:
+                    checks.append((position, first_position[arg]))
+                else:
+                    first_position[arg] = position
+                    binds.append((position, len(slots) + len(binds)))
+            for position, slot in binds:
+                slots[atom.args[position]] = slot
+            self.steps.append((tuple(tests), tuple(checks), tuple(binds),
+                               tuple(key_pos), tuple(key_slots)))
+            self.filters.append(ready + self._ready_builtins(waiting, slots, is_var))
+            ready = []
+        if waiting:
+            raise ValueError(f"built-in {waiting[0].predicate}{waiting[0].args} "
+                             f"is never sufficiently bound")
+        self.initial = ready
+        self.size = len(slots)
+        self.head = tuple(('s', slots[arg]) if is_var(arg) and arg in slots else ('c', arg)
+                          for arg in rule.head.args)
+        # alpha[i]: join key -> list of fact argument tuples
+        self.alpha = [{} for _ in self.steps]
+        # beta[i]: join key of step i+1 -> list of tokens covering steps 0..i
+        self.beta = [{} for _ in self.steps[:-1]]
+
+    @staticmethod
+    def _ready_builtins(waiting, slots, is_var):
+        """
+        Compile (and remove from `waiting`) every built-in atom that can run
+        with the variables of `slots` bound; variables they bind get new slots.
+        """
+        compiled = []
+        placed = True
+        while placed:
+            placed = False
+            for atom in list(waiting):
+                if not BuiltinPredicates.ready(atom, slots, is_var):
+                    continue
+                pattern, binds = [], []
+                for position, arg in enumerate(atom.args):
+                    if not is_var(arg):
+                        pattern.append(('c', arg))
+                    elif arg in slots:
+                        pattern.append(('s', slots[arg]))
+                    else:
+                        pattern.append(None)
+                        slots[arg] = len(slots)
+                        binds.append((position, slots[arg]))
+                compiled.append((atom.predicate, tuple(pattern), tuple(binds)))
+                waiting.remove(atom)
+                placed = True
+        return compiled
+
+    @staticmethod
+    def _apply(filters, token):
+        """Run the built-in calls `filters` on `token`; return the surviving tokens."""
+        tokens = [token]
+        for predicate, pattern, binds in filters:
+            extended = []
+            for token in tokens:
+                args = tuple(None if p is None else (p[1] if p[0] == 'c' else token[p[1]])
+                             for p in pattern)
+                for solution in BuiltinPredicates.solve(predicate, args):
+                    if binds:
+                        new = list(token)
+                        for position, slot in binds:
+                            new[slot] = solution[position]
+                        extended.append(tuple(new))
+                    else:
+                        extended.append(token)
+            tokens = extended
+        return tokens
+
+    def fire(self, token):
+        """Instantiate the head for a complete token."""
+        return Atom(self.rule.head.predicate,
+                    tuple(token[value] if kind == 's' else value for kind, value in self.head))
+
+    def fire_initial(self):
+        """Head instances of a rule without ordinary body atoms."""
+        return [self.fire(token) for token in self._apply(self.initial, (None,) * self.size)]
+
+    def right_activate(self, index, fact):
+        """A fact arrives at alpha memory `index`; return the head instances it completes."""
+        tests, checks, _, key_pos, _ = self.steps[index]
+        args = fact.args
+        if any(args[p] != value for p, value in tests):
+            return []
+        if any(args[p] != args[q] for p, q in checks):
+            return []
+        key = tuple(args[p] for p in key_pos)
+        self.alpha[index].setdefault(key, []).append(args)
+        if index == 0:
+            tokens = [(None,) * self.size]
+        else:
+            tokens = self.beta[index - 1].get(key, ())
+        heads = []
+        for token in tokens:
+            self._extend(index, token, args, heads)
+        return heads
+
+    def _extend(self, index, token, args, heads):
+        """Bind step `index` from `args` on top of `token`; continue downstream."""
+        binds = self.steps[index][2]
+        if binds:
+            token = list(token)
+            for position, slot in binds:
+                token[slot] = args[position]
+            token = tuple(token)
+        tokens = self._apply(self.filters[index], token) if self.filters[index] else (token,)
+        for token in tokens:
+            if index == len(self.steps) - 1:
+                heads.append(self.fire(token))
+            else:
+                self._left_activate(index, token, heads)
+
+    def _left_activate(self, index, token, heads):
+        """A token for steps 0..index arrives at beta memory `index`; join with alpha index+1."""
+        key_slots = self.steps[index + 1][4]
+        key = tuple(token[slot] for slot in key_slots)
+        self.beta[index].setdefault(key, []).append(token)
+        for args in self.alpha[index + 1].get(key, ()):
+            self._extend(index + 1, token, args, heads)
+
+class StudentID:
+    """
+    Utility class for identifying the student.
+
+    Each student must replace the placeholder return value
+    in the `get_ID` method with their own unique student ID.
+    """
+
+    @staticmethod
+    def get_ID():
+        """
+        Return the student ID as a string.
+
+        Returns
+        -------
+        str
+            The student ID. Each student must replace "student_ID" with their own ID.
+
+        Examples
+        --------
+        >>> StudentID.get_ID()
+        '123456'
+        """
+        # TODO - BLOCK START
+        # TASK#1
+        return "student_ID"
+        # TODO - BLOCK END
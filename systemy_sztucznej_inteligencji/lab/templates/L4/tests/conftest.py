@@ -0,0 +1,30 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from knowledge_base import Atom, KnowledgeBase
+from inference_engine import InferenceEngine
+
+def _solved():
+    """True once the TODO tasks the engines build on (Atom, KnowledgeBase, forward_chain) are done."""
+    try:
+        kb = KnowledgeBase()
+        kb.add_fact('edge', 'a', 'b')
+        kb.add_fact('edge', 'b', 'c')
+        kb.add_rule(Atom('path', ('?x', '?y')), [Atom('edge', ('?x', '?y'))])
+        kb.add_rule(Atom('path', ('?x', '?z')), [Atom('edge', ('?x', '?y')), Atom('path', ('?y', '?z'))])
+        return (InferenceEngine().forward_chain(kb) == 3
+                and sorted(kb.query('path', 'a', None)) == [('a', 'b'), ('a', 'c')])
+    except Exception:
+        return False
+
+SOLVED = _solved()
+
+@pytest.fixture
+def solved():
+    """Skip the test while the student tasks of the lab are not implemented."""
+    if not SOLVED:
+        pytest.skip("the TODO tasks of L4 are not implemented yet")
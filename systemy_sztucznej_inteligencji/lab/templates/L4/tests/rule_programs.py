@@ -0,0 +1,69 @@
+"""
+Rule programs and random inputs shared by the L4 tests.
+
+The tests saturate small random edge graphs under these programs
+(recursion, joins, rules without a body, built-ins) and compare each
+evaluator with the naive `InferenceEngine.forward_chain`.
+"""
+from knowledge_base import Atom, KnowledgeBase
+from inference_engine import InferenceEngine
+
+PROGRAMS = ['right_recursive', 'left_recursive', 'joins', 'builtins']
+
+def program(name):
+    """Rules (head, body) of the named test program (built lazily: Atom is a student task)."""
+    if name == 'right_recursive':
+        return [(Atom('path', ('?x', '?y')), [Atom('edge', ('?x', '?y'))]),
+                (Atom('path', ('?x', '?z')), [Atom('edge', ('?x', '?y')), Atom('path', ('?y', '?z'))])]
+    if name == 'left_recursive':
+        return [(Atom('path', ('?x', '?y')), [Atom('edge', ('?x', '?y'))]),
+                (Atom('path', ('?x', '?z')), [Atom('path', ('?x', '?y')), Atom('path', ('?y', '?z'))])]
+    if name == 'joins':
+        return [(Atom('gp', ('?x', '?z')), [Atom('edge', ('?x', '?y')), Atom('edge', ('?y', '?z'))]),
+                (Atom('self', ('?x',)), [Atom('edge', ('?x', '?x'))]),
+                (Atom('tri', ('?x', '?y', '?z')),
+                 [Atom('edge', ('?x', '?y')), Atom('edge', ('?y', '?z')), Atom('edge', ('?z', '?x'))]),
+                (Atom('fromA', ('?y',)), [Atom('edge', ('n0', '?y'))]),
+                (Atom('c', ('k',)), []),
+                (Atom('pair', ('?x', '?y')), [Atom('c', ('?x',)), Atom('fromA', ('?y',))])]
+    return [(Atom('sib', ('?a', '?b')),
+             [Atom('edge', ('?p', '?a')), Atom('edge', ('?p', '?b')), Atom('neq', ('?a', '?b'))]),
+            (Atom('fwd', ('?a', '?b')), [Atom('lt', ('?a', '?b')), Atom('edge', ('?a', '?b'))]),
+            (Atom('len', ('?x', '?y', 1)), [Atom('edge', ('?x', '?y'))]),
+            (Atom('len', ('?x', '?z', '?n')),
+             [Atom('plus', ('?m', 1, '?n')), Atom('len', ('?x', '?y', '?m')),
+              Atom('edge', ('?y', '?z')), Atom('lt', ('?n', 4))]),
+            (Atom('back', ('?x', '?m')), [Atom('len', ('?x', '?y', '?n')), Atom('minus', ('?n', '?m', 1))]),
+            (Atom('k', (3,)), [Atom('lt', (1, 2))]),
+            (Atom('k', ('?x',)), [Atom('plus', (1, '?x', 5))]),
+            (Atom('same', ('?y', '?x')), [Atom('eq', ('?y', '?x')), Atom('edge', ('?x', '?z'))]),
+            (Atom('sq', ('?x', '?y')),
+             [Atom('k', ('?x',)), Atom('times', ('?x', '?x', '?y')), Atom('ge', ('?y', 10))])]
+
+def build(name, edges):
+    """A KB with one edge fact per pair of `edges` and the rules of the named program."""
+    kb = KnowledgeBase()
+    for a, b in edges:
+        kb.add_fact('edge', a, b)
+    for head, body in program(name):
+        kb.add_rule(head, body)
+    return kb
+
+def random_edges(rnd, nodes=9, edges=15):
+    """Random edge list over 'n0', 'n1', ... (duplicates and self-loops included)."""
+    n = rnd.randint(1, nodes)
+    return [(f'n{rnd.randrange(n)}', f'n{rnd.randrange(n)}') for _ in range(rnd.randint(0, edges))]
+
+def saturated(name, edges):
+    """The reference: naive forward chaining of the named program over `edges`."""
+    kb = build(name, set(edges))
+    InferenceEngine().forward_chain(kb)
+    return kb
+
+def patterns(rnd, kb, extra, count):
+    """Random query patterns (None = free) for every predicate derived in `kb` and `extra`."""
+    constants = sorted({arg for fact in kb.facts for arg in fact.args if isinstance(arg, str)}) or ['n0']
+    predicates = {(fact.predicate, len(fact.args)) for fact in kb.facts} | set(extra)
+    for predicate, arity in sorted(predicates):
+        for _ in range(count):
+            yield predicate, tuple(rnd.choice([None, rnd.choice(constants), 'k']) for _ in range(arity))
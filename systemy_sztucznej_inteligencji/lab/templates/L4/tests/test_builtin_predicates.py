@@ -0,0 +1,59 @@
+"""
+Built-in predicates cannot be shadowed by stored facts or rule heads.
+"""
+import operator
+
+import pytest
+
+from knowledge_base import Atom, KnowledgeBase
+from inference_engine import InferenceEngine
+from builtin_predicates import BuiltinPredicates
+from rete_network import ReteNetwork
+from tabled_query_engine import TabledQueryEngine
+from magic_sets import MagicSets
+from parallel_inference import ParallelInferenceEngine
+
+pytestmark = pytest.mark.usefixtures('solved')
+
+def test_builtin_shadowing_is_rejected_by_every_engine():
+    def shadowing_kbs():
+        kb = KnowledgeBase()
+        kb.add_fact('lt', 'a', 'b')
+        kb.add_rule(Atom('p', ('?x',)), [Atom('lt', ('?x', '?y'))])
+        yield kb
+        kb = KnowledgeBase()
+        kb.add_fact('e', 1)
+        kb.add_rule(Atom('eq', ('?x', '?x')), [Atom('e', ('?x',))])
+        yield kb
+
+    runs = [lambda kb: InferenceEngine().forward_chain(kb),
+            lambda kb: InferenceEngine().forward_chain(kb, semi_naive=True),
+            lambda kb: ReteNetwork(kb),
+            lambda kb: TabledQueryEngine().query(kb, 'p', None),
+            lambda kb: MagicSets.query(kb, 'p', None),
+            lambda kb: ParallelInferenceEngine(1).forward_chain(kb)]
+    for run in runs:
+        for kb in shadowing_kbs():
+            with pytest.raises(ValueError, match='built-in'):
+                run(kb)
+
+    kb = KnowledgeBase()
+    kb.add_fact('n', 1)
+    kb.add_rule(Atom('q', ('?x',)), [Atom('n', ('?x',)), Atom('lt', ('?x', 5))])
+    network = ReteNetwork(kb)
+    with pytest.raises(ValueError):
+        network.add_fact('plus', 1, 2, 3)
+    with pytest.raises(ValueError):
+        network.add_rule(Atom('neq', ('?x', '?y')), [Atom('n', ('?x',)), Atom('n', ('?y',))])
+    assert network.add_fact('n', 2) == [Atom('q', (2,))]
+
+
+def test_unregistered_builtin_becomes_an_ordinary_predicate():
+    BuiltinPredicates.unregister('times', 3)
+    try:
+        kb = KnowledgeBase()
+        kb.add_fact('times', 1, 2, 3)
+        kb.add_rule(Atom('t', ('?z',)), [Atom('times', (1, 2, '?z'))])
+        assert InferenceEngine().forward_chain(kb) == 1
+    finally:
+        BuiltinPredicates.register('times', 3, [(0, 1)], BuiltinPredicates.arithmetic(operator.mul))
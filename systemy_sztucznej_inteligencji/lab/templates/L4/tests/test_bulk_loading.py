@@ -0,0 +1,62 @@
+"""
+`KnowledgeBase.add_facts` must leave the KB (facts, indexes, version)
+exactly as a loop of `add_fact` calls would, and count only the new facts.
+"""
+import random
+
+import pytest
+
+from knowledge_base import KnowledgeBase
+
+pytestmark = pytest.mark.usefixtures('solved')
+
+class Column(list):
+    """A column with `tolist()`, like a numpy array or a pandas series."""
+
+    def tolist(self):
+        return list(self)
+
+def assert_same_kb(kb, reference):
+    assert kb.facts == reference.facts
+    for predicate in ('p', 'q'):
+        for arity in (1, 2, 3):
+            assert kb.count(predicate, arity) == reference.count(predicate, arity)
+            for position in range(arity):
+                assert kb.distinct(predicate, arity, position) == reference.distinct(predicate, arity, position)
+        for a in (None, 0, 1, 'x'):
+            for b in (None, 0, 1, 'x'):
+                assert sorted(map(repr, kb.lookup(predicate, a, b))) == sorted(map(repr, reference.lookup(predicate, a, b)))
+
+def random_rows(rnd, arity):
+    values = [0, 1, 2, 'x', 'y', 1.0, True]
+    return [tuple(rnd.choice(values) for _ in range(arity)) for _ in range(rnd.randint(0, 30))]
+
+@pytest.mark.parametrize('form', ['rows', 'generator', 'columns', 'tolist columns'])
+def test_add_facts_matches_add_fact_loop(form):
+    rnd = random.Random(13)
+    for _ in range(50):
+        kb, reference = KnowledgeBase(), KnowledgeBase()
+        for args in random_rows(rnd, 2)[:5]:
+            kb.add_fact('p', *args)
+            reference.add_fact('p', *args)
+        predicate, arity = rnd.choice('pq'), rnd.randint(1, 3)
+        rows = random_rows(rnd, arity)
+        rows += rows[:rnd.randint(0, len(rows))]
+
+        before, version = len(reference.facts), kb.version
+        for args in rows:
+            reference.add_fact(predicate, *args)
+        if form == 'rows':
+            added = kb.add_facts(predicate, rows)
+        elif form == 'generator':
+            added = kb.add_facts(predicate, (list(args) for args in rows))
+        else:
+            columns = [[args[i] for args in rows] for i in range(arity)]
+            if form == 'tolist columns':
+                columns = [Column(column) for column in columns]
+            added = kb.add_facts(predicate, columns=columns) if rows else kb.add_facts(predicate, [])
+
+        assert added == len(reference.facts) - before
+        assert (kb.version > version) == (added > 0)
+        assert_same_kb(kb, reference)
+        assert kb.add_facts(predicate, rows) == 0
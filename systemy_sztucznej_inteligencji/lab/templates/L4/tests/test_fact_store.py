@@ -0,0 +1,72 @@
+"""
+A saved and reopened fact store must answer like the KnowledgeBase it was saved from.
+"""
+import random
+
+import pytest
+
+from knowledge_base import Atom, KnowledgeBase
+from inference_engine import InferenceEngine
+from fact_store import FactStore
+
+from rule_programs import PROGRAMS, build, random_edges, saturated
+
+pytestmark = pytest.mark.usefixtures('solved')
+
+@pytest.mark.parametrize('name', PROGRAMS)
+def test_fact_store_matches_knowledge_base(name, tmp_path):
+    rnd = random.Random(6)
+    engine = InferenceEngine()
+    for case in range(10):
+        edges = random_edges(rnd)
+        k = rnd.randint(0, len(edges))
+        full = saturated(name, edges)
+        part = build(name, set(edges[:k]))
+        engine.forward_chain(part, semi_naive=True)
+        for kb in (full, part):
+            kb.add_fact('num', 1, 2.5, True, 'x')
+        path = tmp_path / str(case)
+        FactStore.save(part, path, saturated=True)
+
+        mapped = FactStore.open(path)
+        assert len(mapped.facts) == len(part.facts) and set(mapped.facts) == part.facts
+        for fact in part.facts:
+            assert fact in mapped.facts
+            for mask in range(1 << len(fact.args)):
+                pattern = [arg if mask >> i & 1 else None for i, arg in enumerate(fact.args)]
+                assert (sorted(map(repr, mapped.query(fact.predicate, *pattern)))
+                        == sorted(map(repr, part.query(fact.predicate, *pattern))))
+        for a, b in edges[k:]:
+            mapped.add_fact('edge', a, b)
+        engine.forward_chain_semi_naive(mapped, delta=mapped.pending_facts())
+        assert set(mapped.facts) == full.facts
+
+        reopened = FactStore.open(path)
+        engine.forward_chain(reopened)
+        assert set(reopened.facts) == part.facts
+        mapped.close()
+        reopened.close()
+
+
+def test_fact_store_matches_equal_numbers(tmp_path):
+    values = [1, True, 1.0, 0, False, 0.0, -0.0, 2.5, 2, 'a', '1', 10, 1e20, 10 ** 20, 2 ** 53 + 1, float(2 ** 53)]
+    kb = KnowledgeBase()
+    for i, value in enumerate(values):
+        kb.add_fact('num', value, f'k{i}')
+        kb.add_fact('pair', value, value)
+    kb.add_fact('num', True, 'k0')
+    FactStore.save(kb, tmp_path)
+
+    mapped = FactStore.open(tmp_path)
+    assert len(mapped.facts) == len(kb.facts)
+    assert sorted(map(repr, mapped.facts)) == sorted(map(repr, kb.facts))
+    for value in values + [3, 'x', 1.5]:
+        for pattern in ((value, None), (None, value), (value, value)):
+            for predicate in ('num', 'pair'):
+                assert (sorted(map(repr, mapped.query(predicate, *pattern)))
+                        == sorted(map(repr, kb.query(predicate, *pattern))))
+        assert (Atom('pair', (value, value)) in mapped.facts) == (Atom('pair', (value, value)) in kb.facts)
+        mapped.add_fact('pair', value, value)
+        kb.add_fact('pair', value, value)
+        assert len(mapped.facts) == len(kb.facts)
+    mapped.close()
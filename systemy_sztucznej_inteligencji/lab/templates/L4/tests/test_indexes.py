@@ -0,0 +1,59 @@
+"""
+The fact indexes of `KnowledgeBase` must follow every change of `kb.facts`:
+`lookup`, `count` and `distinct` are compared with a scan of the facts.
+"""
+import random
+
+import pytest
+
+from knowledge_base import Atom, KnowledgeBase
+
+pytestmark = pytest.mark.usefixtures('solved')
+
+def scan(facts, predicate, *args):
+    """The facts matching a `lookup` pattern, by a linear scan."""
+    return {fact for fact in facts
+            if fact.predicate == predicate and len(fact.args) == len(args)
+            and all(arg is None or arg == value for arg, value in zip(args, fact.args))}
+
+def assert_indexes_match(kb):
+    facts = set(kb.facts)
+    for predicate in ('p', 'q'):
+        for arity in (1, 2):
+            assert kb.count(predicate, arity) == len(scan(facts, predicate, *[None] * arity))
+            for position in range(arity):
+                values = {fact.args[position] for fact in scan(facts, predicate, *[None] * arity)}
+                assert kb.distinct(predicate, arity, position) == len(values)
+    for a in (None, 0, 1, 2):
+        assert set(kb.lookup('p', a)) == scan(facts, 'p', a)
+        for b in (None, 0, 1, 2):
+            assert set(kb.lookup('p', a, b)) == scan(facts, 'p', a, b)
+            assert set(kb.lookup('q', a, b)) == scan(facts, 'q', a, b)
+            assert sorted(kb.query('p', a, b)) == sorted(fact.args for fact in scan(facts, 'p', a, b))
+
+def random_atom(rnd):
+    return Atom(rnd.choice('pq'), tuple(rnd.randrange(3) for _ in range(rnd.randint(1, 2))))
+
+def test_indexes_follow_every_set_operation():
+    rnd = random.Random(2)
+    kb = KnowledgeBase()
+    operations = [
+        lambda: kb.add_fact(rnd.choice('pq'), *[rnd.randrange(3) for _ in range(rnd.randint(1, 2))]),
+        lambda: kb.facts.add(random_atom(rnd)),
+        lambda: kb.facts.discard(random_atom(rnd)),
+        lambda: kb.facts.remove(rnd.choice(sorted(kb.facts, key=repr))) if kb.facts else None,
+        lambda: kb.facts.pop() if kb.facts else None,
+        lambda: kb.facts.update({random_atom(rnd) for _ in range(3)}),
+        lambda: kb.facts.difference_update({random_atom(rnd) for _ in range(3)}),
+        lambda: kb.facts.intersection_update({random_atom(rnd) for _ in range(20)}),
+        lambda: kb.facts.symmetric_difference_update({random_atom(rnd) for _ in range(3)}),
+        lambda: kb.facts.__ior__({random_atom(rnd)}),
+        lambda: kb.facts.__isub__({random_atom(rnd)}),
+        lambda: kb.facts.__ixor__({random_atom(rnd)}),
+        lambda: setattr(kb, 'facts', {random_atom(rnd) for _ in range(5)}),
+    ]
+    for step in range(600):
+        rnd.choice(operations)()
+        if step % 97 == 96:
+            kb.facts.clear()
+        assert_indexes_match(kb)
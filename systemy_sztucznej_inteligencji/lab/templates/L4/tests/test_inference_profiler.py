@@ -0,0 +1,108 @@
+"""
+A profiled run must derive what an unprofiled one derives, its per-rule
+counters must add up, and `explain` must lead every derived fact back to
+stored facts through real rule applications.
+"""
+import json
+import random
+
+import pytest
+
+from knowledge_base import Atom, KnowledgeBase
+from inference_engine import InferenceEngine
+from builtin_predicates import BuiltinPredicates
+from inference_profiler import InferenceProfiler
+
+from rule_programs import PROGRAMS, build, random_edges
+
+pytestmark = pytest.mark.usefixtures('solved')
+
+def walk(tree):
+    """Every node of an `explain` tree (shared subtrees once)."""
+    seen, stack = {}, [tree]
+    while stack:
+        node = stack.pop()
+        if id(node) not in seen:
+            seen[id(node)] = node
+            stack.extend(node.get('premises', ()))
+    return list(seen.values())
+
+@pytest.mark.parametrize('semi_naive', [False, True])
+@pytest.mark.parametrize('name', PROGRAMS)
+def test_profiled_run_counts_and_explains_every_fact(name, semi_naive):
+    rnd = random.Random(5)
+    engine = InferenceEngine()
+    for _ in range(15):
+        edges = set(random_edges(rnd))
+        plain, profiled = build(name, edges), build(name, edges)
+        stored = set(profiled.facts)
+        profiler = InferenceProfiler(provenance=True)
+        derived = engine.forward_chain(profiled, profiler=profiler, semi_naive=semi_naive)
+        assert derived == engine.forward_chain(plain) and profiled.facts == plain.facts
+
+        assert sum(record['derived'] for record in profiler.records) == derived == len(profiler.derivations)
+        if not semi_naive:
+            rounds = max(record['iteration'] for record in profiler.records) + 1
+            assert len(profiler.records) == rounds * len(profiled.rules)
+        per_rule = {}
+        for rule, _ in profiler.derivations.values():
+            per_rule[rule] = per_rule.get(rule, 0) + 1
+        summary = profiler.summary()
+        assert {row['rule']: row['derived'] for row in summary if row['derived']} == per_rule
+        assert [row['seconds'] for row in summary] == sorted((row['seconds'] for row in summary), reverse=True)
+        assert len(profiler.report().splitlines()) == len(summary) + 1
+
+        for fact in profiled.facts:
+            tree = profiler.explain(fact)
+            assert tree['fact'] == fact
+            for node in walk(tree):
+                if 'rule' not in node:
+                    assert node['fact'] in stored
+                    continue
+                rule = profiled.rules[node['rule']]
+                body = [atom for atom in rule.body if not BuiltinPredicates.is_builtin(atom)]
+                assert [premise['fact'] for premise in node['premises']] == list(profiler.derivations[node['fact']][1])
+                bindings = {}
+                for atom, premise in zip(body, node['premises']):
+                    bindings = engine.unify_atoms(atom, premise['fact'], bindings)
+                    assert bindings is not None
+                if len(body) == len(rule.body):
+                    assert engine.substitute(rule.head, bindings) == node['fact']
+
+def test_explain_follows_long_chains_and_shares_subtrees():
+    kb = KnowledgeBase()
+    kb.add_fact('s', 0)
+    for i in range(3000):
+        kb.add_fact('next', i, i + 1)
+    kb.add_rule(Atom('s', ('?y',)), [Atom('s', ('?x',)), Atom('next', ('?x', '?y'))])
+    profiler = InferenceProfiler(provenance=True)
+    InferenceEngine().forward_chain(kb, profiler=profiler, semi_naive=True)
+    tree, depth = profiler.explain(Atom('s', (3000,))), 0
+    while 'rule' in tree:
+        tree, depth = tree['premises'][0], depth + 1
+    assert depth == 3000 and tree == {'fact': Atom('s', (0,))}
+
+    kb = KnowledgeBase()
+    kb.add_fact('a', 1)
+    kb.add_rule(Atom('b', ('?x',)), [Atom('a', ('?x',))])
+    kb.add_rule(Atom('c', ('?x',)), [Atom('b', ('?x',)), Atom('b', ('?x',))])
+    profiler = InferenceProfiler(provenance=True)
+    InferenceEngine().forward_chain(kb, profiler=profiler)
+    tree = profiler.explain(Atom('c', (1,)))
+    assert tree['premises'][0] is tree['premises'][1] and tree['premises'][0]['rule'] == 0
+
+def test_json_export_round_trips(tmp_path):
+    kb = build('right_recursive', {('n0', 'n1'), ('n1', 'n2'), ('n2', 'n0')})
+    profiler = InferenceProfiler(provenance=True)
+    InferenceEngine().forward_chain(kb, profiler=profiler)
+    profiler.save_json(tmp_path / 'profile.json')
+    with open(tmp_path / 'profile.json', encoding='utf-8') as source:
+        saved = json.load(source)
+    assert saved == json.loads(profiler.to_json())
+    assert saved['records'] == profiler.records and saved['summary'] == profiler.summary()
+    assert ({(entry['fact'][0], tuple(entry['fact'][1])) for entry in saved['provenance']}
+            == {(fact.predicate, fact.args) for fact in profiler.derivations})
+    for entry in saved['provenance']:
+        rule, premises = profiler.derivations[Atom(entry['fact'][0], tuple(entry['fact'][1]))]
+        assert entry['rule'] == rule
+        assert entry['premises'] == [[p.predicate, list(p.args)] for p in premises]
@@ -0,0 +1,23 @@
+"""
+Magic-sets queries must answer what a full saturation answers, without modifying the KB.
+"""
+import random
+
+import pytest
+
+from magic_sets import MagicSets
+
+from rule_programs import PROGRAMS, build, random_edges, saturated, patterns
+
+pytestmark = pytest.mark.usefixtures('solved')
+
+@pytest.mark.parametrize('name', PROGRAMS)
+def test_magic_sets_match_saturation(name):
+    rnd = random.Random(4)
+    for _ in range(25):
+        edges = set(random_edges(rnd, nodes=8, edges=14))
+        reference = saturated(name, edges)
+        kb = build(name, edges)
+        for predicate, pattern in patterns(rnd, reference, [('path', 2)], 3):
+            assert sorted(MagicSets.query(kb, predicate, *pattern)) == sorted(reference.query(predicate, *pattern))
+        assert len(kb.facts) == len(edges)
@@ -0,0 +1,62 @@
+"""
+The parallel engine must derive what the serial engine derives, for 1 and 2
+processes, and raise the errors the serial engine raises.
+"""
+import multiprocessing
+import random
+
+import pytest
+
+from knowledge_base import Atom, KnowledgeBase
+from inference_engine import InferenceEngine
+from builtin_predicates import BuiltinPredicates
+from parallel_inference import ParallelInferenceEngine
+
+from rule_programs import PROGRAMS, build, random_edges
+
+pytestmark = pytest.mark.usefixtures('solved')
+
+@pytest.mark.parametrize('processes, split_threshold, cases', [(1, 2048, 20), (2, 4, 4)])
+@pytest.mark.parametrize('name', PROGRAMS)
+def test_parallel_matches_naive(name, processes, split_threshold, cases):
+    rnd = random.Random(5)
+    for _ in range(cases):
+        edges = set(random_edges(rnd))
+        naive, parallel = build(name, edges), build(name, edges)
+        derived = ParallelInferenceEngine(processes, split_threshold).forward_chain(parallel)
+        assert derived == InferenceEngine().forward_chain(naive)
+        assert set(parallel.facts) == naive.facts
+
+def unbound_builtin_kb():
+    kb = KnowledgeBase()
+    kb.add_fact('v', 1)
+    kb.add_rule(Atom('bad', ('?x',)), [Atom('v', ('?x',)), Atom('lt', ('?x', '?z'))])
+    return kb
+
+def failing_solver(args):
+    raise KeyError(args)
+
+@pytest.mark.parametrize('processes', [1, 2])
+def test_parallel_raises_the_serial_errors(processes):
+    with pytest.raises(ValueError) as serial:
+        InferenceEngine().forward_chain(unbound_builtin_kb())
+    with pytest.raises(ValueError) as parallel:
+        ParallelInferenceEngine(processes).forward_chain(unbound_builtin_kb())
+    assert str(parallel.value) == str(serial.value)
+
+@pytest.mark.parametrize('processes', [1, 2])
+def test_worker_errors_reach_the_caller(processes):
+    if processes > 1 and multiprocessing.get_start_method() != 'fork':
+        pytest.skip("spawned workers do not see built-ins registered by the test")
+    BuiltinPredicates.register('fails', 1, [(0,)], failing_solver)
+    try:
+        kb = KnowledgeBase()
+        kb.add_fact('v', 1)
+        kb.add_rule(Atom('bad', ('?x',)), [Atom('v', ('?x',)), Atom('fails', ('?x',))])
+        with pytest.raises(KeyError):
+            InferenceEngine().forward_chain(kb)
+        with pytest.raises(KeyError):
+            ParallelInferenceEngine(processes, split_threshold=0).forward_chain(kb)
+        assert multiprocessing.active_children() == []
+    finally:
+        BuiltinPredicates.unregister('fails', 1)
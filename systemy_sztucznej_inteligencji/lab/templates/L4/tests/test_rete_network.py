@@ -0,0 +1,24 @@
+"""
+Facts added through the Rete network must end in the same closure as a full saturation.
+"""
+import random
+
+import pytest
+
+from rete_network import ReteNetwork
+
+from rule_programs import PROGRAMS, build, random_edges, saturated
+
+pytestmark = pytest.mark.usefixtures('solved')
+
+@pytest.mark.parametrize('name', PROGRAMS)
+def test_rete_matches_saturation(name):
+    rnd = random.Random(2)
+    for _ in range(30):
+        edges = random_edges(rnd)
+        k = rnd.randint(0, len(edges))
+        kb = build(name, set(edges[:k]))
+        network = ReteNetwork(kb)
+        for a, b in edges[k:]:
+            assert all(fact in kb.facts for fact in network.add_fact('edge', a, b))
+        assert set(kb.facts) == saturated(name, edges).facts
@@ -0,0 +1,21 @@
+"""
+Semi-naive forward chaining must derive exactly what naive forward chaining derives.
+"""
+import random
+
+import pytest
+
+from inference_engine import InferenceEngine
+
+from rule_programs import PROGRAMS, build, random_edges
+
+pytestmark = pytest.mark.usefixtures('solved')
+
+@pytest.mark.parametrize('name', PROGRAMS)
+def test_semi_naive_matches_naive(name):
+    rnd = random.Random(1)
+    for _ in range(30):
+        edges = set(random_edges(rnd))
+        naive, semi = build(name, edges), build(name, edges)
+        assert InferenceEngine().forward_chain(naive) == InferenceEngine().forward_chain(semi, semi_naive=True)
+        assert naive.facts == semi.facts
@@ -0,0 +1,60 @@
+"""
+Tabled queries must answer what a full saturation answers, also after the KB changes.
+"""
+import random
+
+import pytest
+
+from knowledge_base import Atom, KnowledgeBase
+from tabled_query_engine import TabledQueryEngine
+
+from rule_programs import PROGRAMS, build, random_edges, saturated, patterns
+
+pytestmark = pytest.mark.usefixtures('solved')
+
+@pytest.mark.parametrize('name', PROGRAMS)
+def test_tabled_queries_match_saturation(name):
+    rnd = random.Random(3)
+    for _ in range(30):
+        edges = set(random_edges(rnd, nodes=8, edges=14))
+        reference = saturated(name, edges)
+        kb, engine = build(name, edges), TabledQueryEngine()
+        for predicate, pattern in patterns(rnd, reference, [('path', 2), ('gp', 2)], 4):
+            assert sorted(engine.query(kb, predicate, *pattern)) == sorted(reference.query(predicate, *pattern))
+        assert len(kb.facts) == len(edges)
+
+
+@pytest.mark.parametrize('name', PROGRAMS)
+def test_tabled_queries_follow_kb_changes(name):
+    rnd = random.Random(9)
+    kb, engine, edges = build(name, set()), TabledQueryEngine(), set()
+    for _ in range(40):
+        if edges and rnd.random() < 0.5:
+            old = rnd.choice(sorted(edges))
+            edges.discard(old)
+            kb.facts.discard(Atom('edge', old))
+        edge = (f'n{rnd.randrange(6)}', f'n{rnd.randrange(6)}')
+        edges.add(edge)
+        kb.add_fact('edge', *edge)
+        reference = saturated(name, edges)
+        for predicate, arity in [('path', 2), ('gp', 2), ('sib', 2), ('len', 3)]:
+            pattern = tuple(rnd.choice([None, f'n{rnd.randrange(6)}']) for _ in range(arity))
+            assert sorted(engine.query(kb, predicate, *pattern)) == sorted(reference.query(predicate, *pattern))
+
+
+def test_kb_version_grows_with_every_change():
+    kb = KnowledgeBase()
+    versions = [kb.version]
+    kb.add_fact('a', 1)
+    versions.append(kb.version)
+    kb.add_fact('a', 1)
+    assert kb.version == versions[-1]
+    kb.add_rule(Atom('b', ('?x',)), [Atom('a', ('?x',))])
+    versions.append(kb.version)
+    kb.rules[0] = kb.rules[0]
+    versions.append(kb.version)
+    kb.facts = set(kb.facts)
+    versions.append(kb.version)
+    kb.add_facts('c', [(1,), (2,)])
+    versions.append(kb.version)
+    assert versions == sorted(set(versions))
@@ -0,0 +1,326 @@
+import numpy as np
+
+from graph import Graph
+from maze import Maze
+from compiled_graph import CompiledGraph
+
+class ArrayMaze(Maze):
+    """
+    A `Maze` stored in NumPy arrays instead of a list of lists of characters.
+
+    Arrays
+    ------
+    codes    : uint8[rows, cols]   byte code of every tile (ord of the char)
+    passable : bool[rows, cols]    True where the tile is not a wall
+    costs    : int64/float64[rows, cols]
+                                   enter-cost of every tile (from `cost_of`,
+                                   default 1; walls hold 0)
+
+    Everything that `Maze` does per cell in Python is done on whole arrays:
+    start/goal lookup, `to_csr` (all edges at once, no sorting) and the edge
+    computation of `to_graph`. `in_bounds`, `is_passable` and `neighbors4`
+    behave exactly like in `Maze`, so the class can be used anywhere a Maze
+    is expected.
+
+    Tile characters must be single bytes (code points 0-255).
+
+    Example
+    -------
+    >>> mz = ArrayMaze.from_lines(open('map.txt'), cost_of={'m': 5})
+    >>> cg = mz.to_csr()                 # CompiledGraph, nodes are (row, col)
+    >>> Search.dijkstra_compiled(cg, mz.start, mz.goal)['cost']
+    """
+
+    DIRECTIONS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+    def __init__(self, grid, start_char='S', goal_char='G', wall_char='#', cost_of=None):
+        """
+        Build the arrays from a rectangular grid.
+
+        Parameters
+        ----------
+        grid : list or numpy.ndarray
+            A list of rows (each a list of 1-char strings or a str), or a 2-D
+            uint8 array of tile codes.
+        start_char, goal_char, wall_char, cost_of :
+            As for `Maze`.
+
+        Raises
+        ------
+        TypeError
+            If `grid` is neither a list nor an array.
+        ValueError
+            If `grid` is not rectangular, or holds a char outside 0-255.
+        """
+        if isinstance(grid, np.ndarray):
+            if grid.ndim != 2:
+                raise ValueError("grid must be a 2-D array of tile codes")
+            codes = grid.astype(np.uint8, copy=False)
+        elif isinstance(grid, list):
+            cols = len(grid[0]) if grid else 0
+            for row in grid:
+                if len(row) != cols:
+                    raise ValueError("grid must be rectangular (all rows same length)")
+            try:
+                data = ''.join(row if isinstance(row, str) else ''.join(row) for row in grid).encode('latin-1')
+            except UnicodeEncodeError:
+                raise ValueError("ArrayMaze tiles must be single-byte characters") from None
+            codes = np.frombuffer(bytearray(data), dtype=np.uint8).reshape(len(grid), cols)
+        else:
+            raise TypeError("grid must be a list of lists of chars or a uint8 array")
+
+        self.codes = codes
+        self.rows, self.cols = codes.shape
+        self.start_char = start_char
+        self.goal_char = goal_char
+        self.wall_char = wall_char
+        self.cost_of = dict(cost_of or {})
+        self.cost_of.setdefault(self.start_char, 1)
+        self.cost_of.setdefault(self.goal_char, 1)
+
+        self.passable = codes != ord(wall_char)
+        self.costs = self._cost_table()[codes]
+        self._grid = None
+
+        self.start = None
+        self.goal = None
+        self._scan_start_goal()
+
+    @staticmethod
+    def from_lines(lines, start_char='S', goal_char='G', wall_char='#', cost_of=None):
+        """
+        Build an ArrayMaze from text lines (e.g. an open file).
+
+        Line endings are stripped and trailing empty lines ignored. Lines
+        may be str or bytes.
+        """
+        rows = []
+        for line in lines:
+            if isinstance(line, bytes):
+                line = line.decode('latin-1')
+            rows.append(line.rstrip('\r\n'))
+        while rows and not rows[-1]:
+            rows.pop()
+        return ArrayMaze(rows, start_char, goal_char, wall_char, cost_of)
+
+    def _cost_table(self):
+        """Enter-cost of every byte code (walls 0)."""
+        table = np.ones(256, dtype=np.asarray(list(self.cost_of.values()) + [1]).dtype)
+        for ch, cost in self.cost_of.items():
+            table[ord(ch)] = cost
+        table[ord(self.wall_char)] = 0
+        return table
+
+    def set_tile(self, r, c, ch):
+        """Change the tile at (r, c) to `ch`, keeping all arrays in sync."""
+        self.codes[r, c] = ord(ch)
+        self.passable[r, c] = ch != self.wall_char
+        self.costs[r, c] = self._cost_table()[ord(ch)]
+        if self._grid is not None:
+            self._grid[r][c] = ch
+
+    def set_costs(self, cost_of):
+        """Update `cost_of` (char -> enter-cost) and recompute `costs`."""
+        self.cost_of.update(cost_of)
+        self.costs = self._cost_table()[self.codes]
+
+    @property
+    def grid(self):
+        """
+        The tiles as a list of lists of chars (built on first access).
+
+        Read-only: change tiles with `set_tile` so the arrays stay in sync.
+        """
+        if self._grid is None:
+            self._grid = [list(row.tobytes().decode('latin-1')) for row in self.codes]
+        return self._grid
+
+    def _scan_start_goal(self):
+        """First (row-major) occurrence of start_char / goal_char, vectorized."""
+        flat = self.codes.ravel()
+        for attr, ch in (('start', self.start_char), ('goal', self.goal_char)):
+            found = np.flatnonzero(flat == ord(ch))
+            if len(found):
+                setattr(self, attr, divmod(int(found[0]), self.cols))
+
+    def is_passable(self, r, c):
+        """True if (r, c) is in bounds and not a wall."""
+        return self.in_bounds(r, c) and bool(self.passable[r, c])
+
+    def neighbors4(self, r, c):
+        """Passable 4-neighbors of (r, c): up, down, left, right."""
+        for dr, dc in self.DIRECTIONS:
+            nr, nc = r + dr, c + dc
+            if self.in_bounds(nr, nc) and self.passable[nr, nc]:
+                yield (nr, nc)
+
+    def csr_arrays(self):
+        """
+        All edges of the maze graph as CSR arrays, computed in bulk.
+
+        Returns
+        -------
+        cells : int64[n]
+            Flat cell index (row * cols + col) of every node; nodes are the
+            passable cells in row-major order.
+        indptr : int64[n + 1]
+        indices : int32/int64[m]
+            Target node of every edge; the edges of a node are ordered up,
+            down, left, right like `neighbors4`.
+        weights : array[m]
+            Enter-cost of the target cell.
+        """
+        cells = np.flatnonzero(self.passable)
+        n = len(cells)
+        index_type = np.int32 if n < 2 ** 31 else np.int64
+        # work on a copy padded with a border of walls: no bounds checks, and
+        # its flat indices come straight from flatnonzero (no division)
+        width = self.cols + 2
+        bordered = np.zeros((self.rows + 2, width), dtype=bool)
+        bordered[1:-1, 1:-1] = self.passable
+        padded = np.flatnonzero(bordered)
+        node_of = np.full(bordered.size, -1, dtype=index_type)
+        node_of[padded] = np.arange(n, dtype=index_type)
+        steps = np.array([dr * width + dc for dr, dc in self.DIRECTIONS], dtype=padded.dtype)
+        # row i holds the up/down/left/right neighbors of node i (-1 = wall),
+        # so the row-major order of the valid entries is already CSR order
+        targets = node_of[padded[:, None] + steps]
+        degree = np.zeros(self.passable.shape, dtype=np.int8)
+        for dr, dc in self.DIRECTIONS:
+            degree += bordered[1 + dr:self.rows + 1 + dr, 1 + dc:self.cols + 1 + dc]
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(degree[self.passable], out=indptr[1:])
+        indices = targets[targets >= 0]
+        weights = self.costs.ravel()[cells][indices]
+        return cells, indptr, indices, weights
+
+    def node_ids(self, cells):
+        """(row, col) tuples of flat cell indices."""
+        rows, cols = np.divmod(np.asarray(cells), self.cols)
+        return list(zip(rows.tolist(), cols.tolist()))
+
+    def to_csr(self):
+        """
+        The maze graph as a `CompiledGraph` with (row, col) node ids.
+
+        The node ids stay flat cell indices underneath: `ids` and `index`
+        are views over the `cells` array that build a (row, col) tuple only
+        when one is read, so compiling a map of millions of cells costs
+        the NumPy work of `csr_arrays` and no per-node Python objects.
+        """
+        cells, indptr, indices, weights = self.csr_arrays()
+        return CompiledGraph(_CellIds(cells, self.cols), indptr, indices, weights,
+                             _CellIndex(cells, self.rows, self.cols))
+
+    def to_graph(self):
+        """
+        The maze graph as a `Graph`, same nodes and edges as `Maze.to_graph`.
+
+        The edges are computed in bulk (`csr_arrays`); only the insertion
+        into the Graph runs per edge.
+        """
+        cells, indptr, indices, weights = self.csr_arrays()
+        ids = self.node_ids(cells)
+        graph = Graph()
+        for node in ids:
+            graph.add_node(node)
+        sources = np.repeat(np.arange(len(ids)), np.diff(indptr)).tolist()
+        for u, v, cost in zip(sources, indices.tolist(), weights.tolist()):
+            graph.add_edge(ids[u], ids[v], cost)
+        return graph
+
+class _CellIds:
+    """
+    Read-only sequence of (row, col) node ids over sorted flat cell indices.
+
+    Stands in for the list of tuples in `CompiledGraph.ids`; a tuple is
+    built only when an id is read.
+    """
+
+    def __init__(self, cells, cols):
+        self.cells = cells
+        self.cols = cols
+
+    def __len__(self):
+        return len(self.cells)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [divmod(cell, self.cols) for cell in self.cells[i].tolist()]
+        return divmod(int(self.cells[i]), self.cols)
+
+    def __iter__(self):
+        cols = self.cols
+        for start in range(0, len(self.cells), 65536):
+            for cell in self.cells[start:start + 65536].tolist():
+                yield divmod(cell, cols)
+
+class _CellIndex:
+    """
+    Read-only mapping (row, col) -> node index over sorted flat cell indices.
+
+    Stands in for the dict in `CompiledGraph.index`; a lookup is a binary
+    search in `cells` instead of a hash of a tuple.
+    """
+
+    def __init__(self, cells, rows, cols):
+        self.cells = cells
+        self.rows = rows
+        self.cols = cols
+
+    def get(self, node, default=None):
+        """Node index of `node`, or `default` if it is not a passable cell."""
+        try:
+            r, c = node
+            if not (0 <= r < self.rows and 0 <= c < self.cols):
+                return default
+        except (TypeError, ValueError):
+            return default
+        cell = r * self.cols + c
+        i = int(np.searchsorted(self.cells, cell))
+        if i < len(self.cells) and self.cells[i] == cell:
+            return i
+        return default
+
+    def __getitem__(self, node):
+        i = self.get(node)
+        if i is None:
+            raise KeyError(node)
+        return i
+
+    def __contains__(self, node):
+        return self.get(node) is not None
+
+    def __len__(self):
+        return len(self.cells)
+
+    def __iter__(self):
+        return iter(_CellIds(self.cells, self.cols))
+
+class StudentID:
+    """
+    Utility class for identifying the student.
+
+    Each student must replace the placeholder return value
+    in the `get_ID` method with their own unique student ID.
+    """
+
+    @staticmethod
+    def get_ID():
+        """
+        Return the student ID as a string.
+
+        Returns
+        -------
+        str
+            The student ID. Each student must replace "student_ID" with their own ID.
+
+        Examples
+        --------
+        >>> StudentID.get_ID()
+        '123456'
+        """
+        # TODO - BLOCK START
+        # TASK#1
+        return "student_ID"
+        # TODO - BLOCK END
@@ -0,0 +1,246 @@
+import json
+
+import numpy as np
+
+class CompiledGraph:
+    """
+    Frozen, compressed sparse row (CSR) form of a `Graph`.
+
+    What it models
+    --------------
+    The same directed, weighted graph as `Graph`, but read-only and packed
+    into three flat NumPy arrays instead of a dict of lists of tuples:
+
+        ids      : sequence        index i -> original node id (e.g. (r, c))
+        index    : mapping         original node id -> index i
+        indptr   : int64[n + 1]    edges of node i are positions indptr[i]:indptr[i+1]
+        indices  : int32/int64[m]  target node index of every edge
+        weights  : int64/float64[m] cost of every edge (int64 if all costs are ints)
+
+    Why
+    ---
+    A `Graph` of a million-node road map holds one list plus one tuple per
+    edge and one boxed number per cost. The CSR arrays need 12-16 bytes per
+    edge and keep the edges of a node contiguous in memory.
+
+    Compatibility
+    -------------
+    `neighbors(u)`, `nodes()` and `edges()` behave like the `Graph` methods
+    (same node ids, same (neighbor, cost) order), so `Search.dijkstra` and
+    `Search.astar` run on a CompiledGraph unchanged. For speed, use
+    `Search.dijkstra_compiled` / `Search.astar_compiled`, which work on the
+    integer indices directly.
+
+    Doctest-style examples
+    ----------------------
+    >>> g = Graph()
+    >>> g.add_edge('A', 'B'); g.add_edge('B', 'C', 3)
+    >>> cg = CompiledGraph.from_graph(g)
+    >>> cg.neighbors('B')
+    [('C', 3)]
+    >>> cg.index['B'], cg.indptr.tolist(), cg.indices.tolist()
+    (1, [0, 1, 2, 2], [1, 2])
+    """
+
+    def __init__(self, ids, indptr, indices, weights, index=None):
+        """
+        Wrap ready CSR arrays (see `from_graph` / `from_edges` for building them).
+
+        Parameters
+        ----------
+        ids : sequence
+            Node ids; position = node index.
+        indptr, indices, weights : array-like
+            CSR arrays as described in the class docstring.
+        index : mapping or None
+            Node id -> node index. If given, `ids` is kept as passed instead
+            of being copied into a list, so a lazy id sequence (such as the
+            one `ArrayMaze.to_csr` passes) never turns into millions of
+            Python objects. If None, a list and a dict are built from `ids`.
+
+        Attributes
+        ----------
+        _reverse : CompiledGraph or None
+            Cached transposed graph (see `reverse`).
+        """
+        if index is None:
+            self.ids = list(ids)
+            self.index = {node: i for i, node in enumerate(self.ids)}
+        else:
+            self.ids = ids
+            self.index = index
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        index_type = np.int32 if len(self.ids) < 2 ** 31 else np.int64
+        self.indices = np.asarray(indices, dtype=index_type)
+        self.weights = np.asarray(weights)
+        if self.weights.dtype.kind not in 'iuf':
+            self.weights = self.weights.astype(np.float64)
+        self._reverse = None
+
+    @staticmethod
+    def from_graph(graph):
+        """
+        Compile any object with `nodes()` and `neighbors(u)` (e.g. a `Graph`).
+
+        Node indices follow the order of `graph.nodes()`; neighbors that are
+        not listed there are appended. The order of each node's edges is kept.
+        """
+        ids = list(graph.nodes())
+        index = {node: i for i, node in enumerate(ids)}
+        indptr = [0]
+        indices = []
+        weights = []
+        for u in ids:
+            for item in graph.neighbors(u):
+                if isinstance(item, tuple) and len(item) == 2:
+                    v, cost = item
+                else:
+                    v, cost = item, 1
+                i = index.get(v)
+                if i is None:
+                    i = index[v] = len(ids)
+                    ids.append(v)
+                indices.append(i)
+                weights.append(cost)
+            indptr.append(len(indices))
+        indptr.extend([len(indices)] * (len(ids) + 1 - len(indptr)))
+        return CompiledGraph(ids, indptr, indices, weights or np.zeros(0, dtype=np.int64))
+
+    @staticmethod
+    def from_edges(ids, sources, targets, weights, index=None):
+        """
+        Build a CSR graph from parallel edge arrays of node *indices*.
+
+        Parameters
+        ----------
+        ids : sequence
+            Node ids (n of them).
+        sources, targets : array-like of int
+            Edge endpoints as indices into `ids`.
+        weights : array-like
+            Edge costs.
+        index : mapping or None
+            Node id -> node index, passed on to `CompiledGraph`.
+
+        Edges keep their relative order within each source node (stable sort).
+        """
+        sources = np.asarray(sources, dtype=np.int64)
+        order = np.argsort(sources, kind='stable')
+        counts = np.bincount(sources, minlength=len(ids))
+        indptr = np.zeros(len(ids) + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+        return CompiledGraph(ids, indptr, np.asarray(targets)[order], np.asarray(weights)[order], index)
+
+    @staticmethod
+    def ids_to_json(ids):
+        """
+        Node ids as a JSON string, for the `.npz` files of the search indexes
+        (`ContractionHierarchy.save`, `Landmarks.save`). Tuples become lists.
+        """
+        return json.dumps(list(ids))
+
+    @staticmethod
+    def ids_from_json(text):
+        """Inverse of `ids_to_json`: lists (e.g. [row, col]) come back as tuples."""
+        def restore(value):
+            if isinstance(value, list):
+                return tuple(restore(item) for item in value)
+            return value
+
+        return [restore(node) for node in json.loads(text)]
+
+    def __len__(self):
+        """Number of nodes."""
+        return len(self.ids)
+
+    @property
+    def num_edges(self):
+        """Number of directed edges."""
+        return len(self.indices)
+
+    @property
+    def nbytes(self):
+        """Bytes held by the CSR arrays (ids and the index dict not included)."""
+        return self.indptr.nbytes + self.indices.nbytes + self.weights.nbytes
+
+    def nodes(self):
+        """All node ids, in index order."""
+        return list(self.ids)
+
+    def neighbors(self, u):
+        """
+        Outgoing (neighbor, cost) pairs of node id `u`, like `Graph.neighbors`.
+
+        Unknown nodes have no neighbors.
+        """
+        i = self.index.get(u)
+        if i is None:
+            return []
+        start, end = self.indptr[i], self.indptr[i + 1]
+        ids = self.ids
+        return [(ids[j], cost) for j, cost in zip(self.indices[start:end].tolist(),
+                                                 self.weights[start:end].tolist())]
+
+    def neighbors_index(self, i):
+        """Integer path: (target indices, costs) array slices of node index `i`."""
+        start, end = self.indptr[i], self.indptr[i + 1]
+        return self.indices[start:end], self.weights[start:end]
+
+    def edges(self):
+        """All edges as (u, v, cost) triples of node ids, like `Graph.edges`."""
+        ids = self.ids
+        sources = np.repeat(np.arange(len(ids)), np.diff(self.indptr)).tolist()
+        return [(ids[u], ids[v], cost) for u, v, cost in zip(sources, self.indices.tolist(),
+                                                             self.weights.tolist())]
+
+    def adjacency_views(self):
+        """
+        (indptr, indices, weights) as memoryviews of the CSR arrays.
+
+        Indexing a memoryview from pure Python code returns plain ints /
+        floats and is almost as cheap as indexing a list, while indexing a
+        NumPy array boxes a NumPy scalar each time. The views share the
+        arrays' memory, so the search loops read them without any copy.
+        """
+        return memoryview(self.indptr), memoryview(self.indices), memoryview(self.weights)
+
+    def reverse(self):
+        """
+        The transposed graph (every edge u -> v becomes v -> u, same cost),
+        with the same node indices (and the same `ids` / `index` objects).
+        Built on first use and cached.
+        """
+        if self._reverse is None:
+            sources = np.repeat(np.arange(len(self.ids)), np.diff(self.indptr))
+            self._reverse = CompiledGraph.from_edges(self.ids, self.indices, sources, self.weights,
+                                                     self.index)
+            self._reverse._reverse = self
+        return self._reverse
+
+class StudentID:
+    """
+    Utility class for identifying the student.
+
+    Each student must replace the placeholder return value
+    in the `get_ID` method with their own unique student ID.
+    """
+
+    @staticmethod
+    def get_ID():
+        """
+        Return the student ID as a string.
+
+        Returns
+        -------
+        str
+            The student ID. Each student must replace "student_ID" with their own ID.
+
+        Examples
+        --------
+        >>> StudentID.get_ID()
+        '123456'
+        """
+        # TODO - BLOCK START
+        # TASK#1
+        return "student_ID"
+        # TODO - BLOCK END
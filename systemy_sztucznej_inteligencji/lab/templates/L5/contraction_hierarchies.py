@@ -0,0 +1,375 @@
+import heapq
+
+import numpy as np
+
+from compiled_graph import CompiledGraph
+
+class ContractionHierarchy:
+    """
+    Contraction Hierarchies (CH): preprocess a static graph once, then answer
+    point-to-point shortest-path queries by exploring only a few hundred nodes.
+
+    Preprocessing
+    -------------
+    Nodes are *contracted* one by one, cheapest first. Contracting v removes
+    it from the remaining graph; for every pair u -> v -> x whose path
+    through v is the only shortest one (no *witness* path u ~> x avoiding v
+    is found by a small local Dijkstra), a *shortcut* edge u -> x with the
+    same cost is added. The contraction order is the node *rank*.
+
+    The cost of contracting v is its *edge difference*
+        (shortcuts needed) - (edges removed) + (neighbors already contracted),
+    kept in a priority queue with *lazy updates*: the cheapest node is
+    re-evaluated when popped and put back if it is no longer the cheapest.
+    Neighbors of a contracted node are re-evaluated right away.
+
+    Query
+    -----
+    Every edge (original or shortcut) leads either *up* (to a higher rank) or
+    *down*. A shortest path always climbs and then descends, so the query
+    runs Dijkstra forward from `start` on up-edges and backward from `goal`
+    on reversed down-edges; the best meeting node gives the cost. Each
+    shortcut remembers the node it bypasses, which is used to unpack the
+    path into original edges.
+
+    Example
+    -------
+    >>> ch = ContractionHierarchy.build(maze.to_graph())
+    >>> res = ch.query(maze.start, maze.goal)     # same dict as Search.dijkstra
+    >>> ch.save('maze_ch.npz')
+    >>> ContractionHierarchy.load('maze_ch.npz').query(maze.start, maze.goal)['cost']
+    """
+
+    def __init__(self, ids, rank, up, down):
+        """
+        Wrap a ready index (see `build` / `load`).
+
+        Parameters
+        ----------
+        ids : sequence
+            Node ids; position = node index.
+        rank : array-like of int
+            Contraction order of every node index.
+        up : tuple of 4 arrays
+            CSR (indptr, indices, weights, middle) of the upward edges
+            u -> x, rank[u] < rank[x], grouped by u.
+        down : tuple of 4 arrays
+            CSR (indptr, indices, weights, middle) of the downward edges
+            u -> x, rank[u] > rank[x], grouped by x (indices hold u).
+
+        `middle` is the bypassed node index of a shortcut, -1 for an
+        original edge.
+        """
+        self.ids = list(ids)
+        self.index = {node: i for i, node in enumerate(self.ids)}
+        self.rank = np.asarray(rank, dtype=np.int64)
+        self.up = tuple(np.asarray(a) for a in up)
+        self.down = tuple(np.asarray(a) for a in down)
+        self._up = tuple(a.tolist() for a in self.up)
+        self._down = tuple(a.tolist() for a in self.down)
+
+    def __len__(self):
+        """Number of nodes."""
+        return len(self.ids)
+
+    @property
+    def num_shortcuts(self):
+        """Number of shortcut edges added by the preprocessing."""
+        return int((self.up[3] >= 0).sum() + (self.down[3] >= 0).sum())
+
+    @staticmethod
+    def build(graph, witness_limit=60):
+        """
+        Preprocess a graph into a ContractionHierarchy.
+
+        Parameters
+        ----------
+        graph : object
+            Provides `nodes()` and `neighbors(u)` (e.g. `Graph`, `CompiledGraph`).
+            Edge weights must be non-negative.
+        witness_limit : int
+            Max. nodes settled by one witness search. A smaller limit makes
+            the preprocessing faster but may add unnecessary shortcuts
+            (queries stay correct either way).
+
+        Returns
+        -------
+        ContractionHierarchy
+
+        Raises
+        ------
+        ValueError
+            If a negative edge weight is encountered.
+        """
+        compiled = graph if isinstance(graph, CompiledGraph) else CompiledGraph.from_graph(graph)
+        if len(compiled.weights) and compiled.weights.min() < 0:
+            raise ValueError("Contraction Hierarchies require non-negative edge weights.")
+        n = len(compiled)
+        # remaining graph: out_adj[u][x] = in_adj[x][u] = (weight, middle)
+        out_adj = [{} for _ in range(n)]
+        in_adj = [{} for _ in range(n)]
+        for u, x, weight in zip(np.repeat(np.arange(n), np.diff(compiled.indptr)).tolist(),
+                                compiled.indices.tolist(), compiled.weights.tolist()):
+            if u != x and weight < out_adj[u].get(x, (float('inf'),))[0]:
+                out_adj[u][x] = in_adj[x][u] = (weight, -1)
+
+        deleted = [0] * n
+        priority = [0] * n
+        queue = []
+        for v in range(n):
+            priority[v] = ContractionHierarchy._priority(v, out_adj, in_adj, deleted, witness_limit)
+            queue.append((priority[v], v))
+        heapq.heapify(queue)
+
+        rank = [0] * n
+        up_edges = [None] * n
+        down_edges = [None] * n
+        order = 0
+        while queue:
+            p, v = heapq.heappop(queue)
+            if p != priority[v] or up_edges[v] is not None:
+                continue
+            p = ContractionHierarchy._priority(v, out_adj, in_adj, deleted, witness_limit)
+            if queue and p > queue[0][0]:
+                priority[v] = p
+                heapq.heappush(queue, (p, v))
+                continue
+
+            shortcuts = ContractionHierarchy._shortcuts(v, out_adj, in_adj, witness_limit)
+            rank[v] = order
+            order += 1
+            up_edges[v] = out_adj[v]
+            down_edges[v] = in_adj[v]
+            for x in out_adj[v]:
+                del in_adj[x][v]
+            for u in in_adj[v]:
+                del out_adj[u][v]
+            for u, x, weight in shortcuts:
+                if weight < out_adj[u].get(x, (float('inf'),))[0]:
+                    out_adj[u][x] = in_adj[x][u] = (weight, v)
+            out_adj[v] = in_adj[v] = None
+            for u in set(up_edges[v]) | set(down_edges[v]):
+                deleted[u] += 1
+                priority[u] = ContractionHierarchy._priority(u, out_adj, in_adj, deleted, witness_limit)
+                heapq.heappush(queue, (priority[u], u))
+
+        return ContractionHierarchy(compiled.ids, rank,
+                                    ContractionHierarchy._csr(up_edges),
+                                    ContractionHierarchy._csr(down_edges))
+
+    @staticmethod
+    def _csr(adjacency):
+        """Pack a list of {neighbor: (weight, middle)} dicts into CSR arrays."""
+        indptr = [0]
+        indices, weights, middle = [], [], []
+        for edges in adjacency:
+            for x, (weight, m) in edges.items():
+                indices.append(x)
+                weights.append(weight)
+                middle.append(m)
+            indptr.append(len(indices))
+        weights = np.asarray(weights) if weights else np.zeros(0, dtype=np.int64)
+        return (np.asarray(indptr, dtype=np.int64), np.asarray(indices, dtype=np.int64),
+                weights, np.asarray(middle, dtype=np.int64))
+
+    @staticmethod
+    def _witness_search(source, skip, max_cost, targets, out_adj, limit):
+        """
+        Local Dijkstra from `source` in the remaining graph, avoiding `skip`.
+
+        Stops when every target is settled, the distance exceeds `max_cost`
+        or `limit` nodes were settled. Returns the tentative distances.
+        """
+        dist = {source: 0}
+        priority_queue = [(0, source)]
+        remaining = set(targets)
+        settled = 0
+        while priority_queue:
+            d, u = heapq.heappop(priority_queue)
+            if d != dist[u]:
+                continue
+            if d > max_cost:
+                break
+            remaining.discard(u)
+            settled += 1
+            if not remaining or settled > limit:
+                break
+            for x, (weight, _) in out_adj[u].items():
+                if x == skip:
+                    continue
+                new_d = d + weight
+                if new_d < dist.get(x, float('inf')):
+                    dist[x] = new_d
+                    heapq.heappush(priority_queue, (new_d, x))
+        return dist
+
+    @staticmethod
+    def _shortcuts(v, out_adj, in_adj, limit):
+        """Shortcuts (u, x, weight) needed if `v` were contracted now."""
+        shortcuts = []
+        outgoing = out_adj[v]
+        if not outgoing:
+            return shortcuts
+        for u, (weight_in, _) in in_adj[v].items():
+            targets = [x for x in outgoing if x != u]
+            if not targets:
+                continue
+            max_cost = weight_in + max(outgoing[x][0] for x in targets)
+            dist = ContractionHierarchy._witness_search(u, v, max_cost, targets, out_adj, limit)
+            for x in targets:
+                via = weight_in + outgoing[x][0]
+                if dist.get(x, float('inf')) > via:
+                    shortcuts.append((u, x, via))
+        return shortcuts
+
+    @staticmethod
+    def _priority(v, out_adj, in_adj, deleted, limit):
+        """Edge difference of `v` plus its number of contracted neighbors."""
+        shortcuts = ContractionHierarchy._shortcuts(v, out_adj, in_adj, limit)
+        return len(shortcuts) - len(out_adj[v]) - len(in_adj[v]) + deleted[v]
+
+    def query(self, start, goal):
+        """
+        Shortest path from `start` to `goal`.
+
+        Returns
+        -------
+        dict
+            Same format as `Search.dijkstra`: {'path', 'cost', 'visited'}.
+            'visited' lists the nodes settled by the forward and backward
+            upward searches, interleaved (a node may appear twice).
+        """
+        if start == goal:
+            return {'path': [start], 'cost': 0, 'visited': [start]}
+        s = self.index.get(start)
+        t = self.index.get(goal)
+        if s is None or t is None:
+            return {'path': [], 'cost': float('inf'), 'visited': []}
+
+        inf = float('inf')
+        adjacency = (self._up, self._down)
+        best_g = ({s: 0}, {t: 0})
+        predecessor = ({}, {})
+        priority_queues = ([(0, s)], [(0, t)])
+        visited = []
+        best_cost = inf
+        meeting = None
+
+        while priority_queues[0] or priority_queues[1]:
+            if not priority_queues[1] or (priority_queues[0] and
+                                          priority_queues[0][0][0] <= priority_queues[1][0][0]):
+                side = 0
+            else:
+                side = 1
+            g_current, current = heapq.heappop(priority_queues[side])
+            if g_current >= best_cost:
+                priority_queues[side].clear()
+                continue
+            if g_current != best_g[side][current]:
+                continue
+            visited.append(self.ids[current])
+            g_other = best_g[1 - side].get(current)
+            if g_other is not None and g_current + g_other < best_cost:
+                best_cost = g_current + g_other
+                meeting = current
+            indptr, indices, weights, _ = adjacency[side]
+            g_own = best_g[side]
+            for k in range(indptr[current], indptr[current + 1]):
+                neighbor = indices[k]
+                new_g = g_current + weights[k]
+                if new_g < g_own.get(neighbor, inf):
+                    g_own[neighbor] = new_g
+                    predecessor[side][neighbor] = current
+                    heapq.heappush(priority_queues[side], (new_g, neighbor))
+
+        if meeting is None:
+            return {'path': [], 'cost': inf, 'visited': visited}
+        climb = [meeting]
+        while climb[-1] != s:
+            climb.append(predecessor[0][climb[-1]])
+        climb.reverse()
+        descent = [meeting]
+        while descent[-1] != t:
+            descent.append(predecessor[1][descent[-1]])
+        nodes = climb[:-1] + descent
+        path = [s]
+        for u, x in zip(nodes, nodes[1:]):
+            path.extend(self._unpack(u, x))
+        return {'path': [self.ids[i] for i in path], 'cost': best_cost, 'visited': visited}
+
+    def _middle(self, u, x):
+        """Bypassed node of the stored edge u -> x (-1 for an original edge)."""
+        if self.rank[u] < self.rank[x]:
+            indptr, indices, _, middle = self._up
+            owner, other = u, x
+        else:
+            indptr, indices, _, middle = self._down
+            owner, other = x, u
+        for k in range(indptr[owner], indptr[owner + 1]):
+            if indices[k] == other:
+                return middle[k]
+        raise KeyError((u, x))
+
+    def _unpack(self, u, x):
+        """Original-edge node sequence of the edge u -> x, without u."""
+        nodes = []
+        stack = [(u, x)]
+        while stack:
+            a, b = stack.pop()
+            m = self._middle(a, b)
+            if m < 0:
+                nodes.append(b)
+            else:
+                stack.append((m, b))
+                stack.append((a, m))
+        return nodes
+
+    def save(self, path):
+        """
+        Write the index to a `.npz` file.
+
+        The CSR arrays and ranks are stored as NumPy arrays; node ids as a
+        JSON string (tuples such as (row, col) come back as tuples).
+        """
+        np.savez(path, ids=np.array(CompiledGraph.ids_to_json(self.ids)), rank=self.rank,
+                 up_indptr=self.up[0], up_indices=self.up[1], up_weights=self.up[2], up_middle=self.up[3],
+                 down_indptr=self.down[0], down_indices=self.down[1], down_weights=self.down[2],
+                 down_middle=self.down[3])
+
+    @staticmethod
+    def load(path):
+        """Read an index written by `save`."""
+        with np.load(path, allow_pickle=False) as data:
+            ids = CompiledGraph.ids_from_json(str(data['ids']))
+            return ContractionHierarchy(
+                ids, data['rank'],
+                tuple(data['up_' + name] for name in ('indptr', 'indices', 'weights', 'middle')),
+                tuple(data['down_' + name] for name in ('indptr', 'indices', 'weights', 'middle')))
+
+class StudentID:
+    """
+    Utility class for identifying the student.
+
+    Each student must replace the placeholder return value
+    in the `get_ID` method with their own unique student ID.
+    """
+
+    @staticmethod
+    def get_ID():
+        """
+        Return the student ID as a string.
+
+        Returns
+        -------
+        str
+            The student ID. Each student must replace "student_ID" with their own ID.
+
+        Examples
+        --------
+        >>> StudentID.get_ID()
+        '123456'
+        """
+        # TODO - BLOCK START
+        # TASK#1
+        return "student_ID"
+        # TODO - BLOCK END
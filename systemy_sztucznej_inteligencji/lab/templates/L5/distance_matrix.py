@@ -0,0 +1,221 @@
+import heapq
+import multiprocessing
+
+import numpy as np
+
+from compiled_graph import CompiledGraph
+
+class DistanceMatrix:
+    """
+    Shortest-path distances for many (source, target) pairs at once.
+
+    What it provides
+    ----------------
+    - `one_to_all(graph, source)`: a full Dijkstra run from one source,
+      returned as dense NumPy arrays of distances and predecessors.
+    - `many_to_many(graph, sources, targets)`: the S x T matrix of distances.
+      Each distinct source is searched once and the search stops as soon as
+      every target is settled. With `processes > 1` the sources are split
+      over a pool of worker processes.
+
+    Node indices
+    ------------
+    The searches run on a `CompiledGraph` (a `Graph` is compiled on each
+    call; pass a CompiledGraph to reuse it). Arrays returned by `one_to_all`
+    are indexed like `compiled.ids`; for a `Graph` that is the order of
+    `graph.nodes()`. Sources and targets are always given as node ids.
+
+    Unreachable pairs have distance inf; predecessors are -1 where there is
+    none (the source and unreachable nodes).
+
+    Example
+    -------
+    >>> cg = CompiledGraph.from_graph(maze.to_graph())
+    >>> dist, pred = DistanceMatrix.one_to_all(cg, maze.start)
+    >>> dist[cg.index[maze.goal]]
+    >>> DistanceMatrix.many_to_many(cg, depots, customers, processes=4).shape
+    (len(depots), len(customers))
+    """
+
+    @staticmethod
+    def compile(graph):
+        """`graph` itself if it is a CompiledGraph, else `CompiledGraph.from_graph(graph)`."""
+        return graph if isinstance(graph, CompiledGraph) else CompiledGraph.from_graph(graph)
+
+    @staticmethod
+    def one_to_all(graph, source):
+        """
+        Distances and shortest-path tree from `source` to every node.
+
+        Parameters
+        ----------
+        graph : Graph or CompiledGraph
+        source : hashable
+            Node id.
+
+        Returns
+        -------
+        dist : float64[n]
+            dist[i] = cost of a shortest path source → ids[i] (inf if unreachable).
+        pred : int64[n]
+            Index of the node before i on that path (-1 for the source and
+            unreachable nodes).
+
+        Raises
+        ------
+        KeyError
+            If `source` is not a node of the graph.
+        ValueError
+            If the graph has a negative edge weight.
+        """
+        compiled = DistanceMatrix.compile(graph)
+        DistanceMatrix._check_weights(compiled)
+        dist, pred = DistanceMatrix._dijkstra(compiled.adjacency_views(), compiled.index[source])
+        return np.array(dist, dtype=np.float64), np.array(pred, dtype=np.int64)
+
+    @staticmethod
+    def many_to_many(graph, sources, targets, processes=1):
+        """
+        Matrix of shortest-path costs from every source to every target.
+
+        Parameters
+        ----------
+        graph : Graph or CompiledGraph
+        sources, targets : sequence of hashable
+            Node ids; ids that are not in the graph only reach themselves.
+        processes : int or None
+            Worker processes (None = `os.cpu_count()`). With 1 everything
+            runs in the calling process.
+
+        Returns
+        -------
+        float64[len(sources), len(targets)]
+
+        Raises
+        ------
+        ValueError
+            If the graph has a negative edge weight.
+        """
+        compiled = DistanceMatrix.compile(graph)
+        DistanceMatrix._check_weights(compiled)
+        sources = list(sources)
+        targets = list(targets)
+        matrix = np.full((len(sources), len(targets)), np.inf)
+        target_index = [compiled.index.get(t, -1) for t in targets]
+        unique = list(dict.fromkeys(compiled.index[s] for s in sources if s in compiled.index))
+        if not unique or not targets:
+            for i, s in enumerate(sources):
+                matrix[i, [j for j, t in enumerate(targets) if t == s]] = 0
+            return matrix
+        arrays = (compiled.indptr, compiled.indices, compiled.weights)
+        processes = min(processes or multiprocessing.cpu_count(), len(unique))
+        if processes == 1:
+            rows = _RowWorker.rows(unique, arrays, target_index)
+        else:
+            shares = [unique[k::processes] for k in range(processes)]
+            with multiprocessing.get_context().Pool(
+                    processes, initializer=_RowWorker.init, initargs=(arrays, target_index)) as pool:
+                per_share = pool.map(_RowWorker.run, shares)
+            rows = [None] * len(unique)
+            for k, share_rows in enumerate(per_share):
+                rows[k::processes] = share_rows
+
+        row_of = dict(zip(unique, rows))
+        for i, s in enumerate(sources):
+            if s in compiled.index:
+                matrix[i] = row_of[compiled.index[s]]
+            else:
+                matrix[i, [j for j, t in enumerate(targets) if t == s]] = 0
+        return matrix
+
+    @staticmethod
+    def _check_weights(compiled):
+        if len(compiled.weights) and compiled.weights.min() < 0:
+            raise ValueError("Dijkstra requires non-negative edge weights.")
+
+    @staticmethod
+    def _dijkstra(arrays, source, targets=None):
+        """
+        Dijkstra on CSR arrays (indptr, indices, weights) from node index `source`.
+        Arrays are read through memoryviews (see `CompiledGraph.adjacency_views`).
+
+        With `targets` (a set of indices) the search stops once all of them
+        are settled. Returns (dist, pred) lists.
+        """
+        indptr, indices, weights = (memoryview(array) for array in arrays)
+        inf = float('inf')
+        dist = [inf] * (len(indptr) - 1)
+        pred = [-1] * (len(indptr) - 1)
+        dist[source] = 0
+        remaining = None if targets is None else set(targets)
+        priority_queue = [(0, source)]
+        while priority_queue:
+            d, u = heapq.heappop(priority_queue)
+            if d != dist[u]:
+                continue
+            if remaining is not None:
+                remaining.discard(u)
+                if not remaining:
+                    break
+            for k in range(indptr[u], indptr[u + 1]):
+                v = indices[k]
+                new_d = d + weights[k]
+                if new_d < dist[v]:
+                    dist[v] = new_d
+                    pred[v] = u
+                    heapq.heappush(priority_queue, (new_d, v))
+        return dist, pred
+
+class _RowWorker:
+    """Matrix rows for a share of the sources (also the pool worker)."""
+
+    arrays = None
+    target_index = None
+
+    @staticmethod
+    def init(arrays, target_index):
+        """Pool initializer: keep the graph and targets in the worker process."""
+        _RowWorker.arrays = arrays
+        _RowWorker.target_index = target_index
+
+    @staticmethod
+    def run(sources):
+        return _RowWorker.rows(sources, _RowWorker.arrays, _RowWorker.target_index)
+
+    @staticmethod
+    def rows(sources, arrays, target_index):
+        """One list of target distances per source index."""
+        wanted = {t for t in target_index if t >= 0}
+        rows = []
+        for s in sources:
+            dist, _ = DistanceMatrix._dijkstra(arrays, s, wanted)
+            rows.append([dist[t] if t >= 0 else float('inf') for t in target_index])
+        return rows
+
+class StudentID:
+    """
+    Utility class for identifying the student.
+
+    Each student must replace the placeholder return value
+    in the `get_ID` method with their own unique student ID.
+    """
+
+    @staticmethod
+    def get_ID():
+        """
+        Return the student ID as a string.
+
+        Returns
+        -------
+        str
+            The student ID. Each student must replace "student_ID" with their own ID.
+
+        Examples
+        --------
+        >>> StudentID.get_ID()
+        '123456'
+        """
+        # TODO - BLOCK START
+        # TASK#1
+        return "student_ID"
+        # TODO - BLOCK END
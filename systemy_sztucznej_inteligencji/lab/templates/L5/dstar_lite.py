@@ -0,0 +1,318 @@
+import heapq
+
+import numpy as np
+
+class DStarLite:
+    """
+    D* Lite: incremental shortest-path planning on a `Maze` that changes.
+
+    Why
+    ---
+    When a few cells change (a wall appears, a tile gets more expensive),
+    rebuilding the graph and running A* again repeats all the work. D* Lite
+    keeps its search state between calls and, after a change, only repairs
+    the part of the search that the change affects. It also lets the start
+    move (an agent walking along the path) without starting over.
+
+    How it works
+    ------------
+    The search runs *backward*, from the goal towards the start, on the
+    maze grid directly (moving u -> v costs the enter-cost of v, like
+    `Maze.to_graph`). Every cell keeps
+        g(s)   : its current goal distance estimate
+        rhs(s) : min over neighbors s' of cost(s, s') + g(s')  (0 at the goal)
+    A cell with g != rhs is *inconsistent* and sits in the priority queue
+    with key [min(g, rhs) + h(start, s) + km, min(g, rhs)]. `plan()`
+    processes cells until the start is consistent and no queued key is
+    smaller than the start's. A cell update only makes the cell and its
+    neighbors inconsistent, so the next `plan()` touches only the region
+    whose distances really changed.
+
+    When the start moves, km grows by h(old start, new start) instead of
+    re-keying the whole queue.
+
+    Heuristic
+    ---------
+    Manhattan distance times the cheapest enter-cost of the maze. If an
+    update makes some tile cheaper than that, the heuristic would no longer
+    be admissible; the planner then starts over from scratch.
+
+    Enter-costs must be positive: with zero-cost tiles a group of cells can
+    keep supporting each other's outdated distances after a change.
+
+    Large changes
+    -------------
+    Repairing is only cheaper than planning again while the change is
+    local. If `update_costs` touches more than `RESET_SHARE` of all cells,
+    the planner starts over from scratch instead.
+
+    On an `ArrayMaze` the planner reads the `costs` / `codes` arrays in
+    place and never builds the list-of-lists `grid`.
+
+    Example
+    -------
+    >>> planner = DStarLite(maze)
+    >>> planner.plan()['cost']
+    12
+    >>> planner.update_cell(3, 4, '#')      # a wall appears
+    >>> planner.move_start((1, 2))          # the agent moved
+    >>> planner.plan()['path']              # repaired, not recomputed
+    """
+
+    RESET_SHARE = 0.01
+
+    def __init__(self, maze, start=None, goal=None):
+        """
+        Parameters
+        ----------
+        maze : Maze
+            The maze to plan on. `update_cell` / `update_costs` modify it.
+        start, goal : tuple[int, int] or None
+            Default to `maze.start` / `maze.goal`.
+
+        Raises
+        ------
+        ValueError
+            If a passable tile has an enter-cost <= 0 (also raised by the
+            update methods, before changing anything).
+        """
+        self.maze = maze
+        self.start = maze.start if start is None else start
+        self.goal = maze.goal if goal is None else goal
+        self._reset()
+
+    def _reset(self):
+        """Forget all search state (initial D* Lite state)."""
+        self._bind_costs()
+        self.scale = self._cheapest_cost()
+        self.km = 0
+        self.last = self.start
+        self.g = {}
+        self.rhs = {self.goal: 0}
+        self._queue = []
+        self._keys = {}
+        self._push(self.goal)
+
+    def _bind_costs(self):
+        """
+        Enter-cost lookup of an ArrayMaze: a memoryview of `maze.costs`
+        (indexed by (r, c), walls hold 0), or None for a grid-based Maze.
+        Called again whenever `set_costs` may have replaced the array.
+        """
+        costs = getattr(self.maze, 'costs', None)
+        self._costs = None if costs is None else memoryview(costs)
+
+    def _cheapest_cost(self):
+        """Smallest enter-cost of any passable tile in the maze."""
+        maze = self.maze
+        if self._costs is not None:
+            passable = maze.costs[maze.passable]
+            cheapest = passable.min().item() if len(passable) else 1
+        else:
+            chars = set()
+            for row in maze.grid:
+                chars.update(row)
+            chars.discard(maze.wall_char)
+            cheapest = min((maze.cost_of.get(ch, 1) for ch in chars), default=1)
+        DStarLite._check_cost(cheapest)
+        return cheapest
+
+    @staticmethod
+    def _check_cost(cost):
+        if not cost > 0:
+            raise ValueError("D* Lite requires positive enter-costs.")
+
+    def _h(self, a, b):
+        return self.scale * (abs(a[0] - b[0]) + abs(a[1] - b[1]))
+
+    def _cost(self, u, v):
+        """Cost of moving u -> v (inf if either cell is a wall)."""
+        costs = self._costs
+        if costs is not None:
+            if not costs[u] or not costs[v]:
+                return float('inf')
+            return costs[v]
+        maze = self.maze
+        if maze.grid[u[0]][u[1]] == maze.wall_char:
+            return float('inf')
+        ch = maze.grid[v[0]][v[1]]
+        if ch == maze.wall_char:
+            return float('inf')
+        return maze.cost_of.get(ch, 1)
+
+    def _neighbors(self, cell):
+        """In-bounds 4-neighbors (walls included; `_cost` makes them unusable)."""
+        r, c = cell
+        for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+            if self.maze.in_bounds(r + dr, c + dc):
+                yield (r + dr, c + dc)
+
+    def _key(self, cell):
+        best = min(self.g.get(cell, float('inf')), self.rhs.get(cell, float('inf')))
+        return (best + self._h(self.start, cell) + self.km, best)
+
+    def _push(self, cell):
+        key = self._key(cell)
+        self._keys[cell] = key
+        heapq.heappush(self._queue, (key, cell))
+
+    def _top(self):
+        """Smallest live (key, cell) of the queue, or None; drops stale entries."""
+        while self._queue:
+            key, cell = self._queue[0]
+            if self._keys.get(cell) == key:
+                return key, cell
+            heapq.heappop(self._queue)
+        return None
+
+    def _update_vertex(self, cell):
+        inf = float('inf')
+        if cell != self.goal:
+            self.rhs[cell] = min((self._cost(cell, s) + self.g.get(s, inf) for s in self._neighbors(cell)),
+                                 default=inf)
+        self._keys.pop(cell, None)
+        if self.g.get(cell, inf) != self.rhs.get(cell, inf):
+            self._push(cell)
+
+    def _compute_shortest_path(self):
+        """Process inconsistent cells; return the cells expanded, in order."""
+        inf = float('inf')
+        expanded = []
+        while True:
+            top = self._top()
+            start_g = self.g.get(self.start, inf)
+            start_rhs = self.rhs.get(self.start, inf)
+            if top is None or (top[0] >= self._key(self.start) and start_rhs == start_g):
+                return expanded
+            key_old, cell = top
+            key_new = self._key(cell)
+            if key_old < key_new:
+                self._push(cell)
+                continue
+            heapq.heappop(self._queue)
+            del self._keys[cell]
+            expanded.append(cell)
+            if self.g.get(cell, inf) > self.rhs.get(cell, inf):
+                self.g[cell] = self.rhs[cell]
+                for s in self._neighbors(cell):
+                    self._update_vertex(s)
+            else:
+                self.g[cell] = inf
+                self._update_vertex(cell)
+                for s in self._neighbors(cell):
+                    self._update_vertex(s)
+
+    def plan(self):
+        """
+        (Re)plan from the current start to the goal.
+
+        Returns
+        -------
+        dict
+            {'path', 'cost', 'visited'} as in `Search.astar`; 'visited'
+            lists only the cells expanded by *this* call (the repair work).
+        """
+        inf = float('inf')
+        if self.start is None or self.goal is None:
+            return {'path': [], 'cost': inf, 'visited': []}
+        expanded = self._compute_shortest_path()
+        cost = self.rhs.get(self.start, inf) if self.start != self.goal else 0
+        if cost == inf:
+            return {'path': [], 'cost': inf, 'visited': expanded}
+        path = [self.start]
+        current = self.start
+        while current != self.goal:
+            current = min(self._neighbors(current), key=lambda s: self._cost(current, s) + self.g.get(s, inf))
+            path.append(current)
+        return {'path': path, 'cost': cost, 'visited': expanded}
+
+    def move_start(self, cell):
+        """The agent is now at `cell`; the next `plan()` starts there."""
+        self.km += self._h(self.last, cell)
+        self.last = cell
+        self.start = cell
+
+    def update_cell(self, r, c, ch):
+        """
+        Change the tile at (r, c) to `ch` (e.g. the wall char) and mark the
+        affected cells for repair. The change is written into the maze.
+        """
+        maze = self.maze
+        if ch != maze.wall_char:
+            DStarLite._check_cost(maze.cost_of.get(ch, 1))
+        if hasattr(maze, 'set_tile'):
+            maze.set_tile(r, c, ch)
+        else:
+            maze.grid[r][c] = ch
+        if ch != maze.wall_char and maze.cost_of.get(ch, 1) < self.scale:
+            self._reset()
+            return
+        cell = (r, c)
+        self._update_vertex(cell)
+        for s in self._neighbors(cell):
+            self._update_vertex(s)
+
+    def _cells_with(self, chars):
+        """(row, col) of every tile whose character is in `chars`."""
+        maze = self.maze
+        if self._costs is not None:
+            codes = [ord(ch) for ch in chars if ord(ch) < 256]
+            return [tuple(cell) for cell in np.argwhere(np.isin(maze.codes, codes)).tolist()]
+        return [(r, c) for r, row in enumerate(maze.grid) for c, ch in enumerate(row) if ch in chars]
+
+    def update_costs(self, cost_of):
+        """
+        Change enter-costs of tile characters (a dict char -> cost), update
+        `maze.cost_of` and mark every cell with such a character for repair
+        (or start over if that is more than `RESET_SHARE` of the cells).
+        """
+        maze = self.maze
+        for cost in cost_of.values():
+            DStarLite._check_cost(cost)
+        changed = {ch for ch, cost in cost_of.items() if maze.cost_of.get(ch, 1) != cost}
+        maze.cost_of.update(cost_of)
+        if hasattr(maze, 'set_costs'):
+            maze.set_costs(cost_of)
+            self._bind_costs()
+        if not changed:
+            return
+        if any(cost_of[ch] < self.scale for ch in changed):
+            self._reset()
+            return
+        cells = self._cells_with(changed)
+        if len(cells) > self.RESET_SHARE * maze.rows * maze.cols:
+            self._reset()
+            return
+        touched = set(cells)
+        for cell in cells:
+            touched.update(self._neighbors(cell))
+        for cell in touched:
+            self._update_vertex(cell)
+
+class StudentID:
+    """
+    Utility class for identifying the student.
+
+    Each student must replace the placeholder return value
+    in the `get_ID` method with their own unique student ID.
+    """
+
+    @staticmethod
+    def get_ID():
+        """
+        Return the student ID as a string.
+
+        Returns
+        -------
+        str
+            The student ID. Each student must replace "student_ID" with their own ID.
+
+        Examples
+        --------
+        >>> StudentID.get_ID()
+        '123456'
+        """
+        # TODO - BLOCK START
+        # TASK#1
+        return "student_ID"
+        # TODO - BLOCK END
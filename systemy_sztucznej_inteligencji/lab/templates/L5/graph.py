@@ -15,6 +15,8 @@ class Graph:
       This is compact, fast to update, and easy to traverse.
     - We do not de-duplicate edges; adding the same (u, v, cost) twice
       will produce two parallel entries. (That’s fine for most search labs.)
+    - `reverse()` returns the transposed graph (used by the bidirectional
+      searches). It is built on first use and cached until the graph changes.
 
     Doctest-style examples
     ----------------------
@@ -44,11 +46,14 @@ class Graph:
         ----------
         _adj : dict
             Maps a node to a list of (neighbor, cost) tuples.
+        _reverse : Graph or None
+            Cached result of `reverse()`; reset by `add_node` / `add_edge`.
         """
         # TODO - BLOCK START
         # TASK#2
         pass
         # TODO - BLOCK END
+        self._reverse = None
 
     def add_node(self, u):
         """
@@ -68,6 +73,7 @@ class Graph:
         # TASK#3
         pass
         # TODO - BLOCK END
+        self._reverse = None
 
     def add_edge(self, u, v, cost=1):
         """
@@ -90,6 +96,7 @@ class Graph:
         # TASK#4
         pass
         # TODO - BLOCK END
+        self._reverse = None
 
     def neighbors(self, u):
         """
@@ -138,6 +145,34 @@ class Graph:
         pass
         # TODO - BLOCK END
 
+    def reverse(self):
+        """
+        Return the reverse graph: every edge u -> v (cost c) becomes v -> u (cost c).
+
+        Returns
+        -------
+        Graph
+            A new Graph with the same nodes. It is built lazily and cached;
+            `add_node` / `add_edge` drop the cache. Treat it as read-only.
+
+        Examples
+        --------
+        >>> g = Graph()
+        >>> g.add_edge('A', 'B', 2)
+        >>> g.reverse().neighbors('B')
+        [('A', 2)]
+        >>> g.reverse() is g.reverse()
+        True
+        """
+        if self._reverse is None:
+            reverse = Graph()
+            for u in self.nodes():
+                reverse.add_node(u)
+            for u, v, cost in self.edges():
+                reverse.add_edge(v, u, cost)
+            self._reverse = reverse
+        return self._reverse
+
 class StudentID:
     """
     Utility class for identifying the student.
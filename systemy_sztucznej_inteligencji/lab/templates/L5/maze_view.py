@@ -0,0 +1,139 @@
+from collections import OrderedDict
+
+class MazeGraphView:
+    """
+    Read-only graph view of a `Maze`, computed on demand.
+
+    `Maze.to_graph()` stores every passable cell and every edge before the
+    search starts. This view stores nothing: `neighbors(u)` is computed from
+    `Maze.neighbors4` and `cost_of` when the search asks for it, so a single
+    query only costs memory for the nodes it actually explores (the search's
+    own dicts). It plugs into `Search` like a `Graph`:
+
+        >>> view = MazeGraphView(maze)
+        >>> Search.astar(view, maze.start, maze.goal, Heuristics.manhattan(maze.goal))
+
+    Edges and costs are the same as in `Maze.to_graph` (moving u -> v costs
+    the enter-cost of v), and the neighbor order is that of `neighbors4`.
+    Because nothing is copied, changes to the maze are visible at once
+    (clear the cache with `cache_clear()` if one is used).
+
+    Cache
+    -----
+    With `cache_size=N` the last N neighbor lists are kept in an LRU cache
+    (OrderedDict), useful when the same region is searched repeatedly
+    (several queries, bidirectional search). `cache_size=None` disables it.
+    `hits` / `misses` count cache lookups.
+    """
+
+    def __init__(self, maze, cache_size=None, reverse=False):
+        """
+        Parameters
+        ----------
+        maze : Maze
+        cache_size : int or None
+            Max. number of cached neighbor lists (None = no cache).
+        reverse : bool
+            Build the reverse view (edges v -> u costing the enter-cost of v);
+            normally obtained through `reverse()`.
+        """
+        self.maze = maze
+        self.cache_size = cache_size
+        self.reversed = reverse
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+        self._reverse = None
+
+    def _enter_cost(self, r, c):
+        """Enter-cost of cell (r, c)."""
+        maze = self.maze
+        if hasattr(maze, 'costs'):
+            return maze.costs[r, c].item()
+        return maze.cost_of.get(maze.grid[r][c], 1)
+
+    def _compute(self, node):
+        maze = self.maze
+        if not (isinstance(node, tuple) and len(node) == 2):
+            return []
+        r, c = node
+        if not maze.is_passable(r, c):
+            return []
+        if self.reversed:
+            cost = self._enter_cost(r, c)
+            return [(v, cost) for v in maze.neighbors4(r, c)]
+        return [(v, self._enter_cost(*v)) for v in maze.neighbors4(r, c)]
+
+    def neighbors(self, node):
+        """
+        Outgoing (neighbor, cost) pairs of cell `node`, like `Graph.neighbors`.
+
+        Walls, out-of-bounds cells and non-cell nodes have no neighbors.
+        """
+        if self.cache_size is None:
+            return self._compute(node)
+        cached = self._cache.get(node)
+        if cached is not None:
+            self._cache.move_to_end(node)
+            self.hits += 1
+            return cached
+        self.misses += 1
+        result = self._compute(node)
+        if self.cache_size > 0:
+            self._cache[node] = result
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return result
+
+    def cache_clear(self):
+        """Drop the cached neighbor lists (e.g. after the maze changed)."""
+        self._cache.clear()
+        if self._reverse is not None:
+            self._reverse._cache.clear()
+
+    def nodes(self):
+        """All passable cells (row-major). Walks the whole maze."""
+        maze = self.maze
+        return [(r, c) for r in range(maze.rows) for c in range(maze.cols) if maze.is_passable(r, c)]
+
+    def edges(self):
+        """All edges as (u, v, cost). Walks the whole maze."""
+        return [(u, v, cost) for u in self.nodes() for v, cost in self.neighbors(u)]
+
+    def reverse(self):
+        """
+        The reverse view (same maze, same cache size), for
+        `Search.bidirectional_dijkstra` / `bidirectional_astar`.
+        """
+        if self._reverse is None:
+            self._reverse = MazeGraphView(self.maze, self.cache_size, not self.reversed)
+            self._reverse._reverse = self
+        return self._reverse
+
+class StudentID:
+    """
+    Utility class for identifying the student.
+
+    Each student must replace the placeholder return value
+    in the `get_ID` method with their own unique student ID.
+    """
+
+    @staticmethod
+    def get_ID():
+        """
+        Return the student ID as a string.
+
+        Returns
+        -------
+        str
+            The student ID. Each student must replace "student_ID" with their own ID.
+
+        Examples
+        --------
+        >>> StudentID.get_ID()
+        '123456'
+        """
+        # TODO - BLOCK START
+        # TASK#1
+        return "student_ID"
+        # TODO - BLOCK END
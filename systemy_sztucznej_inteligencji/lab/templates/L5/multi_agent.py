@@ -0,0 +1,220 @@
+import heapq
+import multiprocessing
+from multiprocessing import shared_memory, util
+
+import numpy as np
+
+class MultiAgentPlanner:
+    """
+    Shortest paths for many agents (start, goal) on one `Maze`, in one batch.
+
+    Instead of one `Search.astar` call per agent, the batch is grouped by
+    goal. For every distinct goal a single *reverse Dijkstra* computes the
+    distance of the maze's cells to that goal (the goal's *field*), and
+    every agent with that goal just follows its field from its start. A
+    field search stops as soon as all starts of its agents are settled.
+
+    Parallelism
+    -----------
+    With `processes > 1` the goals are handed out to a pool of worker
+    processes. The maze's cost grid is placed once in a
+    `multiprocessing.shared_memory` block which the workers attach to and
+    read in place (a float64 memoryview of the block, no private copy), so
+    it is neither pickled per task nor duplicated per worker. Workers only
+    send back the paths.
+
+    Costs follow `Maze.to_graph`: moving into a cell costs that cell's
+    enter-cost; walls cannot be entered. Enter-costs must be non-negative.
+    The agents are independent: they do not avoid each other.
+
+    Example
+    -------
+    >>> planner = MultiAgentPlanner(maze, processes=4)
+    >>> results = planner.plan([((0, 0), (9, 9)), ((3, 1), (9, 9)), ((5, 5), (0, 7))])
+    >>> [r['cost'] for r in results]
+    """
+
+    def __init__(self, maze, processes=1):
+        """
+        Parameters
+        ----------
+        maze : Maze
+            Read once here; later changes to the maze are not seen.
+        processes : int or None
+            Worker processes (None = `os.cpu_count()`). With 1 the batch runs
+            in the calling process.
+
+        Raises
+        ------
+        ValueError
+            If a passable tile has a negative enter-cost.
+        """
+        self.rows, self.cols = maze.rows, maze.cols
+        self.processes = processes or multiprocessing.cpu_count()
+        if hasattr(maze, 'passable'):
+            costs = np.where(maze.passable, maze.costs, np.inf)
+        else:
+            costs = np.array([[np.inf if ch == maze.wall_char else maze.cost_of.get(ch, 1) for ch in row]
+                              for row in maze.grid], dtype=np.float64).reshape(self.rows, self.cols)
+        if (costs < 0).any():
+            raise ValueError("Enter-costs must be non-negative.")
+        finite = costs[np.isfinite(costs)]
+        self.integer_costs = bool((finite == np.round(finite)).all())
+        self.costs = costs.astype(np.float64).ravel()
+
+    def plan(self, pairs):
+        """
+        Plan every (start, goal) pair.
+
+        Parameters
+        ----------
+        pairs : sequence of (start, goal)
+            Cells as (row, col) tuples.
+
+        Returns
+        -------
+        list[dict]
+            One {'path': [start, ..., goal] or [], 'cost': cost or inf} per
+            pair, in input order.
+        """
+        pairs = list(pairs)
+        results = [{'path': [], 'cost': float('inf')} for _ in pairs]
+        by_goal = {}
+        for k, (start, goal) in enumerate(pairs):
+            s, g = self._cell(start), self._cell(goal)
+            if s is None or g is None:
+                continue
+            by_goal.setdefault(g, []).append((k, s))
+        tasks = [(g, agents) for g, agents in by_goal.items()]
+
+        processes = min(self.processes, len(tasks))
+        if processes <= 1:
+            costs = memoryview(self.costs)
+            answers = [_FieldWorker.solve(costs, self.cols, task) for task in tasks]
+        else:
+            block = shared_memory.SharedMemory(create=True, size=self.costs.nbytes)
+            try:
+                np.ndarray(self.costs.shape, dtype=np.float64, buffer=block.buf)[:] = self.costs
+                with multiprocessing.get_context().Pool(
+                        processes, initializer=_FieldWorker.init,
+                        initargs=(block.name, len(self.costs), self.cols)) as pool:
+                    answers = pool.map(_FieldWorker.run, tasks, chunksize=1)
+                    pool.close()
+                    pool.join()   # let the workers exit normally (detaching from the block)
+            finally:
+                block.close()
+                block.unlink()
+
+        for answer in answers:
+            for k, path, cost in answer:
+                if path:
+                    cost = int(cost) if self.integer_costs else cost
+                    results[k] = {'path': [divmod(i, self.cols) for i in path], 'cost': cost}
+        return results
+
+    def _cell(self, cell):
+        """Flat index of a passable in-bounds cell, else None."""
+        if cell is None:
+            return None
+        r, c = cell
+        if not (0 <= r < self.rows and 0 <= c < self.cols) or self.costs[r * self.cols + c] == np.inf:
+            return None
+        return r * self.cols + c
+
+class _FieldWorker:
+    """Goal fields and agent paths (in-process or as the pool worker)."""
+
+    block = None
+    view = None
+    costs = None
+    cols = None
+
+    @staticmethod
+    def init(name, size, cols):
+        """
+        Pool initializer: attach to the shared cost grid and read it through
+        a float64 memoryview (the block may be larger than requested, hence
+        the slice).
+        """
+        _FieldWorker.block = shared_memory.SharedMemory(name=name)
+        _FieldWorker.view = _FieldWorker.block.buf[:size * 8]
+        _FieldWorker.costs = _FieldWorker.view.cast('d')
+        _FieldWorker.cols = cols
+        util.Finalize(None, _FieldWorker.detach, exitpriority=10)
+
+    @staticmethod
+    def detach():
+        """Release the views and close the block (at worker exit)."""
+        _FieldWorker.costs.release()
+        _FieldWorker.view.release()
+        _FieldWorker.block.close()
+
+    @staticmethod
+    def run(task):
+        return _FieldWorker.solve(_FieldWorker.costs, _FieldWorker.cols, task)
+
+    @staticmethod
+    def solve(costs, cols, task):
+        """
+        Reverse Dijkstra from the goal until all starts are settled, then
+        follow the `toward` pointers from every start.
+
+        Returns a list of (pair index, flat path, cost) for reachable starts.
+        """
+        goal, agents = task
+        inf = float('inf')
+        size = len(costs)
+        dist = {goal: 0.0}
+        toward = {}
+        remaining = {s for _, s in agents}
+        priority_queue = [(0.0, goal)]
+        while priority_queue and remaining:
+            d, v = heapq.heappop(priority_queue)
+            if d != dist[v]:
+                continue
+            remaining.discard(v)
+            entered = d + costs[v]
+            c = v % cols
+            for u in (v - cols, v + cols, v - 1 if c > 0 else -1, v + 1 if c < cols - 1 else -1):
+                if 0 <= u < size and costs[u] != inf and entered < dist.get(u, inf):
+                    dist[u] = entered
+                    toward[u] = v
+                    heapq.heappush(priority_queue, (entered, u))
+
+        answer = []
+        for k, s in agents:
+            if s in remaining:
+                continue
+            path = [s]
+            while path[-1] != goal:
+                path.append(toward[path[-1]])
+            answer.append((k, path, dist[s]))
+        return answer
+
+class StudentID:
+    """
+    Utility class for identifying the student.
+
+    Each student must replace the placeholder return value
+    in the `get_ID` method with their own unique student ID.
+    """
+
+    @staticmethod
+    def get_ID():
+        """
+        Return the student ID as a string.
+
+        Returns
+        -------
+        str
+            The student ID. Each student must replace "student_ID" with their own ID.
+
+        Examples
+        --------
+        >>> StudentID.get_ID()
+        '123456'
+        """
+        # TODO - BLOCK START
+        # TASK#1
+        return "student_ID"
+        # TODO - BLOCK END
@@ -0,0 +1,286 @@
+import heapq
+import itertools
+
+class PriorityQueue:
+    """
+    Common interface of the priority queues used by `Search` (`queue=` argument).
+
+    Operations
+    ----------
+    push(item, priority)  insert `item`, or lower its priority if it is already
+                          queued with a higher one (a higher priority is ignored)
+    pop()                 remove and return (priority, item) with the smallest
+                          priority; raises IndexError if the queue is empty
+    len(queue)            number of queued items (each item counted once)
+
+    An item that was popped may be pushed again (A* with an inconsistent
+    heuristic reopens nodes).
+
+    Implementations
+    ---------------
+    'heapq'   LazyHeapQueue       heapq with duplicate entries, stale ones skipped
+                                  on pop (what `Search` does by default)
+    'binary'  IndexedHeapQueue(2) binary heap with a position index, true decrease-key
+    'dary'    IndexedHeapQueue(4) 4-ary variant: shallower, fewer moves per push
+    'bucket'  BucketQueue         Dial's bucket queue for small non-negative
+                                  integer priorities (e.g. maze enter-costs)
+
+    Statistics
+    ----------
+    Every queue counts, in `stats()`:
+        pushes         new entries stored
+        decrease_keys  priorities lowered in place (indexed heap only)
+        pops           items returned by pop()
+        stale          outdated entries thrown away by pop() (lazy queues)
+        max_size       largest number of entries held at once, stale included
+    """
+
+    def __init__(self):
+        self.pushes = 0
+        self.decrease_keys = 0
+        self.pops = 0
+        self.stale = 0
+        self.max_size = 0
+
+    @staticmethod
+    def create(spec):
+        """
+        Turn a `queue=` argument into a fresh queue.
+
+        Parameters
+        ----------
+        spec : str or PriorityQueue
+            A name from the table in the class docstring, or a queue instance
+            (returned as is, so its statistics can be read afterwards).
+
+        Raises
+        ------
+        ValueError
+            For an unknown name.
+        """
+        if isinstance(spec, PriorityQueue):
+            return spec
+        if spec == 'heapq':
+            return LazyHeapQueue()
+        if spec == 'binary':
+            return IndexedHeapQueue(2)
+        if spec == 'dary':
+            return IndexedHeapQueue(4)
+        if spec == 'bucket':
+            return BucketQueue()
+        raise ValueError(f"Unknown priority queue: {spec!r}")
+
+    def stats(self):
+        """The counters described in the class docstring, as a dict."""
+        return {'pushes': self.pushes, 'decrease_keys': self.decrease_keys, 'pops': self.pops,
+                'stale': self.stale, 'max_size': self.max_size}
+
+class LazyHeapQueue(PriorityQueue):
+    """
+    `heapq` with lazy deletion: a lower priority is pushed as a new entry
+    and the old one is skipped when it reaches the top.
+
+    The heap can hold O(E) entries. Ties are broken by insertion order, so
+    items do not need to be comparable.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._heap = []
+        self._keys = {}
+        self._counter = itertools.count()
+
+    def __len__(self):
+        return len(self._keys)
+
+    def push(self, item, priority):
+        old = self._keys.get(item)
+        if old is not None and old <= priority:
+            return
+        self._keys[item] = priority
+        heapq.heappush(self._heap, (priority, next(self._counter), item))
+        self.pushes += 1
+        self.max_size = max(self.max_size, len(self._heap))
+
+    def pop(self):
+        while self._heap:
+            priority, _, item = heapq.heappop(self._heap)
+            if self._keys.get(item) != priority:
+                self.stale += 1
+                continue
+            del self._keys[item]
+            self.pops += 1
+            return priority, item
+        raise IndexError("pop from an empty priority queue")
+
+class IndexedHeapQueue(PriorityQueue):
+    """
+    d-ary min-heap with a position index (item -> slot), so a queued item's
+    priority is lowered in place (decrease-key) and the heap never holds
+    more than one entry per item.
+
+    Parameters
+    ----------
+    arity : int
+        Children per node (2 = binary heap). A larger arity makes the heap
+        shallower: decrease-key moves fewer levels, pop compares more children.
+    """
+
+    def __init__(self, arity=2):
+        super().__init__()
+        if arity < 2:
+            raise ValueError("arity must be at least 2")
+        self.arity = arity
+        self._items = []
+        self._keys = []
+        self._position = {}
+
+    def __len__(self):
+        return len(self._items)
+
+    def push(self, item, priority):
+        i = self._position.get(item)
+        if i is None:
+            self._items.append(item)
+            self._keys.append(priority)
+            self._position[item] = len(self._items) - 1
+            self._sift_up(len(self._items) - 1)
+            self.pushes += 1
+            self.max_size = max(self.max_size, len(self._items))
+        elif priority < self._keys[i]:
+            self._keys[i] = priority
+            self._sift_up(i)
+            self.decrease_keys += 1
+
+    def pop(self):
+        if not self._items:
+            raise IndexError("pop from an empty priority queue")
+        items, keys = self._items, self._keys
+        top_item, top_key = items[0], keys[0]
+        del self._position[top_item]
+        last_item, last_key = items.pop(), keys.pop()
+        if items:
+            items[0], keys[0] = last_item, last_key
+            self._position[last_item] = 0
+            self._sift_down(0)
+        self.pops += 1
+        return top_key, top_item
+
+    def _sift_up(self, i):
+        items, keys, position, arity = self._items, self._keys, self._position, self.arity
+        item, key = items[i], keys[i]
+        while i > 0:
+            parent = (i - 1) // arity
+            if keys[parent] <= key:
+                break
+            items[i], keys[i] = items[parent], keys[parent]
+            position[items[i]] = i
+            i = parent
+        items[i], keys[i] = item, key
+        position[item] = i
+
+    def _sift_down(self, i):
+        items, keys, position, arity = self._items, self._keys, self._position, self.arity
+        item, key = items[i], keys[i]
+        size = len(items)
+        while True:
+            first = i * arity + 1
+            if first >= size:
+                break
+            child = min(range(first, min(first + arity, size)), key=keys.__getitem__)
+            if keys[child] >= key:
+                break
+            items[i], keys[i] = items[child], keys[child]
+            position[items[i]] = i
+            i = child
+        items[i], keys[i] = item, key
+        position[item] = i
+
+class BucketQueue(PriorityQueue):
+    """
+    Dial's bucket queue: one bucket (list) per integer priority and a cursor
+    that only moves forward.
+
+    push and pop are O(1) plus the empty buckets the cursor skips, which is
+    at most the largest edge weight per pop. Requires non-negative integer
+    priorities that never go below the last popped one - true for Dijkstra
+    and for A* with a consistent integer heuristic (e.g. Manhattan on a maze).
+    A lower priority is added as a new entry; the old one becomes stale.
+
+    Raises
+    ------
+    ValueError
+        On push, for a negative or non-integer priority, or one below the
+        last popped priority.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._buckets = {}
+        self._keys = {}
+        self._cursor = 0
+        self._size = 0
+
+    def __len__(self):
+        return len(self._keys)
+
+    def push(self, item, priority):
+        if priority < 0 or priority != int(priority):
+            raise ValueError("BucketQueue needs non-negative integer priorities.")
+        priority = int(priority)
+        if priority < self._cursor:
+            raise ValueError("BucketQueue priorities must not go below the last popped one.")
+        old = self._keys.get(item)
+        if old is not None and old <= priority:
+            return
+        self._keys[item] = priority
+        self._buckets.setdefault(priority, []).append(item)
+        self._size += 1
+        self.pushes += 1
+        self.max_size = max(self.max_size, self._size)
+
+    def pop(self):
+        if not self._keys:
+            raise IndexError("pop from an empty priority queue")
+        while True:
+            bucket = self._buckets.get(self._cursor)
+            if not bucket:
+                self._buckets.pop(self._cursor, None)
+                self._cursor += 1
+                continue
+            item = bucket.pop()
+            self._size -= 1
+            if self._keys.get(item) != self._cursor:
+                self.stale += 1
+                continue
+            del self._keys[item]
+            self.pops += 1
+            return self._cursor, item
+
+class StudentID:
+    """
+    Utility class for identifying the student.
+
+    Each student must replace the placeholder return value
+    in the `get_ID` method with their own unique student ID.
+    """
+
+    @staticmethod
+    def get_ID():
+        """
+        Return the student ID as a string.
+
+        Returns
+        -------
+        str
+            The student ID. Each student must replace "student_ID" with their own ID.
+
+        Examples
+        --------
+        >>> StudentID.get_ID()
+        '123456'
+        """
+        # TODO - BLOCK START
+        # TASK#1
+        return "student_ID"
+        # TODO - BLOCK END
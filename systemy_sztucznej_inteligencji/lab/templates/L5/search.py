@@ -1,4 +1,7 @@
 import heapq
+import time
+
+from priority_queues import PriorityQueue
 
 class Search:
     """
@@ -8,6 +11,17 @@ class Search:
     ----------------
     - Dijkstra (Uniform-Cost Search) for optimal paths on non-negative weights.
     - A* Search with a user-supplied heuristic `h(n)`; if `h=None`, behaves like Dijkstra.
+    - `dijkstra_compiled` / `astar_compiled`: the same searches on a
+      `CompiledGraph`, running on integer node indices and flat arrays.
+    - `bidirectional_dijkstra` / `bidirectional_astar`: point-to-point
+      searches growing from `start` and `goal` at the same time (the graph
+      must provide `reverse()`, as `Graph` and `CompiledGraph` do).
+    - `queue=` on `dijkstra` / `astar`: run the search on another priority
+      queue (indexed d-ary heap with decrease-key, bucket queue, ...; see
+      `PriorityQueue`) instead of the built-in heapq loop.
+    - `stats=` on `dijkstra` / `astar`: collect counters (pushes, pops,
+      stale entries, max frontier, heuristic calls) and per-phase timings
+      into a `SearchStats`; `record_visited=False` skips building 'visited'.
 
     Return format
     -------------
@@ -78,7 +92,7 @@ class Search:
         return path
 
     @staticmethod
-    def dijkstra(graph, start, goal):
+    def dijkstra(graph, start, goal, queue=None, stats=None, record_visited=True):
         """
         Dijkstra's algorithm (Uniform-Cost Search) for non-negative weights.
 
@@ -90,6 +104,13 @@ class Search:
             Start node.
         goal : hashable
             Goal node.
+        queue : str, PriorityQueue or None
+            Priority queue to use ('heapq', 'binary', 'dary', 'bucket' or an
+            instance, see `PriorityQueue`). None → the heapq loop below.
+        stats : SearchStats or None
+            Collect counters and timings of this run into `stats`.
+        record_visited : bool
+            If False, the expansion order is not kept and 'visited' is [].
 
         Returns
         -------
@@ -99,12 +120,20 @@ class Search:
               'cost': total_cost or float('inf'),
               'visited': expansion_order_list
             }
+            With `queue` given, also 'queue_stats': the queue's `stats()`.
+            With `record_visited=False`, 'visited' is an empty list.
 
         Raises
         ------
         ValueError
             If a negative edge weight is encountered.
         """
+        if queue is not None:
+            return Search._search_with_queue(graph, start, goal, None, queue, "Dijkstra",
+                                             stats, record_visited)
+        if stats is not None and not stats.timing:
+            return stats.timed(Search.dijkstra, graph, start, goal, record_visited=record_visited)
+
         # priority queue holds pairs (g_cost, node)
         priority_queue = [(0, start)]
         # best known g(n) cost to each node
@@ -113,22 +142,46 @@ class Search:
         predecessor = {}
         # expansion order (useful for tests/analysis)
         expanded_order = []
+        iter_neighbors = Search._iter_neighbors
+        if stats is not None:
+            iter_neighbors = stats.counting_neighbors(iter_neighbors)
+            on_expand = stats.on_expand
+            frontier = 0   # heap size right after the previous pop
+            stats.mark('search')
 
         while priority_queue:
             g_current, current = heapq.heappop(priority_queue)
 
+            if stats is not None:
+                # entries pushed since the previous pop: the heap grew from `frontier`
+                size = len(priority_queue) + 1
+                stats.pushes += size - frontier
+                if size > stats.max_frontier:
+                    stats.max_frontier = size
+                frontier = size - 1
+                if g_current != best_g.get(current, float('inf')):
+                    stats.stale += 1
+                else:
+                    stats.pops += 1
+                    stats.expanded += 1
+                    if on_expand is not None:
+                        on_expand(current, g_current)
+                    if current == goal:
+                        stats.mark('path')
+
             # Skip stale entries (a better cost has been found)
             if g_current != best_g.get(current, float('inf')):
                 continue
 
-            expanded_order.append(current)
+            if record_visited:
+                expanded_order.append(current)
 
             # TODO - BLOCK START
             # TASK#10
             pass
             # TODO - BLOCK END
 
-            for neighbor, edge_weight in Search._iter_neighbors(graph, current):
+            for neighbor, edge_weight in iter_neighbors(graph, current):
                 if edge_weight < 0:
                     raise ValueError("Dijkstra requires non-negative edge weights.")
                 # TODO - BLOCK START
@@ -139,7 +192,7 @@ class Search:
         return {'path': [], 'cost': float('inf'), 'visited': expanded_order}
 
     @staticmethod
-    def astar(graph, start, goal, h=None):
+    def astar(graph, start, goal, h=None, queue=None, stats=None, record_visited=True):
         """
         A* search with heuristic h(n). With h=None, behaves exactly like Dijkstra.
 
@@ -153,6 +206,12 @@ class Search:
             Goal node.
         h : callable or None
             Heuristic function `h(n) -> non-negative estimate`. If None, `h(n)=0`.
+        queue : str, PriorityQueue or None
+            Priority queue to use, as for `dijkstra`.
+        stats : SearchStats or None
+            Collect counters and timings (including heuristic calls) into `stats`.
+        record_visited : bool
+            If False, the expansion order is not kept and 'visited' is [].
 
         Returns
         -------
@@ -162,6 +221,8 @@ class Search:
               'cost': total_cost or float('inf'),
               'visited': expansion_order_list
             }
+            With `queue` given, also 'queue_stats': the queue's `stats()`.
+            With `record_visited=False`, 'visited' is an empty list.
 
         Raises
         ------
@@ -172,27 +233,59 @@ class Search:
             def h(_):  # default to 0 → A* reduces to Dijkstra
                 return 0
 
+        if queue is not None:
+            return Search._search_with_queue(graph, start, goal, h, queue, "A*",
+                                             stats, record_visited)
+        if stats is not None:
+            if not stats.timing:
+                return stats.timed(Search.astar, graph, start, goal, h, record_visited=record_visited)
+            h = stats.counting(h)
+
         # priority queue holds triples (f=g+h, g, node)
         priority_queue = [(h(start), 0, start)]
         best_g = {start: 0}
         predecessor = {}
         expanded_order = []
+        iter_neighbors = Search._iter_neighbors
+        if stats is not None:
+            iter_neighbors = stats.counting_neighbors(iter_neighbors)
+            on_expand = stats.on_expand
+            frontier = 0   # heap size right after the previous pop
+            stats.mark('search')
 
         while priority_queue:
             f_current, g_current, current = heapq.heappop(priority_queue)
 
+            if stats is not None:
+                # entries pushed since the previous pop: the heap grew from `frontier`
+                size = len(priority_queue) + 1
+                stats.pushes += size - frontier
+                if size > stats.max_frontier:
+                    stats.max_frontier = size
+                frontier = size - 1
+                if g_current != best_g.get(current, float('inf')):
+                    stats.stale += 1
+                else:
+                    stats.pops += 1
+                    stats.expanded += 1
+                    if on_expand is not None:
+                        on_expand(current, g_current)
+                    if current == goal:
+                        stats.mark('path')
+
             # Skip stale entries (a better g has been found)
             if g_current != best_g.get(current, float('inf')):
                 continue
 
-            expanded_order.append(current)
+            if record_visited:
+                expanded_order.append(current)
 
             # TODO - BLOCK START
             # TASK#12
             pass
             # TODO - BLOCK END
 
-            for neighbor, edge_weight in Search._iter_neighbors(graph, current):
+            for neighbor, edge_weight in iter_neighbors(graph, current):
                 if edge_weight < 0:
                     raise ValueError("A* requires non-negative edge weights.")
                 # TODO - BLOCK START
@@ -202,6 +295,260 @@ class Search:
 
         return {'path': [], 'cost': float('inf'), 'visited': expanded_order}
 
+    @staticmethod
+    def _search_with_queue(graph, start, goal, h, queue, algorithm, stats=None, record_visited=True):
+        """
+        Dijkstra (h=None) / A* on a pluggable `PriorityQueue`.
+
+        The queue keeps one live entry per node (lower priorities replace
+        higher ones), so there is no stale-entry check here. With `stats`,
+        the counters come from the queue's own `stats()`.
+        """
+        clock = time.perf_counter
+        started = clock()
+        queue = PriorityQueue.create(queue)
+        if stats is not None and h is not None:
+            h = stats.counting(h)
+        on_expand = None if stats is None else stats.on_expand
+        best_g = {start: 0}
+        predecessor = {}
+        expanded_order = []
+        expanded = relaxed = 0
+        queue.push(start, 0 if h is None else h(start))
+        searching = clock()
+
+        found = False
+        while queue:
+            _, current = queue.pop()
+            g_current = best_g[current]
+            expanded += 1
+            if record_visited:
+                expanded_order.append(current)
+            if on_expand is not None:
+                on_expand(current, g_current)
+            if current == goal:
+                found = True
+                break
+
+            for neighbor, edge_weight in Search._iter_neighbors(graph, current):
+                relaxed += 1
+                if edge_weight < 0:
+                    raise ValueError(f"{algorithm} requires non-negative edge weights.")
+                new_g = g_current + edge_weight
+                if new_g < best_g.get(neighbor, float('inf')):
+                    best_g[neighbor] = new_g
+                    predecessor[neighbor] = current
+                    queue.push(neighbor, new_g if h is None else new_g + h(neighbor))
+
+        finishing = clock()
+        if found:
+            result = {'path': Search._reconstruct_path(predecessor, start, goal),
+                      'cost': g_current, 'visited': expanded_order}
+        else:
+            result = {'path': [], 'cost': float('inf'), 'visited': expanded_order}
+        if stats is not None:
+            stats.expanded += expanded
+            stats.relaxed += relaxed
+            stats.add_queue(queue.stats())
+            stats.seconds['setup'] += searching - started
+            stats.seconds['search'] += finishing - searching
+            stats.seconds['path'] += clock() - finishing
+        result['queue_stats'] = queue.stats()
+        return result
+
+    @staticmethod
+    def dijkstra_compiled(compiled, start, goal):
+        """
+        Dijkstra on a `CompiledGraph` (integer fast path). See `astar_compiled`.
+        """
+        return Search.astar_compiled(compiled, start, goal)
+
+    @staticmethod
+    def astar_compiled(compiled, start, goal, h=None):
+        """
+        A* on a `CompiledGraph`, using integer node indices internally.
+
+        Parameters
+        ----------
+        compiled : CompiledGraph
+            Graph in CSR form (see `CompiledGraph.from_graph`).
+        start, goal : hashable
+            Node ids (as in the original `Graph`).
+        h : callable or None
+            Heuristic on node ids, as for `astar`. None → Dijkstra.
+
+        Returns
+        -------
+        dict
+            Same format as `astar` (node ids, not indices). Among several
+            optimal paths the one found may differ, the cost never does.
+
+        Raises
+        ------
+        ValueError
+            If the graph has a negative edge weight (checked once, up front,
+            instead of per edge).
+
+        Notes
+        -----
+        Distances and predecessors are plain lists indexed by node number
+        instead of dicts keyed by node ids, and the adjacency is read from
+        the CSR arrays in place (`CompiledGraph.adjacency_views`), so no
+        tuples are created per edge and the arrays are never copied.
+        """
+        if len(compiled.weights) and compiled.weights.min() < 0:
+            raise ValueError("A* requires non-negative edge weights.")
+        ids = compiled.ids
+        s = compiled.index.get(start)
+        t = compiled.index.get(goal)
+        if s is None:
+            if start == goal:
+                return {'path': [start], 'cost': 0, 'visited': [start]}
+            return {'path': [], 'cost': float('inf'), 'visited': [start]}
+        indptr, indices, weights = compiled.adjacency_views()
+        inf = float('inf')
+        best_g = [inf] * len(ids)
+        best_g[s] = 0
+        predecessor = [-1] * len(ids)
+        expanded_order = []
+        if h is None:
+            priority_queue = [(0, 0, s)]
+        else:
+            priority_queue = [(h(start), 0, s)]
+
+        while priority_queue:
+            _, g_current, current = heapq.heappop(priority_queue)
+            if g_current != best_g[current]:
+                continue
+            expanded_order.append(current)
+            if current == t:
+                path = [current]
+                while current != s:
+                    current = predecessor[current]
+                    path.append(current)
+                path.reverse()
+                return {'path': [ids[i] for i in path], 'cost': g_current,
+                        'visited': [ids[i] for i in expanded_order]}
+            for k in range(indptr[current], indptr[current + 1]):
+                neighbor = indices[k]
+                new_g = g_current + weights[k]
+                if new_g < best_g[neighbor]:
+                    best_g[neighbor] = new_g
+                    predecessor[neighbor] = current
+                    f = new_g if h is None else new_g + h(ids[neighbor])
+                    heapq.heappush(priority_queue, (f, new_g, neighbor))
+
+        return {'path': [], 'cost': float('inf'), 'visited': [ids[i] for i in expanded_order]}
+
+    @staticmethod
+    def bidirectional_dijkstra(graph, start, goal):
+        """
+        Bidirectional Dijkstra: searches forward from `start` and backward
+        (on `graph.reverse()`) from `goal`, stopping when the frontiers meet.
+
+        Same parameters and return format as `dijkstra`. See
+        `bidirectional_astar` for details.
+        """
+        return Search.bidirectional_astar(graph, start, goal)
+
+    @staticmethod
+    def bidirectional_astar(graph, start, goal, h=None, h_reverse=None):
+        """
+        Bidirectional A* with average potentials.
+
+        Parameters
+        ----------
+        graph : object
+            Provides `neighbors(u)` and `reverse()` (a graph with every edge
+            flipped, e.g. `Graph.reverse`).
+        start : hashable
+            Start node.
+        goal : hashable
+            Goal node.
+        h : callable or None
+            Estimate of the cost from n to `goal`, as for `astar`.
+        h_reverse : callable or None
+            Estimate of the cost from `start` to n (e.g. manhattan(start) on a
+            grid). None → 0.
+
+        Returns
+        -------
+        dict
+            Same format as `dijkstra`. 'visited' lists the expansions of both
+            searches in the order they happened, so a node may appear twice.
+
+        Raises
+        ------
+        ValueError
+            If a negative edge weight is encountered.
+
+        Notes
+        -----
+        - Each step expands the side whose queue has the smaller key.
+        - mu is the cost of the best start→goal path seen so far (updated
+          whenever an edge reaches a node labelled by the other side). The
+          search stops once  min key forward + min key backward >= mu.
+        - Both sides use the potential p(n) = (h(n) - h_reverse(n)) / 2
+          (forward key g + p, backward key g - p), which keeps the stopping
+          rule exact when h and h_reverse are consistent. With both None it
+          is plain bidirectional Dijkstra.
+        """
+        if start == goal:
+            return {'path': [start], 'cost': 0, 'visited': [start]}
+        if h is None and h_reverse is None:
+            def potential(_):
+                return 0
+        else:
+            forward_h = h or (lambda _: 0)
+            backward_h = h_reverse or (lambda _: 0)
+
+            def potential(n):
+                return (forward_h(n) - backward_h(n)) / 2
+
+        inf = float('inf')
+        graphs = (graph, graph.reverse())
+        signs = (1, -1)
+        best_g = ({start: 0}, {goal: 0})
+        predecessor = ({}, {})
+        priority_queues = ([(potential(start), 0, start)], [(-potential(goal), 0, goal)])
+        expanded = (set(), set())
+        expanded_order = []
+        best_cost = inf
+        meeting = None
+
+        while priority_queues[0] and priority_queues[1]:
+            if priority_queues[0][0][0] + priority_queues[1][0][0] >= best_cost:
+                break
+            side = 0 if priority_queues[0][0][0] <= priority_queues[1][0][0] else 1
+            _, g_current, current = heapq.heappop(priority_queues[side])
+            if g_current != best_g[side].get(current, inf) or current in expanded[side]:
+                continue
+            expanded[side].add(current)
+            expanded_order.append(current)
+            g_own, g_other = best_g[side], best_g[1 - side]
+
+            for neighbor, edge_weight in Search._iter_neighbors(graphs[side], current):
+                if edge_weight < 0:
+                    raise ValueError("Bidirectional search requires non-negative edge weights.")
+                new_g = g_current + edge_weight
+                if new_g < g_own.get(neighbor, inf):
+                    g_own[neighbor] = new_g
+                    predecessor[side][neighbor] = current
+                    heapq.heappush(priority_queues[side],
+                                   (new_g + signs[side] * potential(neighbor), new_g, neighbor))
+                if neighbor in g_other and new_g + g_other[neighbor] < best_cost:
+                    best_cost = new_g + g_other[neighbor]
+                    meeting = neighbor
+
+        if meeting is None:
+            return {'path': [], 'cost': inf, 'visited': expanded_order}
+        path = Search._reconstruct_path(predecessor[0], start, meeting)
+        current = meeting
+        while current != goal:
+            current = predecessor[1][current]
+            path.append(current)
+        return {'path': path, 'cost': best_cost, 'visited': expanded_order}
+
 class StudentID:
     """
     Utility class for identifying the student.
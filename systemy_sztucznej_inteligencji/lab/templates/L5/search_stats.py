@@ -0,0 +1,157 @@
+import time
+
+class SearchStats:
+    """
+    Counters and timings of `Search.dijkstra` / `Search.astar` runs.
+
+    Pass an instance as `stats=` and read it after the call:
+
+        >>> stats = SearchStats()
+        >>> Search.astar(graph, s, t, h, stats=stats, record_visited=False)
+        >>> stats.expanded, stats.max_frontier, stats.seconds['search']
+
+    The counters add up over all runs given the same object (call `reset()`
+    to start over), so one instance can also summarize a whole batch.
+
+    Counters
+    --------
+        expanded         nodes taken from the frontier and expanded
+        relaxed          edges scanned from expanded nodes
+        pushes           frontier insertions (including re-insertions)
+        decrease_keys    in-place priority decreases (indexed heaps only)
+        pops             live entries taken from the frontier
+        stale            outdated entries skipped
+        max_frontier     largest frontier size seen (stale entries included)
+        heuristic_calls  calls of `h` (A* only)
+
+    Timings
+    -------
+    `seconds` holds wall-clock time per phase: 'setup' (queue creation,
+    first push), 'search' (the main loop, until the goal is taken from the
+    frontier) and 'path' (path reconstruction and the result dict). The
+    clock is read once per phase, never per node.
+
+    Callback hook
+    -------------
+    `on_expand(node, g)`, if given, is called for every expanded node, e.g.
+    to draw the search as it runs or to stop it by raising an exception.
+    """
+
+    def __init__(self, on_expand=None):
+        """
+        Parameters
+        ----------
+        on_expand : callable or None
+            Called as `on_expand(node, g)` for each expanded node.
+        """
+        self.on_expand = on_expand
+        self._marks = None
+        self.reset()
+
+    def reset(self):
+        """Set every counter and timing back to zero."""
+        self.expanded = 0
+        self.relaxed = 0
+        self.pushes = 0
+        self.decrease_keys = 0
+        self.pops = 0
+        self.stale = 0
+        self.max_frontier = 0
+        self.heuristic_calls = 0
+        self.seconds = {'setup': 0.0, 'search': 0.0, 'path': 0.0}
+
+    def counting(self, h):
+        """`h` wrapped so that every call increments `heuristic_calls`."""
+        def counted(n):
+            self.heuristic_calls += 1
+            return h(n)
+
+        return counted
+
+    def counting_neighbors(self, iter_neighbors):
+        """`iter_neighbors(graph, node)` as a list, adding its length to `relaxed`."""
+        def counted(graph, node):
+            items = list(iter_neighbors(graph, node))
+            self.relaxed += len(items)
+            return items
+
+        return counted
+
+    @property
+    def timing(self):
+        """True while `timed` runs a search (the search then only marks its phases)."""
+        return self._marks is not None
+
+    def timed(self, search, *args, **kwargs):
+        """
+        Run `search(*args, stats=self, **kwargs)` and add its phase timings.
+
+        Used by the heapq loops of `Search`, which return from inside the
+        goal test: the loop calls `mark('search')` when it starts and
+        `mark('path')` when it takes the goal, the rest is timed here.
+        """
+        clock = time.perf_counter
+        self._marks = {'setup': clock()}
+        try:
+            result = search(*args, stats=self, **kwargs)
+        finally:
+            marks, self._marks = self._marks, None
+        end = clock()
+        searching = marks.get('search', end)
+        finishing = marks.get('path', end)
+        self.seconds['setup'] += searching - marks['setup']
+        self.seconds['search'] += finishing - searching
+        self.seconds['path'] += end - finishing
+        return result
+
+    def mark(self, phase):
+        """Record that `phase` ('search' or 'path') starts now (see `timed`)."""
+        self._marks[phase] = time.perf_counter()
+
+    def add_queue(self, queue_stats):
+        """Add the counters of a `PriorityQueue.stats()` dict."""
+        self.pushes += queue_stats['pushes']
+        self.decrease_keys += queue_stats['decrease_keys']
+        self.pops += queue_stats['pops']
+        self.stale += queue_stats['stale']
+        self.max_frontier = max(self.max_frontier, queue_stats['max_size'])
+
+    def as_dict(self):
+        """All counters and timings as a plain dict."""
+        return {'expanded': self.expanded, 'relaxed': self.relaxed, 'pushes': self.pushes,
+                'decrease_keys': self.decrease_keys, 'pops': self.pops, 'stale': self.stale,
+                'max_frontier': self.max_frontier, 'heuristic_calls': self.heuristic_calls,
+                'seconds': dict(self.seconds)}
+
+    def __repr__(self):
+        counters = self.as_dict()
+        del counters['seconds']
+        return f"SearchStats({', '.join(f'{k}={v}' for k, v in counters.items())})"
+
+class StudentID:
+    """
+    Utility class for identifying the student.
+
+    Each student must replace the placeholder return value
+    in the `get_ID` method with their own unique student ID.
+    """
+
+    @staticmethod
+    def get_ID():
+        """
+        Return the student ID as a string.
+
+        Returns
+        -------
+        str
+            The student ID. Each student must replace "student_ID" with their own ID.
+
+        Examples
+        --------
+        >>> StudentID.get_ID()
+        '123456'
+        """
+        # TODO - BLOCK START
+        # TASK#1
+        return "student_ID"
+        # TODO - BLOCK END
@@ -0,0 +1,32 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from graph import Graph
+from maze import Maze
+from search import Search
+from heuristics import Heuristics
+
+def _solved():
+    """True once the TODO tasks the searches build on (Graph, Maze.to_graph, Dijkstra, A*) are done."""
+    try:
+        graph = Graph()
+        graph.add_edge('a', 'b', 2)
+        graph.add_edge('b', 'c', 3)
+        graph.add_edge('a', 'c', 9)
+        maze = Maze([list('S.'), list('#G')])
+        return (Search.dijkstra(graph, 'a', 'c')['cost'] == 5
+                and Search.astar(maze.to_graph(), maze.start, maze.goal, Heuristics.manhattan(maze.goal))['cost'] == 2)
+    except Exception:
+        return False
+
+SOLVED = _solved()
+
+@pytest.fixture
+def solved():
+    """Skip the test while the student tasks of the lab are not implemented."""
+    if not SOLVED:
+        pytest.skip("the TODO tasks of L5 are not implemented yet")
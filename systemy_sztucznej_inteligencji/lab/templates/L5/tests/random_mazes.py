@@ -0,0 +1,68 @@
+"""
+Random graphs and mazes shared by the L5 tests.
+
+The tests run each search on small random graphs and mazes (walls, weighted
+cells, unreachable goals) and compare it with `Search.dijkstra`; the
+returned path must really cost what the search claims.
+"""
+import random
+
+from graph import Graph
+from maze import Maze
+from search import Search
+
+INF = float('inf')
+
+def random_graph(rnd, undirected=False):
+    """Random graph on 1..30 integer nodes with weights 1..9 (parallel edges and loops included)."""
+    n = rnd.randint(1, 30)
+    graph = Graph()
+    for node in range(n):
+        graph.add_node(node)
+    for _ in range(rnd.randint(0, 4 * n)):
+        u, v, cost = rnd.randrange(n), rnd.randrange(n), rnd.randint(1, 9)
+        graph.add_edge(u, v, cost)
+        if undirected:
+            graph.add_edge(v, u, cost)
+    return graph
+
+def random_maze(rnd, wall=0.3, costs=True):
+    """Random maze of up to 14x14 cells ('G' may overwrite 'S'); with `costs`, 'm' and 'w' cost 5 and 2."""
+    rows, cols = rnd.randint(1, 14), rnd.randint(1, 14)
+    chars = ['.', '.', '.', 'm', 'w'] if costs else ['.']
+    grid = [['#' if rnd.random() < wall else rnd.choice(chars) for _ in range(cols)] for _ in range(rows)]
+    grid[rnd.randrange(rows)][rnd.randrange(cols)] = 'S'
+    grid[rnd.randrange(rows)][rnd.randrange(cols)] = 'G'
+    return Maze(grid, cost_of={'m': 5, 'w': 2} if costs else None)
+
+def graphs(cases, seed):
+    """(graph, start, goal, maze or None) cases, alternating random graphs and mazes."""
+    rnd = random.Random(seed)
+    for case in range(cases):
+        if case % 2:
+            graph = random_graph(rnd, undirected=case % 4 == 1)
+            nodes = graph.nodes()
+            yield graph, rnd.choice(nodes), rnd.choice(nodes), None
+        else:
+            maze = random_maze(rnd, costs=case % 3 != 0)
+            yield maze.to_graph(), maze.start, maze.goal, maze
+
+def assert_valid_path(graph, result, start, goal):
+    """The path of `result` leads from `start` to `goal` and costs `result['cost']`."""
+    path = result['path']
+    if not path:
+        assert result['cost'] == INF
+        return
+    assert path[0] == start and path[-1] == goal
+    total = 0
+    for u, v in zip(path, path[1:]):
+        total += min(cost for node, cost in Search._iter_neighbors(graph, u) if node == v)
+    assert total == result['cost']
+
+def reference_cost(maze, graph, start, goal):
+    """Dijkstra's cost between two cells: 0 from a cell to itself, inf from or to a wall or outside cell."""
+    if start == goal:
+        return 0
+    if not (maze.is_passable(*start) and maze.is_passable(*goal)):
+        return INF
+    return Search.dijkstra(graph, start, goal)['cost']
@@ -0,0 +1,27 @@
+"""
+`ArrayMaze.to_csr` must hold exactly the cells and edges of `Maze.to_graph`.
+"""
+import random
+
+import pytest
+
+from array_maze import ArrayMaze
+
+from random_mazes import random_maze
+
+pytestmark = pytest.mark.usefixtures('solved')
+
+def test_array_maze_csr_matches_maze_graph():
+    rnd = random.Random(23)
+    for case in range(200):
+        maze = random_maze(rnd, wall=rnd.choice([0, 0.3, 1.0]), costs=case % 2 == 0)
+        graph = maze.to_graph()
+        compiled = ArrayMaze(maze.grid, cost_of=maze.cost_of).to_csr()
+        assert list(compiled.ids) == compiled.nodes() == sorted(graph.nodes())
+        assert all(compiled.index[node] == i for i, node in enumerate(compiled.ids))
+        for r in range(-1, maze.rows + 1):
+            for c in range(-1, maze.cols + 1):
+                assert ((r, c) in compiled.index) == maze.is_passable(r, c)
+        for node in graph.nodes():
+            assert compiled.neighbors(node) == graph.neighbors(node)
+        assert sorted(compiled.reverse().edges()) == sorted((v, u, w) for u, v, w in compiled.edges())
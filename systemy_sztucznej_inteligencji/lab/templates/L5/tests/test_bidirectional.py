@@ -0,0 +1,45 @@
+"""
+The bidirectional searches must find Dijkstra's costs (unreachable goals and
+start == goal included) on a `Graph` and on a `CompiledGraph`.
+"""
+import random
+
+import pytest
+
+from graph import Graph
+from search import Search
+from heuristics import Heuristics
+from compiled_graph import CompiledGraph
+
+from random_mazes import INF, graphs, assert_valid_path
+
+pytestmark = pytest.mark.usefixtures('solved')
+
+def test_bidirectional_searches_match_dijkstra():
+    rnd = random.Random(61)
+    unreachable = 0
+    for graph, start, goal, maze in graphs(300, seed=61):
+        nodes = graph.nodes()
+        pairs = [(start, goal), (start, start)] + [(rnd.choice(nodes), rnd.choice(nodes)) for _ in range(3)]
+        for a, b in pairs:
+            expected = Search.dijkstra(graph, a, b)['cost']
+            unreachable += expected == INF
+            for g in (graph, CompiledGraph.from_graph(graph)):
+                results = [Search.bidirectional_dijkstra(g, a, b)]
+                if maze:
+                    results.append(Search.bidirectional_astar(g, a, b, Heuristics.manhattan(b),
+                                                              Heuristics.manhattan(a)))
+                    results.append(Search.bidirectional_astar(g, a, b, Heuristics.manhattan(b)))
+                for result in results:
+                    assert result['cost'] == expected
+                    assert_valid_path(graph, result, a, b)
+                    if a == b:
+                        assert result['path'] == [a]
+    assert unreachable > 50
+
+def test_bidirectional_search_rejects_negative_weights():
+    graph = Graph()
+    graph.add_edge('a', 'b', 1)
+    graph.add_edge('b', 'c', -2)
+    with pytest.raises(ValueError):
+        Search.bidirectional_dijkstra(graph, 'a', 'c')
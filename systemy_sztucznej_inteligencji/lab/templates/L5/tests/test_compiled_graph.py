@@ -0,0 +1,53 @@
+"""
+`CompiledGraph.from_graph` must keep every node, edge and edge order of the
+`Graph`, and the integer searches on it must find Dijkstra's costs.
+"""
+import random
+
+import pytest
+
+from graph import Graph
+from search import Search
+from heuristics import Heuristics
+from compiled_graph import CompiledGraph
+
+from random_mazes import INF, graphs, assert_valid_path
+
+pytestmark = pytest.mark.usefixtures('solved')
+
+def test_from_graph_keeps_nodes_edges_and_their_order():
+    for graph, _, _, _ in graphs(100, seed=53):
+        compiled = CompiledGraph.from_graph(graph)
+        assert compiled.nodes() == graph.nodes() and len(compiled) == len(graph.nodes())
+        assert all(compiled.index[node] == i for i, node in enumerate(compiled.ids))
+        for node in graph.nodes():
+            assert compiled.neighbors(node) == graph.neighbors(node)
+        assert compiled.edges() == graph.edges() and compiled.num_edges == len(graph.edges())
+        assert sorted(compiled.reverse().edges()) == sorted((v, u, w) for u, v, w in graph.edges())
+        assert compiled.reverse().reverse() is compiled
+        assert compiled.neighbors('missing') == []
+
+def test_compiled_searches_match_dijkstra():
+    rnd = random.Random(59)
+    for graph, start, goal, maze in graphs(200, seed=59):
+        compiled = CompiledGraph.from_graph(graph)
+        nodes = graph.nodes()
+        for a, b in [(start, goal)] + [(rnd.choice(nodes), rnd.choice(nodes)) for _ in range(3)]:
+            expected = Search.dijkstra(graph, a, b)['cost']
+            h = Heuristics.manhattan(b) if maze else None
+            for result in (Search.dijkstra_compiled(compiled, a, b), Search.astar_compiled(compiled, a, b, h)):
+                assert result['cost'] == expected
+                assert_valid_path(graph, result, a, b)
+
+def test_compiled_searches_handle_unknown_nodes_and_negative_weights():
+    graph = Graph()
+    graph.add_edge('a', 'b', 2)
+    graph.add_node('c')
+    compiled = CompiledGraph.from_graph(graph)
+    assert Search.dijkstra_compiled(compiled, 'a', 'c')['cost'] == INF
+    assert Search.dijkstra_compiled(compiled, 'missing', 'a')['path'] == []
+    assert Search.dijkstra_compiled(compiled, 'missing', 'missing')['path'] == ['missing']
+    assert Search.astar_compiled(compiled, 'a', 'missing')['cost'] == INF
+    graph.add_edge('b', 'c', -1)
+    with pytest.raises(ValueError):
+        Search.dijkstra_compiled(CompiledGraph.from_graph(graph), 'a', 'c')
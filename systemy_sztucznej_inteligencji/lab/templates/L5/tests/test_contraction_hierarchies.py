@@ -0,0 +1,40 @@
+"""
+Contraction-hierarchy queries must find Dijkstra's costs and real paths,
+also after a save / load round trip.
+"""
+import random
+
+import pytest
+
+from search import Search
+from contraction_hierarchies import ContractionHierarchy
+
+from random_mazes import random_maze, graphs, assert_valid_path
+
+pytestmark = pytest.mark.usefixtures('solved')
+
+def test_contraction_hierarchy_matches_dijkstra():
+    rnd = random.Random(7)
+    for graph, start, goal, _ in graphs(150, seed=7):
+        hierarchy = ContractionHierarchy.build(graph, witness_limit=rnd.choice([1, 5, 60]))
+        nodes = graph.nodes()
+        for a, b in [(start, goal)] + [(rnd.choice(nodes), rnd.choice(nodes)) for _ in range(5)]:
+            result = hierarchy.query(a, b)
+            assert result['cost'] == Search.dijkstra(graph, a, b)['cost']
+            assert_valid_path(graph, result, a, b)
+
+
+def test_contraction_hierarchy_survives_save_and_load(tmp_path):
+    rnd = random.Random(11)
+    maze = random_maze(rnd, wall=0.2)
+    graph = maze.to_graph()
+    hierarchy = ContractionHierarchy.build(graph)
+    hierarchy.save(tmp_path / 'ch.npz')
+    loaded = ContractionHierarchy.load(tmp_path / 'ch.npz')
+    assert loaded.ids == hierarchy.ids
+    cells = graph.nodes()
+    for _ in range(30):
+        a, b = rnd.choice(cells), rnd.choice(cells)
+        result = loaded.query(a, b)
+        assert result['cost'] == Search.dijkstra(graph, a, b)['cost']
+        assert_valid_path(graph, result, a, b)
@@ -0,0 +1,68 @@
+"""
+`DistanceMatrix` must agree with one `Search.dijkstra` run per pair, for
+repeated sources, ids that are not in the graph and worker processes.
+"""
+import random
+
+import numpy as np
+import pytest
+
+from graph import Graph
+from search import Search
+from compiled_graph import CompiledGraph
+from distance_matrix import DistanceMatrix
+
+from random_mazes import INF, graphs
+
+pytestmark = pytest.mark.usefixtures('solved')
+
+def test_one_to_all_matches_dijkstra():
+    for graph, start, _, _ in graphs(100, seed=67):
+        if start is None:
+            continue
+        compiled = CompiledGraph.from_graph(graph)
+        dist, pred = DistanceMatrix.one_to_all(graph, start)
+        assert pred[compiled.index[start]] == -1
+        for i, node in enumerate(compiled.ids):
+            assert dist[i] == Search.dijkstra(graph, start, node)['cost']
+            if node != start and dist[i] < INF:
+                u = compiled.ids[pred[i]]
+                assert dist[pred[i]] + min(cost for v, cost in graph.neighbors(u) if v == node) == dist[i]
+            elif node != start:
+                assert pred[i] == -1
+    with pytest.raises(KeyError):
+        DistanceMatrix.one_to_all(graph, 'missing')
+
+@pytest.mark.parametrize('processes', [1, 2])
+def test_many_to_many_matches_dijkstra_per_pair(processes):
+    rnd = random.Random(71)
+    for graph, _, _, _ in graphs(80 if processes == 1 else 8, seed=71):
+        nodes = graph.nodes() + ['missing']
+        sources = [rnd.choice(nodes) for _ in range(rnd.randint(0, 6))]
+        sources += sources[:2]
+        targets = [rnd.choice(nodes) for _ in range(rnd.randint(0, 6))]
+        for g in (graph, CompiledGraph.from_graph(graph)):
+            matrix = DistanceMatrix.many_to_many(g, sources, targets, processes=processes)
+            assert matrix.shape == (len(sources), len(targets)) and matrix.dtype == np.float64
+            for i, s in enumerate(sources):
+                for j, t in enumerate(targets):
+                    expected = 0 if s == t else Search.dijkstra(graph, s, t)['cost'] if s != 'missing' else INF
+                    assert matrix[i, j] == expected
+
+def test_many_to_many_stops_once_the_targets_are_settled():
+    graph = Graph()
+    for i in range(50):
+        graph.add_edge(i, i + 1, 1)
+    compiled = CompiledGraph.from_graph(graph)
+    arrays = (compiled.indptr, compiled.indices, compiled.weights)
+    dist, _ = DistanceMatrix._dijkstra(arrays, compiled.index[0], {compiled.index[3]})
+    assert dist[compiled.index[3]] == 3 and dist[compiled.index[10]] == INF
+    assert DistanceMatrix.many_to_many(graph, [0, 0, 2], [3, 50]).tolist() == [[3, 50], [3, 50], [1, 48]]
+
+def test_many_to_many_rejects_negative_weights():
+    graph = Graph()
+    graph.add_edge('a', 'b', -1)
+    with pytest.raises(ValueError):
+        DistanceMatrix.many_to_many(graph, ['a'], ['b'])
+    with pytest.raises(ValueError):
+        DistanceMatrix.one_to_all(graph, 'a')
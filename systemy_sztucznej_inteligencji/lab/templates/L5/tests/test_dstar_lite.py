@@ -0,0 +1,42 @@
+"""
+D* Lite must return Dijkstra's cost after every move of the start and
+every change of cells or costs.
+"""
+import random
+
+import pytest
+
+from maze import Maze
+from array_maze import ArrayMaze
+from dstar_lite import DStarLite
+
+from random_mazes import random_maze, assert_valid_path, reference_cost
+
+pytestmark = pytest.mark.usefixtures('solved')
+
+@pytest.mark.parametrize('maze_class', [Maze, ArrayMaze])
+def test_dstar_lite_replans_like_dijkstra(maze_class):
+    rnd = random.Random(43)
+    for case in range(100):
+        maze = random_maze(rnd, wall=rnd.choice([0.1, 0.25, 0.35]), costs=case % 3 != 0)
+        if maze.start is None:
+            continue
+        maze = maze_class(maze.grid, cost_of=maze.cost_of)
+        planner = DStarLite(maze)
+        for _ in range(12):
+            result = planner.plan()
+            graph = maze.to_graph()
+            assert result['cost'] == reference_cost(maze, graph, planner.start, planner.goal)
+            if len(result['path']) > 1:
+                assert_valid_path(graph, result, planner.start, planner.goal)
+            action = rnd.random()
+            if action < 0.4 and len(result['path']) > 2:
+                planner.move_start(result['path'][rnd.randint(1, min(3, len(result['path']) - 1))])
+            elif action < 0.85:
+                r, c = rnd.randrange(maze.rows), rnd.randrange(maze.cols)
+                if (r, c) not in (planner.start, planner.goal):
+                    planner.update_cell(r, c, rnd.choice(['#', '.', 'm', 'w', 'z']))
+            else:
+                planner.update_costs({rnd.choice('.mwz'): rnd.choice([1, 2, 3, 7])})
+    with pytest.raises(ValueError):
+        planner.update_costs({'.': 0})
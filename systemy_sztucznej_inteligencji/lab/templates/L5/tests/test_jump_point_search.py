@@ -0,0 +1,57 @@
+"""
+Jump Point Search must find Dijkstra's costs on uniform mazes (and fall
+back to A* on weighted ones), with paths that step cell by cell.
+"""
+import random
+
+import pytest
+
+from maze import Maze
+from jump_point_search import JumpPointSearch
+
+from random_mazes import INF, random_maze, assert_valid_path, reference_cost
+
+pytestmark = pytest.mark.usefixtures('solved')
+
+def test_jump_point_search_matches_dijkstra():
+    rnd = random.Random(17)
+    for case in range(600):
+        maze = random_maze(rnd, wall=rnd.choice([0, 0.1, 0.3, 0.45]), costs=case % 5 == 0)
+        if case % 7 == 3:
+            maze.cost_of.update({'.': 3, 'S': 3, 'G': 3})
+        graph = maze.to_graph()
+        cells = [(r, c) for r in range(maze.rows) for c in range(maze.cols)]
+        for start, goal in [(maze.start, maze.goal), (rnd.choice(cells), rnd.choice(cells))]:
+            if start is None or goal is None:
+                continue
+            result = JumpPointSearch.search(maze, start, goal)
+            assert result['cost'] == reference_cost(maze, graph, start, goal)
+            if result['path']:
+                assert_valid_path(graph, result, start, goal)
+
+def test_jump_point_search_without_start_or_goal_finds_nothing():
+    for cost_of in (None, {'m': 5}):
+        maze = Maze([list('S.m'), list('...')], cost_of=cost_of)
+        assert JumpPointSearch.search(maze) == {'path': [], 'cost': INF, 'visited': []}
+        assert JumpPointSearch.search(maze, (1, 2)) == {'path': [], 'cost': INF, 'visited': []}
+        maze = Maze([list('..m'), list('..G')], cost_of=cost_of)
+        assert JumpPointSearch.search(maze) == {'path': [], 'cost': INF, 'visited': []}
+        assert JumpPointSearch.search(maze, None, (0, 0)) == {'path': [], 'cost': INF, 'visited': []}
+
+class CountingRow(list):
+    """A grid row that counts how often its cells are read."""
+    reads = 0
+
+    def __getitem__(self, c):
+        CountingRow.reads += 1
+        return list.__getitem__(self, c)
+
+@pytest.mark.parametrize('start, goal', [((0, 0), (0, 5)), ((0, 0), (3, 3)),
+                                         ((750, 750), (748, 753)), ((1499, 1499), (1490, 1499))])
+def test_jump_point_search_work_depends_on_the_goal_not_the_map(start, goal):
+    maze = Maze([CountingRow('.' * 1500) for _ in range(1500)])
+    CountingRow.reads = 0
+    result = JumpPointSearch.search(maze, start, goal)
+    assert result['cost'] == abs(start[0] - goal[0]) + abs(start[1] - goal[1])
+    assert result['path'][0] == start and result['path'][-1] == goal
+    assert CountingRow.reads < 2000
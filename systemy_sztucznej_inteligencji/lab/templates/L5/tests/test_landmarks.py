@@ -0,0 +1,44 @@
+"""
+The ALT heuristic must be admissible and consistent, keep A* optimal and
+survive a save / load round trip.
+"""
+import random
+
+import pytest
+
+from search import Search
+from compiled_graph import CompiledGraph
+from distance_matrix import DistanceMatrix
+from landmarks import Landmarks
+
+from random_mazes import INF, random_maze, graphs, assert_valid_path
+
+pytestmark = pytest.mark.usefixtures('solved')
+
+def test_landmark_heuristic_is_admissible_and_consistent():
+    for k, (graph, start, goal, _) in enumerate(graphs(100, seed=41)):
+        if start is None or goal is None:
+            continue
+        compiled = CompiledGraph.from_graph(graph)
+        to_goal = DistanceMatrix.one_to_all(compiled.reverse(), goal)[0] if goal in compiled.index else None
+        for strategy in Landmarks.STRATEGIES:
+            h = Landmarks.build(graph, count=random.Random(k).randint(0, 6), strategy=strategy, seed=k).heuristic(goal)
+            if to_goal is not None:
+                for i, node in enumerate(compiled.ids):
+                    assert h(node) <= to_goal[i]
+            for u, v, cost in graph.edges():
+                if h(u) != INF:
+                    assert h(u) <= cost + h(v)
+            result = Search.astar(graph, start, goal, h)
+            assert result['cost'] == Search.dijkstra(graph, start, goal)['cost']
+            assert_valid_path(graph, result, start, goal)
+
+
+def test_landmarks_survive_save_and_load(tmp_path):
+    graph = random_maze(random.Random(8), wall=0.3).to_graph()
+    landmarks = Landmarks.build(graph, 4)
+    landmarks.save(tmp_path / 'lm.npz')
+    loaded = Landmarks.load(tmp_path / 'lm.npz')
+    assert loaded.ids == landmarks.ids and isinstance(loaded.ids[0], tuple)
+    for goal in graph.nodes():
+        assert loaded.heuristic(goal)(graph.nodes()[0]) == landmarks.heuristic(goal)(graph.nodes()[0])
@@ -0,0 +1,88 @@
+"""
+`MazeGraphView` must be the graph of `Maze.to_graph` (also reversed and on
+an `ArrayMaze`), computed only for the cells a search asks for.
+"""
+import random
+
+import pytest
+
+from maze import Maze
+from search import Search
+from heuristics import Heuristics
+from array_maze import ArrayMaze
+from maze_view import MazeGraphView
+
+from random_mazes import random_maze, assert_valid_path
+
+pytestmark = pytest.mark.usefixtures('solved')
+
+class CountingRow(list):
+    """A grid row that counts how often its cells are read."""
+    reads = 0
+
+    def __getitem__(self, c):
+        CountingRow.reads += 1
+        return list.__getitem__(self, c)
+
+@pytest.mark.parametrize('maze_class', [Maze, ArrayMaze])
+def test_view_has_the_edges_of_to_graph(maze_class):
+    rnd = random.Random(73)
+    for case in range(100):
+        maze = random_maze(rnd, wall=rnd.choice([0, 0.3, 1.0]), costs=case % 2 == 0)
+        maze = maze_class(maze.grid, cost_of=maze.cost_of)
+        graph = maze.to_graph()
+        view = MazeGraphView(maze)
+        assert sorted(view.nodes()) == sorted(graph.nodes())
+        assert sorted(view.edges()) == sorted(graph.edges())
+        for node in graph.nodes():
+            assert view.neighbors(node) == graph.neighbors(node)
+        assert sorted(view.reverse().edges()) == sorted((v, u, w) for u, v, w in graph.edges())
+        assert view.reverse().reverse() is view
+        for node in ((-1, 0), (0, maze.cols), 'x', (1, 2, 3)):
+            assert view.neighbors(node) == []
+        for r, c in graph.nodes():
+            assert view._enter_cost(r, c) == maze.cost_of.get(maze.grid[r][c], 1)
+
+@pytest.mark.parametrize('cache_size', [None, 0, 3, 1000])
+def test_search_on_the_view_matches_search_on_to_graph(cache_size):
+    rnd = random.Random(79)
+    for case in range(100):
+        maze = random_maze(rnd, wall=0.25, costs=case % 3 != 0)
+        if case % 2:
+            maze = ArrayMaze(maze.grid, cost_of=maze.cost_of)
+        if maze.start is None or maze.goal is None:
+            continue
+        graph, view = maze.to_graph(), MazeGraphView(maze, cache_size=cache_size)
+        h = Heuristics.manhattan(maze.goal)
+        expected = Search.astar(graph, maze.start, maze.goal, h)
+        result = Search.astar(view, maze.start, maze.goal, h)
+        assert result['cost'] == expected['cost']
+        assert_valid_path(graph, result, maze.start, maze.goal)
+        bidirectional = Search.bidirectional_dijkstra(view, maze.start, maze.goal)
+        assert bidirectional['cost'] == expected['cost']
+        if cache_size is None:
+            assert view.hits == view.misses == 0
+        else:
+            assert view.misses > 0 or not result['visited']
+            assert len(view._cache) <= cache_size
+
+def test_cache_counts_hits_and_misses_and_evicts_the_oldest():
+    maze = Maze([list('S...'), list('....'), list('...G')])
+    view = MazeGraphView(maze, cache_size=2)
+    for node in [(0, 0), (0, 0), (0, 1), (0, 0), (1, 1), (0, 1), (0, 0)]:
+        assert view.neighbors(node) == maze.to_graph().neighbors(node)
+    # (1, 1) evicts (0, 1), which comes back and evicts (0, 0), which evicts (1, 1)
+    assert (view.hits, view.misses) == (2, 5)
+    assert list(view._cache) == [(0, 1), (0, 0)]
+    maze.grid[0][1] = '#'
+    assert (0, 1) in [v for v, _ in view.neighbors((0, 0))]
+    view.cache_clear()
+    assert (0, 1) not in [v for v, _ in view.neighbors((0, 0))]
+
+def test_view_reads_only_the_cells_the_search_explores():
+    maze = Maze([CountingRow('.' * 1000) for _ in range(1000)])
+    CountingRow.reads = 0
+    view = MazeGraphView(maze, cache_size=100)
+    result = Search.astar(view, (500, 500), (502, 497), Heuristics.manhattan((502, 497)))
+    assert result['cost'] == 5
+    assert CountingRow.reads < 500
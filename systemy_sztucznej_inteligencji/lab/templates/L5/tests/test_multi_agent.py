@@ -0,0 +1,33 @@
+"""
+A batch of agents must get the paths single Dijkstra searches would find,
+in the order of the requests, also with worker processes.
+"""
+import random
+
+import pytest
+
+from array_maze import ArrayMaze
+from multi_agent import MultiAgentPlanner
+
+from random_mazes import INF, random_maze, assert_valid_path, reference_cost
+
+pytestmark = pytest.mark.usefixtures('solved')
+
+@pytest.mark.parametrize('processes', [1, 2])
+def test_multi_agent_planner_matches_dijkstra(processes):
+    rnd = random.Random(47)
+    for case in range(60 if processes == 1 else 6):
+        maze = random_maze(rnd, wall=rnd.choice([0.1, 0.3]), costs=case % 3 != 0)
+        if case % 2:
+            maze = ArrayMaze(maze.grid, cost_of=maze.cost_of)
+        graph = maze.to_graph()
+        cells = [(r, c) for r in range(maze.rows) for c in range(maze.cols)] + [(-1, 0)]
+        goals = [rnd.choice(cells) for _ in range(3)]
+        pairs = [(rnd.choice(cells), rnd.choice(goals)) for _ in range(rnd.randint(0, 15))]
+        results = MultiAgentPlanner(maze, processes=processes).plan(pairs)
+        assert len(results) == len(pairs)
+        for (start, goal), result in zip(pairs, results):
+            expected = reference_cost(maze, graph, start, goal) if maze.is_passable(*start) else INF
+            assert result['cost'] == expected
+            if result['path']:
+                assert_valid_path(graph, result, start, goal)
@@ -0,0 +1,49 @@
+"""
+Every priority queue must pop in priority order, and `Search` must find
+the same costs on each of them as its built-in heapq loop.
+"""
+import random
+
+import pytest
+
+from search import Search
+from heuristics import Heuristics
+from priority_queues import LazyHeapQueue, IndexedHeapQueue, BucketQueue
+
+from random_mazes import graphs, assert_valid_path
+
+def test_priority_queues_pop_in_priority_order():
+    rnd = random.Random(29)
+    for _ in range(100):
+        for queue in (LazyHeapQueue(), IndexedHeapQueue(2), IndexedHeapQueue(4), BucketQueue()):
+            keys, last = {}, 0
+            for _ in range(rnd.randint(0, 200)):
+                if keys and rnd.random() < 0.4:
+                    priority, item = queue.pop()
+                    assert priority == min(keys.values()) == keys.pop(item) and priority >= last
+                    last = priority
+                else:
+                    item, priority = rnd.randrange(40), last + rnd.randint(0, 20)
+                    queue.push(item, priority)
+                    keys[item] = min(priority, keys.get(item, priority))
+                assert len(queue) == len(keys)
+            while keys:
+                priority, item = queue.pop()
+                assert keys.pop(item) == priority <= min(keys.values(), default=priority)
+            with pytest.raises(IndexError):
+                queue.pop()
+
+
+@pytest.mark.usefixtures('solved')
+def test_searches_with_every_queue_match_dijkstra():
+    for graph, start, goal, maze in graphs(150, seed=31):
+        expected = Search.dijkstra(graph, start, goal)['cost']
+        h = Heuristics.manhattan(goal) if maze else None
+        for name in ('heapq', 'binary', 'dary', 'bucket'):
+            for result in (Search.dijkstra(graph, start, goal, queue=name),
+                           Search.astar(graph, start, goal, h, queue=name)):
+                assert result['cost'] == expected
+                assert_valid_path(graph, result, start, goal)
+                assert result['queue_stats']['pops'] == len(result['visited'])
+    with pytest.raises(ValueError):
+        Search.dijkstra(graph, start, goal, queue='nope')
@@ -0,0 +1,90 @@
+"""
+`stats=` must not change what `Search.dijkstra` / `Search.astar` do, and its
+counters must describe the run: one pop per expanded (and visited) node,
+`on_expand` in expansion order, one heuristic call per queued entry.
+"""
+import pytest
+
+from search import Search
+from heuristics import Heuristics
+from search_stats import SearchStats
+
+from random_mazes import graphs
+
+pytestmark = pytest.mark.usefixtures('solved')
+
+def runs(graph, start, goal, maze):
+    """(name, queue, search(**kwargs)) for both searches, on the heapq loop and on every queue."""
+    h = Heuristics.manhattan(goal) if maze else (lambda _: 0)
+    for queue in (None, 'heapq', 'binary', 'dary', 'bucket'):
+        yield (f'dijkstra {queue}', queue,
+               lambda queue=queue, **kwargs: Search.dijkstra(graph, start, goal, queue=queue, **kwargs))
+        yield (f'astar {queue}', queue,
+               lambda queue=queue, **kwargs: Search.astar(graph, start, goal, h, queue=queue, **kwargs))
+
+def test_stats_count_the_run_without_changing_it():
+    for graph, start, goal, maze in graphs(150, seed=83):
+        for name, queue, search in runs(graph, start, goal, maze):
+            plain = search()
+            expanded = []
+            stats = SearchStats(on_expand=lambda node, g: expanded.append((node, g)))
+            result = search(stats=stats)
+            assert result == plain, name
+            visited = result['visited']
+            assert stats.pops == stats.expanded == len(visited)
+            assert [node for node, _ in expanded] == visited
+            assert expanded[-1][1] == result['cost'] or result['cost'] == float('inf')
+            assert stats.relaxed == sum(len(graph.neighbors(node)) for node in visited if node != goal)
+            assert stats.pushes >= stats.pops + stats.stale and stats.pushes >= stats.max_frontier >= 1
+            if queue is None and not result['path']:
+                assert stats.pushes == stats.pops + stats.stale
+            if name.startswith('dijkstra'):
+                assert stats.heuristic_calls == 0
+            elif queue is None:
+                assert stats.heuristic_calls >= stats.pushes
+            else:
+                assert stats.heuristic_calls == stats.pushes + stats.decrease_keys
+                assert stats.as_dict()['pushes'] == result['queue_stats']['pushes']
+
+def test_record_visited_false_keeps_the_counters():
+    for graph, start, goal, maze in graphs(60, seed=89):
+        for name, _, search in runs(graph, start, goal, maze):
+            recorded, unrecorded = SearchStats(), SearchStats()
+            full = search(stats=recorded)
+            result = search(stats=unrecorded, record_visited=False)
+            assert result['visited'] == [] and search(record_visited=False)['visited'] == []
+            assert result['path'] == full['path'] and result['cost'] == full['cost']
+            assert recorded.as_dict().keys() == unrecorded.as_dict().keys()
+            for key, value in recorded.as_dict().items():
+                if key != 'seconds':
+                    assert unrecorded.as_dict()[key] == value, (name, key)
+            assert unrecorded.expanded == len(full['visited'])
+
+def test_stats_add_up_over_runs_and_time_every_phase():
+    graph, start, goal, maze = next(graphs(1, seed=97))
+    stats, single = SearchStats(), SearchStats()
+    Search.dijkstra(graph, start, goal, stats=single)
+    for _ in range(3):
+        Search.dijkstra(graph, start, goal, stats=stats)
+    assert stats.expanded == 3 * single.expanded and stats.pushes == 3 * single.pushes
+    assert set(stats.seconds) == {'setup', 'search', 'path'}
+    assert all(seconds >= 0 for seconds in stats.seconds.values()) and sum(stats.seconds.values()) > 0
+    stats.reset()
+    assert stats.expanded == stats.pushes == 0 and sum(stats.seconds.values()) == 0
+
+def test_on_expand_can_stop_the_search():
+    graph, start, goal, maze = next(graphs(1, seed=97))
+
+    def stop(node, g):
+        raise StopIteration(node)
+
+    for _, queue, search in runs(graph, start, goal, maze):
+        stats = SearchStats(on_expand=stop)
+        with pytest.raises(StopIteration):
+            search(stats=stats)
+        assert not stats.timing
+        if queue is None:
+            assert stats.expanded == 1
+        stats.reset()
+        stats.on_expand = None
+        assert search(stats=stats) == search() and stats.pops == len(search()['visited'])